@@ -41,6 +41,10 @@ _FRONT_MATTER_PATTERN = re.compile(r"^---\s*\r?\n(.*?)\r?\n---\s*\r?\n?", re.DOT
 class MarkdownDocLoader(BaseLoader):
     """Load Markdown sources and capture optional front matter metadata."""
 
+    # The libyaml-backed loader parses the same safe subset several times faster
+    # than the pure-Python SafeLoader; fall back when PyYAML was built without it.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     def __init__(
         self,
         file_path: Optional[str] = None,
@@ -118,7 +122,7 @@ class MarkdownDocLoader(BaseLoader):
         front_matter_block = match.group(1)
         remainder = text[match.end() :]
         try:
-            parsed = yaml.safe_load(front_matter_block) or {}
+            parsed = yaml.load(front_matter_block, Loader=self._YAML_LOADER) or {}
         except yaml.YAMLError as exc:  # pragma: no cover - defensive log path
             LOGGER.warning("Failed to parse front matter: %s", exc)
             return {}, remainder
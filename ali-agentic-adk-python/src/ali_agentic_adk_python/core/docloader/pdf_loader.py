@@ -22,13 +22,14 @@ from __future__ import annotations
 
 from io import BufferedReader, BytesIO
 from pathlib import Path
-from typing import Any, BinaryIO, Optional
-
-from PyPDF2 import PdfReader
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
 
 from ali_agentic_adk_python.core.docloader.base import BaseLoader
 from ali_agentic_adk_python.core.indexes import Document
 
+if TYPE_CHECKING:  # pragma: no cover - type checking only imports
+    from PyPDF2 import PdfReader
+
 
 class PDFDocLoader(BaseLoader):
     """Load PDF files and split them into one document per page."""
@@ -68,12 +69,19 @@ class PDFDocLoader(BaseLoader):
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         with path.open("rb") as fh:
-            return self._extract_documents(PdfReader(fh), str(path))
+            return self._extract_documents(self._open_reader(fh), str(path))
 
     def _load_from_stream(
         self, stream: BinaryIO | BufferedReader | BytesIO
     ) -> list[Document]:
-        return self._extract_documents(PdfReader(stream), None)
+        return self._extract_documents(self._open_reader(stream), None)
+
+    @staticmethod
+    def _open_reader(stream: BinaryIO | BufferedReader | BytesIO) -> "PdfReader":
+        # PyPDF2 is slow to import, so only pay for it once a PDF is actually read.
+        from PyPDF2 import PdfReader
+
+        return PdfReader(stream)
 
     def _extract_documents(self, reader: PdfReader, source: Optional[str]) -> list[Document]:
         documents: list[Document] = []
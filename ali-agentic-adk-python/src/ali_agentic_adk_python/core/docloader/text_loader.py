@@ -20,6 +20,7 @@
 
 from __future__ import annotations
 
+import os
 from io import BufferedReader, BytesIO
 from pathlib import Path
 from typing import Any, BinaryIO, Optional, TextIO
@@ -31,8 +32,10 @@ from ali_agentic_adk_python.core.indexes import Document
 class TextDocLoader(BaseLoader):
     """Load plain-text resources from files or streams into ``Document`` objects."""
 
-    def __init__(self, file_path: Optional[str] = None, *, encoding: str = "utf-8") -> None:
-        self.file_path = file_path
+    def __init__(
+        self, file_path: Optional[str | os.PathLike[str]] = None, *, encoding: str = "utf-8"
+    ) -> None:
+        self.file_path = os.fspath(file_path) if file_path is not None else None
         self.encoding = encoding
 
     def load(self) -> list[Document]:
@@ -59,12 +62,24 @@ class TextDocLoader(BaseLoader):
                 doc.metadata.update(metadata_hint)
         return documents
 
-    def _load_from_path(self, file_path: str) -> list[Document]:
+    def _load_from_path(self, file_path: str | os.PathLike[str]) -> list[Document]:
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        text = path.read_text(encoding=self.encoding)
-        return self._build_documents(text, {"source": str(path)})
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        return self._build_documents(self._decode_file_bytes(raw), {"source": str(path)})
+
+    def _decode_file_bytes(self, raw: bytes) -> str:
+        # Decode the whole file at once rather than through a TextIOWrapper; a UTF-8
+        # BOM is dropped and line endings are normalized the way text mode would.
+        encoding = self.encoding
+        if encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+            encoding = "utf-8-sig"
+        text = raw.decode(encoding)
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
     def _load_from_stream(self, stream: TextIO | BinaryIO | BufferedReader | BytesIO) -> list[Document]:
         raw = stream.read()
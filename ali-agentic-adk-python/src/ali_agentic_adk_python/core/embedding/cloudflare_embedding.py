@@ -1,26 +1,454 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, Iterable, List, Sequence
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Literal, Mapping, Sequence, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import InvalidHeader
+    from urllib3.util.retry import RequestHistory, Retry
 except ImportError as import_error:
     requests = None
     _IMPORT_ERROR = import_error
 else:
     _IMPORT_ERROR = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+except ImportError:
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ..common.exceptions import EmbeddingProviderError
 from .basic_embedding import BasicEmbedding
 
 logger = logging.getLogger(__name__)
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_SCALAR_TYPES = (int, float, str)
+
+
+def _from_result_data(payload: Any) -> Sequence[Any] | None:
+    """``{"result": {"data": [...]}}`` or ``{"result": {"embedding": [[...]]}}``."""
+    if not isinstance(payload, dict):
+        return None
+    result = payload.get("result")
+    if not isinstance(result, dict):
+        return None
+    data = result.get("data") or result.get("embedding")
+    if isinstance(data, list) and data:
+        if isinstance(data[0], _SCALAR_TYPES):
+            return data
+        if isinstance(data[0], list):
+            return data[0]
+    return None
+
+
+def _from_result_list(payload: Any) -> Sequence[Any] | None:
+    """``{"result": [...]}``."""
+    if not isinstance(payload, dict):
+        return None
+    result = payload.get("result")
+    if isinstance(result, list) and result and isinstance(result[0], _SCALAR_TYPES):
+        return result
+    return None
+
+
+def _from_data(payload: Any) -> Sequence[Any] | None:
+    """``{"data": [...]}`` or ``{"data": [{"embedding": [...]}]}``."""
+    if not isinstance(payload, dict):
+        return None
+    data = payload.get("data")
+    if isinstance(data, list) and data:
+        if isinstance(data[0], _SCALAR_TYPES):
+            return data
+        if isinstance(data[0], dict):
+            first_item = data[0]
+            embedding = first_item.get("embedding") or first_item.get("vector")
+            if embedding:
+                return embedding
+    return None
+
+
+def _from_embedding_key(payload: Any) -> Sequence[Any] | None:
+    """``{"embedding": [...]}`` or ``{"vector": [...]}``."""
+    if not isinstance(payload, dict):
+        return None
+    embedding = payload.get("embedding") or payload.get("vector")
+    if isinstance(embedding, list):
+        return embedding
+    return None
+
+
+def _from_bare_list(payload: Any) -> Sequence[Any] | None:
+    """A top-level ``[...]`` vector."""
+    if isinstance(payload, list) and payload and isinstance(payload[0], _SCALAR_TYPES):
+        return payload
+    return None
+
+
+# Tried in order; the first extractor returning a vector wins.
+_SINGLE_VECTOR_EXTRACTORS: Tuple[Callable[[Any], Sequence[Any] | None], ...] = (
+    _from_result_data,
+    _from_result_list,
+    _from_data,
+    _from_embedding_key,
+    _from_bare_list,
+)
+
+
+def _match_extractor(
+    payload: Any,
+) -> Tuple[Sequence[Any] | None, Callable[[Any], Sequence[Any] | None] | None]:
+    for extractor in _SINGLE_VECTOR_EXTRACTORS:
+        vector = extractor(payload)
+        if vector is not None:
+            return vector, extractor
+    return None, None
+
+
+def _quantize_int8(vector: Sequence[float]) -> Tuple[float, array]:
+    """Symmetric per-vector int8 quantization, so that ``component ~= q * scale``."""
+    peak = max((abs(component) for component in vector), default=0.0)
+    scale = peak / 127.0 if peak else 1.0
+    return scale, array("b", [round(component / scale) for component in vector])
+
+
+def _dequantize_int8(scale: float, quantized: array) -> List[float]:
+    return [component * scale for component in quantized]
+
+
+class _EmbeddingCache:
+    """Thread-safe LRU of embedding vectors keyed by ``(model, text)``.
+
+    With ``quantize`` set, entries are kept as int8 plus a scale, trading a
+    small reconstruction error for roughly 30x less memory per vector. With
+    ``ttl`` set, entries older than ``ttl`` seconds are treated as misses.
+    """
+
+    def __init__(self, maxsize: int, quantize: bool = False, ttl: float | None = None) -> None:
+        self._maxsize = max(0, maxsize)
+        self._quantize = quantize
+        self._ttl = ttl
+        self._entries: OrderedDict[Tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Tuple[str, str]) -> List[float] | None:
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None and stored[0] is not None and stored[0] <= time.monotonic():
+                del self._entries[key]
+                stored = None
+            if stored is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        vector = stored[1]
+        if self._quantize:
+            return _dequantize_int8(*vector)
+        return list(vector)
+
+    def put(
+        self, key: Tuple[str, str], vector: Sequence[float], ttl: float | None = None
+    ) -> None:
+        """Store ``vector``; ``ttl`` overrides the default lifetime of this entry."""
+        if not self._maxsize:
+            return
+        entry = _quantize_int8(vector) if self._quantize else tuple(vector)
+        if ttl is None:
+            ttl = self._ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+class _PersistentEmbeddingCache:
+    """SQLite-backed vector store so embeddings survive process restarts.
+
+    Vectors are stored as packed float64 so reloaded values are bit-identical,
+    or as a float64 scale followed by int8 components when ``quantize`` is set;
+    once ``max_entries`` is exceeded the oldest writes are dropped. Each row keeps
+    its wall-clock write time so that, with ``ttl`` set, stale rows are ignored
+    across restarts as well.
+    """
+
+    _SELECT_CHUNK = 500
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        quantize: bool = False,
+        ttl: float | None = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._quantize = quantize
+        self._ttl = ttl
+        # Quantized rows live under their own keys so both formats can share a file.
+        self._key_prefix = b"q8\0" if quantize else b""
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL, written_at REAL)"
+            )
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(embeddings)")}
+            if "written_at" not in columns:
+                # Files from older versions have no timestamps; their rows count as
+                # expired whenever a ttl is configured.
+                self._connection.execute("ALTER TABLE embeddings ADD COLUMN written_at REAL")
+
+    def key(self, model: str, text: str) -> str:
+        material = (
+            self._key_prefix
+            + model.encode("utf-8")
+            + b"\0"
+            + text.encode("utf-8", "surrogatepass")
+        )
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[List[float], float | None]]:
+        """Map each stored, unexpired key to ``(vector, remaining_ttl)``.
+
+        ``remaining_ttl`` is ``None`` when no ttl is configured.
+        """
+        rows: List[Tuple[str, bytes, float | None]] = []
+        now = time.time()
+        query = "SELECT key, vector, written_at FROM embeddings WHERE key IN ({})"
+        params: Tuple[Any, ...] = ()
+        if self._ttl is not None:
+            query += " AND written_at > ?"
+            params = (now - self._ttl,)
+        with self._lock:
+            for start in range(0, len(keys), self._SELECT_CHUNK):
+                chunk = keys[start:start + self._SELECT_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    self._connection.execute(
+                        query.format(placeholders), (*chunk, *params)
+                    ).fetchall()
+                )
+
+        ttl = self._ttl
+        return {
+            key: (self._decode(blob), None if ttl is None else written_at + ttl - now)
+            for key, blob, written_at in rows
+        }
+
+    def put_many(self, entries: Dict[str, Sequence[float]]) -> None:
+        if not entries:
+            return
+        with self._lock, self._connection:
+            written_at = time.time()
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, written_at) VALUES (?, ?, ?)",
+                [(key, self._encode(vector), written_at) for key, vector in entries.items()],
+            )
+            # Replaced rows get a fresh rowid, so rowid order tracks write order, but
+            # the gaps they leave mean rowids are not a row count. The span check is
+            # an index lookup and skips the counting scan while no trim is possible.
+            (span,) = self._connection.execute(
+                "SELECT MAX(rowid) - MIN(rowid) FROM embeddings"
+            ).fetchone()
+            if span >= self._max_entries:
+                self._connection.execute(
+                    "DELETE FROM embeddings WHERE rowid IN "
+                    "(SELECT rowid FROM embeddings ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                    (self._max_entries,),
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _encode(self, vector: Sequence[float]) -> bytes:
+        if not self._quantize:
+            return array("d", vector).tobytes()
+        scale, quantized = _quantize_int8(vector)
+        return array("d", [scale]).tobytes() + quantized.tobytes()
+
+    def _decode(self, blob: bytes) -> List[float]:
+        if not self._quantize:
+            vector = array("d")
+            vector.frombytes(blob)
+            return vector.tolist()
+        header = array("d")
+        header.frombytes(blob[:header.itemsize])
+        quantized = array("b")
+        quantized.frombytes(blob[header.itemsize:])
+        return _dequantize_int8(header[0], quantized)
+
+
+class _QueryBatcher:
+    """Coalesces concurrent single-text queries into batched embedding calls.
+
+    A background thread drains the queue once ``max_batch_size`` queries are
+    waiting or ``max_wait_seconds`` has passed since the first one arrived.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        embed_many: Callable[[List[str]], List[List[float]]],
+        *,
+        max_batch_size: int,
+        max_wait_seconds: float,
+    ) -> None:
+        self._embed_many = embed_many
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait_seconds = max(0.0, max_wait_seconds)
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(self, text: str) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if not self._closed:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="cloudflare-embedding-batcher", daemon=True
+                    )
+                    self._thread.start()
+                self._queue.put((text, future))
+                return future
+
+        self._flush([(text, future)])
+        return future
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(self._STOP)
+            thread.join()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            item = get()
+            if item is self._STOP:
+                return
+
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self._max_wait_seconds
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._flush(batch)
+            if stopping:
+                return
+
+    def _flush(self, batch: List[Tuple[str, Future]]) -> None:
+        pending = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+
+        try:
+            vectors = self._embed_many([text for text, _ in pending])
+        except BaseException as exc:
+            for _, future in pending:
+                future.set_exception(exc)
+            return
+
+        for (_, future), vector in zip(pending, vectors):
+            future.set_result(vector)
+
+
+class _HedgeBudget:
+    """Caps hedged requests to roughly ``ratio`` of all requests sent.
+
+    Every request earns ``ratio`` credits and a hedge spends one; credits are
+    capped so a long quiet period cannot fund a burst of duplicates.
+    """
+
+    def __init__(self, ratio: float, max_credits: float = 10.0) -> None:
+        self._ratio = ratio
+        self._max_credits = max_credits
+        self._credits = 1.0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._credits = min(self._max_credits, self._credits + self._ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._credits < 1.0:
+                return False
+            self._credits -= 1.0
+            return True
+
 
 class CloudflareEmbedding(BasicEmbedding):
     """Embedding provider backed by Cloudflare Workers AI embeddings API."""
 
     _DEFAULT_ENDPOINT_TEMPLATE = "https://api.cloudflare.com/client/v4/accounts/{account_id}/ai/run/@cf/{model}"
+    _POOL_SIZE = 32
+    _RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+    _HEDGE_BUDGET_RATIO = 0.05
 
     def __init__(
         self,
@@ -32,11 +460,30 @@ class CloudflareEmbedding(BasicEmbedding):
         timeout: float | tuple[float, float] | None = None,
         headers: Dict[str, str] | None = None,
         request_options: Dict[str, Any] | None = None,
+        max_concurrency: int = 16,
+        cache_size: int = 1024,
+        coalesce_queries: bool = False,
+        max_batch_size: int = 96,
+        max_batch_wait_ms: float = 50.0,
+        hedge_delay: float | None = None,
+        skip_blank: bool = True,
+        embedding_dim: int | None = None,
+        persistent_cache_path: str | None = None,
+        quantize_cache: bool = False,
+        cache_ttl: float | None = None,
+        max_retries: int = 5,
+        backoff_factor: float = 0.25,
+        session: Any = None,
+        return_type: Literal["list", "array", "numpy"] = "list",
     ) -> None:
         if requests is None:
             raise ImportError(
                 "requests is required to use CloudflareEmbedding"
             ) from _IMPORT_ERROR
+        if return_type not in ("list", "array", "numpy"):
+            raise ValueError("return_type must be one of 'list', 'array' or 'numpy'")
+        if return_type == "numpy" and numpy is None:
+            raise ImportError("numpy is required for return_type='numpy'")
 
         super().__init__(model=model)
 
@@ -53,101 +500,623 @@ class CloudflareEmbedding(BasicEmbedding):
 
         self._timeout = timeout
         self._request_options = request_options.copy() if request_options else {}
+        self._supports_batch = True
+        self._batch_confirmed = False
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_batch_size = max(1, max_batch_size)
+        self._cache = _EmbeddingCache(cache_size, quantize=quantize_cache, ttl=cache_ttl)
+        self._persistent_cache = (
+            _PersistentEmbeddingCache(
+                persistent_cache_path, quantize=quantize_cache, ttl=cache_ttl
+            )
+            if persistent_cache_path
+            else None
+        )
+        self._skip_blank = skip_blank
+        self._embedding_dim = embedding_dim
+        self._return_type = return_type
+        self._cached_extractor: Callable[[Any], Sequence[Any] | None] | None = None
+        # One policy for both transports: mounted on the requests adapter and
+        # replayed by _send_async, since httpx has no status-based retries.
+        self._retry = self._build_retry(max_retries, backoff_factor)
+        # A caller-supplied session keeps its own adapters and is not closed here.
+        self._owns_session = session is None
+        self._session = session if session is not None else self._create_session(self._retry)
+        self._batcher: _QueryBatcher | None = None
+        if coalesce_queries:
+            self._batcher = _QueryBatcher(
+                self._fetch_and_cache,
+                max_batch_size=max_batch_size,
+                max_wait_seconds=max_batch_wait_ms / 1000.0,
+            )
+        self._hedge_delay = hedge_delay
+        self._hedge_budget = _HedgeBudget(self._HEDGE_BUDGET_RATIO)
+        # httpx clients hold connections bound to the loop that opened them: one per loop.
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+            weakref.WeakKeyDictionary()
+        )
 
         auth_header = {
             "Authorization": f"Bearer {api_token}" if api_token else "",
             "Content-Type": "application/json",
         }
-        self._headers: Dict[str, str] = auth_header
         if headers:
-            self._headers.update(headers)
+            auth_header.update(headers)
+        # Shared read-only by every request (and worker thread); built once here.
+        self._headers: Mapping[str, str] = MappingProxyType(auth_header)
+
+    def close(self) -> None:
+        """Stop the query batcher and release the pooled HTTP connections."""
+        batcher, self._batcher = self._batcher, None
+        if batcher is not None:
+            batcher.close()
+        if self._owns_session:
+            self._session.close()
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+        self._close_async_clients()
+
+    def __enter__(self) -> "CloudflareEmbedding":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss statistics of the in-memory embedding cache."""
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
 
     def embed_documents(self, texts: Sequence[str]) -> List[List[float]]:
-        normalized_inputs = self._normalize_inputs(texts)
-        if not normalized_inputs:
+        items = self._normalize_inputs(texts)
+        if not items:
             return []
 
-        embeddings: List[List[float]] = []
-        for text in normalized_inputs:
-            payload: Dict[str, Any] = {"text": text}
-            if self._request_options:
-                payload.update(self._request_options)
+        pending, blanks = self._split_blanks(items)
+        vectors, missing = self._lookup_cached(pending)
+        if missing:
+            unique = self._unique_texts(pending, missing)
+            fetched = self._fetch_embeddings(unique)
+            self._store_fetched(pending, vectors, missing, dict(zip(unique, fetched)))
+        return self._convert_vectors(self._merge_blanks(vectors, blanks))
+
+    def embed_query(self, text: str) -> List[float]:
+        batcher = self._batcher
+        if batcher is None or text is None or (self._skip_blank and not text.strip()):
+            return super().embed_query(text)
+
+        vectors, missing = self._lookup_cached([text])
+        if not missing:
+            return self._convert_vectors(vectors)[0]
+        return self._convert_vectors([batcher.submit(text).result()])[0]
 
+    def _fetch_and_cache(self, items: List[str]) -> List[List[float]]:
+        fetched = self._fetch_embeddings(items)
+        self._remember(dict(zip(items, fetched)))
+        return fetched
+
+    def _fetch_embeddings(self, items: List[str]) -> List[List[float]]:
+        if len(items) <= 1 or not self._supports_batch:
+            return self._embed_per_item(items)
+
+        # Requests carry at most ``max_batch_size`` texts. Until the endpoint has
+        # accepted one batch, the first is sent alone so a rejection costs a
+        # single request before falling back to per-item calls.
+        batches = self._split_batches(items)
+        vectors: List[List[float]] = []
+        if not self._batch_confirmed:
+            first = self._embed_batch(batches.pop(0))
+            if first is None:
+                return self._embed_per_item(items)
+            vectors.extend(first)
+
+        workers = min(self._max_concurrency, len(batches))
+        if workers <= 1:
+            for batch in batches:
+                vectors.extend(self._embed_batch_or_items(batch))
+            return vectors
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for batch_vectors in executor.map(self._embed_batch_or_items, batches):
+                vectors.extend(batch_vectors)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        return vectors
+
+    def _split_batches(self, items: List[str]) -> List[List[str]]:
+        batch_size = self._max_batch_size
+        return [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+
+    def _embed_batch_or_items(self, batch: List[str]) -> List[List[float]]:
+        vectors = self._embed_batch(batch)
+        return vectors if vectors is not None else self._embed_per_item(batch)
+
+    def _embed_per_item(self, items: List[str]) -> List[List[float]]:
+        workers = min(self._max_concurrency, len(items))
+        if workers <= 1:
+            return [self._embed_single(text) for text in items]
+
+        # Per-item requests are pure network I/O, so fan them out over threads;
+        # ``map`` keeps the results in input order.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._embed_single, items))
+
+    async def embed_documents_async(self, texts: Sequence[str]) -> List[List[float]]:
+        if httpx is None:
+            return await super().embed_documents_async(texts)
+
+        items = self._normalize_inputs(texts)
+        if not items:
+            return []
+
+        pending, blanks = self._split_blanks(items)
+        vectors, missing = self._lookup_cached(pending)
+        if missing:
+            unique = self._unique_texts(pending, missing)
+            fetched = await self._fetch_embeddings_async(unique)
+            self._store_fetched(pending, vectors, missing, dict(zip(unique, fetched)))
+        return self._convert_vectors(self._merge_blanks(vectors, blanks))
+
+    async def _fetch_embeddings_async(self, items: List[str]) -> List[List[float]]:
+        client = self._get_async_client()
+        if len(items) <= 1 or not self._supports_batch:
+            return await self._embed_per_item_async(client, items)
+
+        batches = self._split_batches(items)
+        vectors: List[List[float]] = []
+        if not self._batch_confirmed:
+            first = await self._embed_batch_async(client, batches.pop(0))
+            if first is None:
+                return await self._embed_per_item_async(client, items)
+            vectors.extend(first)
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                batch_vectors = await self._embed_batch_async(client, batch)
+            if batch_vectors is None:
+                return await self._embed_per_item_async(client, batch)
+            return batch_vectors
+
+        tasks = [asyncio.ensure_future(embed_batch(batch)) for batch in batches]
+        try:
+            for batch_vectors in await asyncio.gather(*tasks):
+                vectors.extend(batch_vectors)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return vectors
+
+    async def _embed_per_item_async(self, client: Any, items: List[str]) -> List[List[float]]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def embed_one(text: str) -> List[float]:
+            async with semaphore:
+                return await self._embed_single_async(client, text)
+
+        return list(await asyncio.gather(*(embed_one(text) for text in items)))
+
+    async def aclose(self) -> None:
+        """Close the cached async HTTP clients, awaiting the one bound to the running loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        self._close_async_clients()
+        if client is not None:
+            await client.aclose()
+
+    def _close_async_clients(self) -> None:
+        clients = list(self._async_clients.items())
+        self._async_clients.clear()
+        for loop, client in clients:
+            if loop.is_closed():
+                continue  # its transports were torn down with the loop
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                loop.run_until_complete(client.aclose())
+
+    def _split_blanks(self, items: List[str]) -> Tuple[List[str], List[int]]:
+        """Separate blank inputs, which are answered locally with a zero vector.
+
+        Blanks are only skipped once the vector size is known, either from
+        ``embedding_dim`` or from an earlier response (possibly the non-blank
+        inputs of this same call); otherwise they are sent as usual.
+        """
+        if not self._skip_blank:
+            return items, []
+
+        blanks = [index for index, text in enumerate(items) if not text.strip()]
+        if not blanks or (len(blanks) == len(items) and self._embedding_dim is None):
+            return items, []
+
+        blank_set = set(blanks)
+        pending = [text for index, text in enumerate(items) if index not in blank_set]
+        return pending, blanks
+
+    def _merge_blanks(self, vectors: List[List[float]], blanks: List[int]) -> List[List[float]]:
+        if self._embedding_dim is None and vectors:
+            self._embedding_dim = len(vectors[0])
+        if not blanks:
+            return vectors
+
+        dimension = self._embedding_dim or 0
+        merged: List[List[float]] = []
+        embedded = iter(vectors)
+        blank_set = set(blanks)
+        for index in range(len(vectors) + len(blanks)):
+            merged.append([0.0] * dimension if index in blank_set else next(embedded))
+        return merged
+
+    def _convert_vectors(self, vectors: List[List[float]]) -> List[Any]:
+        """Hand vectors out as float32 buffers when ``return_type`` asks for it.
+
+        Caches keep plain lists either way; only the returned copies change type.
+        """
+        if self._return_type == "array":
+            return [array("f", vector) for vector in vectors]
+        if self._return_type == "numpy":
+            return [numpy.asarray(vector, dtype=numpy.float32) for vector in vectors]
+        return vectors
+
+    def _lookup_cached(self, items: List[str]) -> Tuple[List[Any], List[int]]:
+        model = self._model
+        vectors: List[Any] = [self._cache.get((model, text)) for text in items]
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+        if missing and self._persistent_cache is not None:
+            missing = self._lookup_persistent(items, vectors, missing)
+        return vectors, missing
+
+    def _lookup_persistent(
+        self, items: List[str], vectors: List[Any], missing: List[int]
+    ) -> List[int]:
+        model = self._model
+        key = self._persistent_cache.key
+        keys = {index: key(model, items[index]) for index in missing}
+        found = self._persistent_cache.get_many(list(set(keys.values())))
+        still_missing: List[int] = []
+        for index in missing:
+            hit = found.get(keys[index])
+            if hit is None:
+                still_missing.append(index)
+                continue
+            vector, remaining_ttl = hit
+            vectors[index] = list(vector)
+            # Promoted rows keep their disk age instead of starting a fresh ttl.
+            self._cache.put((model, items[index]), vector, ttl=remaining_ttl)
+        return still_missing
+
+    def _remember(self, fetched: Dict[str, List[float]]) -> None:
+        model = self._model
+        for text, vector in fetched.items():
+            self._cache.put((model, text), vector)
+        if self._persistent_cache is not None:
+            key = self._persistent_cache.key
+            self._persistent_cache.put_many(
+                {key(model, text): vector for text, vector in fetched.items()}
+            )
+
+    @staticmethod
+    def _unique_texts(items: List[str], indexes: List[int]) -> List[str]:
+        """Texts at ``indexes`` with repeats removed, in first-seen order."""
+        return list(dict.fromkeys(items[index] for index in indexes))
+
+    def _store_fetched(
+        self,
+        items: List[str],
+        vectors: List[Any],
+        missing: List[int],
+        fetched: Dict[str, List[float]],
+    ) -> None:
+        first_index: Dict[str, int] = {}
+        for index in missing:
+            text = items[index]
+            if text in first_index:
+                # Repeated input: hand out its own copy so callers can mutate freely.
+                vectors[index] = list(vectors[first_index[text]])
+                continue
+            first_index[text] = index
+            vectors[index] = fetched[text]
+        self._remember(fetched)
+
+    def _embed_single(self, text: str) -> List[float]:
+        response = self._post(text)
+        return self._vector_from_content(self._read_response(response))
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]] | None:
+        """Embed ``texts`` in one request, or return ``None`` if batching is unsupported."""
+        response = self._post(texts)
+        if getattr(response, "status_code", None) == 400:
+            logger.info(
+                "Cloudflare endpoint rejected batched input; falling back to per-item requests"
+            )
+            self._supports_batch = False
+            return None
+
+        vectors = self._vectors_from_content(self._read_response(response), len(texts))
+        self._batch_confirmed = True
+        return vectors
+
+    async def _embed_single_async(self, client: Any, text: str) -> List[float]:
+        response = await self._post_async(client, text)
+        return self._vector_from_content(self._read_async_response(response))
+
+    async def _embed_batch_async(
+        self, client: Any, texts: List[str]
+    ) -> List[List[float]] | None:
+        response = await self._post_async(client, texts)
+        if response.status_code == 400:
+            logger.info(
+                "Cloudflare endpoint rejected batched input; falling back to per-item requests"
+            )
+            self._supports_batch = False
+            return None
+
+        vectors = self._vectors_from_content(self._read_async_response(response), len(texts))
+        self._batch_confirmed = True
+        return vectors
+
+    def _vector_from_content(self, content: Any) -> List[float]:
+        # Responses from one endpoint share a shape, so try the extractor that
+        # matched last time before walking the whole chain again.
+        extractor = self._cached_extractor
+        vector = extractor(content) if extractor is not None else None
+        if vector is None:
+            vector, self._cached_extractor = _match_extractor(content)
+        if vector is None:
+            raise EmbeddingProviderError(
+                "Cloudflare response did not contain embedding vector"
+            )
+
+        return self._coerce_vector(vector)
+
+    def _vectors_from_content(self, content: Any, expected: int) -> List[List[float]]:
+        vectors = self._extract_embeddings(content)
+        if vectors is None or len(vectors) != expected:
+            raise EmbeddingProviderError(
+                "Cloudflare response did not contain one embedding vector per input"
+            )
+
+        return [self._coerce_vector(vector) for vector in vectors]
+
+    def _build_payload(self, text: str | List[str]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"text": text}
+        if self._request_options:
+            payload.update(self._request_options)
+        return payload
+
+    @staticmethod
+    def _encode_body(payload: Dict[str, Any], raw_keyword: str) -> Dict[str, Any]:
+        """Serialize ``payload`` with orjson when available, else let the client do it."""
+        if orjson is not None:
             try:
-                response = requests.post(
-                    self._endpoint,
-                    headers=self._headers,
-                    json=payload,
-                    timeout=self._timeout,
+                return {raw_keyword: orjson.dumps(payload)}
+            except TypeError:
+                # orjson rejects a few types the stdlib encoder accepts.
+                pass
+        return {"json": payload}
+
+    def _post(self, text: str | List[str]) -> Any:
+        try:
+            return self._session.post(
+                self._endpoint,
+                headers=self._headers,
+                timeout=self._timeout,
+                **self._encode_body(self._build_payload(text), "data"),
+            )
+        except requests.exceptions.RequestException as exc:
+            message = "Failed to retrieve embeddings from Cloudflare provider"
+            logger.exception(message)
+            raise EmbeddingProviderError(message, original_exception=exc) from exc
+
+    def _read_response(self, response: Any) -> Any:
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException as exc:
+            message = "Failed to retrieve embeddings from Cloudflare provider"
+            logger.exception(message)
+            raise EmbeddingProviderError(message, original_exception=exc) from exc
+
+        try:
+            return self._parse_response(response)
+        except ValueError as exc:
+            message = "Failed to parse Cloudflare embedding response body"
+            logger.exception(message)
+            raise EmbeddingProviderError(message, original_exception=exc) from exc
+
+    async def _post_async(self, client: Any, text: str | List[str]) -> Any:
+        self._hedge_budget.record_request()
+        if self._hedge_delay is None:
+            return await self._send_async(client, text)
+
+        primary = asyncio.ensure_future(self._send_async(client, text))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay)
+            if not done and self._hedge_budget.try_spend():
+                logger.debug(
+                    "Cloudflare request exceeded %.3fs; sending hedged request",
+                    self._hedge_delay,
                 )
-                response.raise_for_status()
-            except requests.exceptions.RequestException as exc:
-                message = "Failed to retrieve embeddings from Cloudflare provider"
-                logger.exception(message)
-                raise EmbeddingProviderError(message, original_exception=exc) from exc
+                tasks.add(asyncio.ensure_future(self._send_async(client, text)))
+
+            failure: BaseException | None = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    failure = failure or task.exception()
+            raise failure
+        finally:
+            for task in tasks:
+                task.cancel()
 
+    async def _send_async(self, client: Any, text: str | List[str]) -> Any:
+        body = self._encode_body(self._build_payload(text), "content")
+        retry = self._retry
+        for attempt in range(retry.total + 1):
+            final = attempt == retry.total
             try:
-                content = response.json()
-            except ValueError as exc:
-                message = "Failed to parse Cloudflare embedding response body"
-                logger.exception(message)
-                raise EmbeddingProviderError(message, original_exception=exc) from exc
-
-            vector = self._extract_embedding(content)
-            if vector is None:
-                raise EmbeddingProviderError(
-                    "Cloudflare response did not contain embedding vector"
-                )
+                response = await client.post(self._endpoint, headers=self._headers, **body)
+            except httpx.TransportError as exc:
+                if final:
+                    raise self._async_failure(exc) from exc
+                delay = self._backoff_time(attempt)
+            except httpx.HTTPError as exc:
+                raise self._async_failure(exc) from exc
+            else:
+                if final or response.status_code not in retry.status_forcelist:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff_time(attempt)
+                await response.aclose()
+            await asyncio.sleep(delay)
 
-            embeddings.append(self._coerce_vector(vector))
+    @staticmethod
+    def _async_failure(exc: BaseException) -> EmbeddingProviderError:
+        message = "Failed to retrieve embeddings from Cloudflare provider"
+        logger.exception(message)
+        return EmbeddingProviderError(message, original_exception=exc)
+
+    def _backoff_time(self, attempt: int) -> float:
+        # Let urllib3 compute the delay so async retries back off (with jitter) like sync ones.
+        history = (RequestHistory("POST", self._endpoint, None, None, None),) * (attempt + 1)
+        return self._retry.new(history=history).get_backoff_time()
+
+    def _retry_after(self, response: Any) -> float | None:
+        value = response.headers.get("Retry-After")
+        if (
+            not value
+            or not self._retry.respect_retry_after_header
+            or response.status_code not in Retry.RETRY_AFTER_STATUS_CODES
+        ):
+            return None
+        try:
+            return self._retry.parse_retry_after(value)
+        except InvalidHeader:
+            return None
+
+    def _read_async_response(self, response: Any) -> Any:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            message = "Failed to retrieve embeddings from Cloudflare provider"
+            logger.exception(message)
+            raise EmbeddingProviderError(message, original_exception=exc) from exc
+
+        try:
+            return self._parse_response(response)
+        except ValueError as exc:
+            message = "Failed to parse Cloudflare embedding response body"
+            logger.exception(message)
+            raise EmbeddingProviderError(message, original_exception=exc) from exc
+
+    def _build_retry(self, max_retries: int, backoff_factor: float) -> Any:
+        retry_options: Dict[str, Any] = dict(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self._RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        try:
+            # Jitter keeps concurrent workers from retrying in lockstep after a 429.
+            retry = Retry(backoff_jitter=backoff_factor, **retry_options)
+        except TypeError:
+            # urllib3 < 2.0 has no backoff_jitter.
+            retry = Retry(**retry_options)
+        return retry
 
-        return embeddings
+    def _create_session(self, retry: Any) -> Any:
+        # A shared session keeps TLS connections warm across calls; the pool is
+        # sized so the per-item fallback threads never wait on a connection.
+        pool_size = max(self._POOL_SIZE, self._max_concurrency)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_async_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = self._create_async_client()
+        return client
+
+    def _create_async_client(self) -> Any:
+        # With ``h2`` installed, concurrent batches are multiplexed over a single
+        # connection instead of each opening its own TCP/TLS session.
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self._max_concurrency,
+                max_keepalive_connections=self._max_concurrency,
+            ),
+            timeout=self._httpx_timeout(self._timeout),
+        )
+
+    @staticmethod
+    def _httpx_timeout(timeout: float | tuple[float, float] | None) -> Any:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    @staticmethod
+    def _parse_response(response: Any) -> Any:
+        raw = getattr(response, "content", None)
+        if orjson is not None and isinstance(raw, (bytes, bytearray, memoryview)):
+            return orjson.loads(raw)
+        return response.json()
 
     @staticmethod
     def _extract_embedding(payload: Any) -> Sequence[Any] | None:
-        if payload is None:
-            return None
+        return _match_extractor(payload)[0]
 
+    @staticmethod
+    def _extract_embeddings(payload: Any) -> List[Sequence[Any]] | None:
+        """Return the list of vectors carried by a batched response."""
         if isinstance(payload, dict):
             result = payload.get("result")
-            if result is not None:
-                if isinstance(result, dict):
-                    data = result.get("data") or result.get("embedding")
-                    if data is not None:
-                        if isinstance(data, list):
-                            if data and isinstance(data[0], (int, float, str)):
-                                return data
-                            elif data and isinstance(data[0], list):
-                                return data[0]
-                elif isinstance(result, list):
-                    if result and isinstance(result[0], (int, float, str)):
-                        return result
-
-            data = payload.get("data")
-            if data is not None:
-                if isinstance(data, list):
-                    if data and isinstance(data[0], (int, float, str)):
-                        return data
-                    elif data and isinstance(data[0], dict):
-                        first_item = data[0]
-                        embedding = first_item.get("embedding") or first_item.get("vector")
-                        if embedding:
-                            return embedding
-
-            embedding = payload.get("embedding") or payload.get("vector")
-            if embedding is not None and isinstance(embedding, list):
-                return embedding
+            if isinstance(result, dict):
+                payload = result.get("data") or result.get("embedding")
+            elif isinstance(result, list):
+                payload = result
+            else:
+                payload = payload.get("data")
+
+        if not isinstance(payload, list) or not payload:
+            return None
+
+        if all(isinstance(item, list) for item in payload):
+            return payload
 
-        elif isinstance(payload, list):
-            if payload and isinstance(payload[0], (int, float, str)):
-                return payload
+        if all(isinstance(item, dict) for item in payload):
+            vectors = [item.get("embedding") or item.get("vector") for item in payload]
+            if all(isinstance(vector, list) for vector in vectors):
+                return vectors
 
         return None
 
     @staticmethod
     def _coerce_vector(vector: Sequence[Any]) -> List[float]:
         try:
-            return [float(component) for component in vector]
+            # ``map`` keeps the per-element conversion in C, which is noticeably
+            # faster than a comprehension for 768/1024/1536-dim vectors.
+            return list(map(float, vector))
         except (TypeError, ValueError) as exc:
             raise EmbeddingProviderError(
                 "Cloudflare embedding vector contained non-numeric values",
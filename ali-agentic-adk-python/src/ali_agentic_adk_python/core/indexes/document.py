@@ -24,7 +24,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, repr=False)
 class Document:
     """Represents a unit of knowledge to be embedded or retrieved."""
 
@@ -42,6 +42,13 @@ class Document:
         if self.metadata is None:
             self.metadata = {}
 
+    def __repr__(self) -> str:
+        # Keep debug output short; the generated repr would dump the full
+        # page content and embedding of every document.
+        length = len(self.page_content) if self.page_content is not None else 0
+        source = self.metadata.get("source") if self.metadata else None
+        return f"Document(len={length}, source={source!r})"
+
     def has_metadata(self) -> bool:
         """Return True if any metadata is attached to this document."""
         return bool(self.metadata)
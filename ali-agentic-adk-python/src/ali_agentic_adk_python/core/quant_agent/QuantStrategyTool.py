@@ -2,9 +2,13 @@ import os
 proxy = 'http://127.0.0.1:7890' # 代理设置，此处修改
 os.environ['HTTP_PROXY'] = proxy
 os.environ['HTTPS_PROXY'] = proxy
+import asyncio
+import functools
+import time
+from collections import OrderedDict
 import yfinance as yf
 #print(yf.Ticker("BABA").history(period="6mo"))
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 
 from google.adk.tools import BaseTool, ToolContext
 from google.genai import types
@@ -21,19 +25,39 @@ class QuantStrategyTool(BaseTool):
     每次调用返回 JSON 结构，便于 LLM 继续链式调用。
     """
 
-    def __init__(self, name: str = "quant_strategy_tool", description: str = "量化策略分析工具（策略评估/风控/建议）"):
+    def __init__(
+        self,
+        name: str = "quant_strategy_tool",
+        description: str = "量化策略分析工具（策略评估/风控/建议）",
+        watchlist: Optional[Sequence[str]] = None,
+        history_ttl: float = 300.0,
+        max_cached_frames: int = 256,
+    ):
         # 只在这里设置 name/description，不要再二次覆盖
         super().__init__(name=name, description=description)
         self.skip_summarization = False
+        # 自选股列表：单只股票缓存未命中时，顺带批量预取整个列表
+        self.watchlist: List[str] = list(watchlist or [])
+        # (symbol, period, interval) -> (过期时间, 历史K线 DataFrame)
+        # 行情会变化，缓存按拉取时间过期，并限制条目数，避免常驻进程一直使用首次拉取的数据
+        self.history_ttl = history_ttl
+        self.max_cached_frames = max_cached_frames
+        self._hist_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
 
     # === 关键修复点：返回一个 FunctionDeclaration，parameters 使用 Schema/Type ===
     def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
         """
         返回单一 FunctionDeclaration；通过 'action' 控制子功能。
+        Schema 语义上不可变，按 (name, description) 只构建一次并复用。
         """
+        return self._build_declaration(self.name, self.description)
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_declaration(cls, name: str, description: str) -> types.FunctionDeclaration:
         decl = types.FunctionDeclaration()
-        decl.name = self.name
-        decl.description = self.description
+        decl.name = name
+        decl.description = description
 
         # 定义 strategies[] 的元素 schema（供 generate_advice 使用）
         strategy_item_schema = Schema(
@@ -122,11 +146,82 @@ class QuantStrategyTool(BaseTool):
             # 兜底，避免中断 LLM 工具链
             return {"error": f"{action} 执行异常: {type(e).__name__}: {e}"}
 
+    # === 历史数据获取：批量下载 + 按股票缓存 ===
+    def _cache_get(self, key: Tuple[str, str, str]):
+        entry = self._hist_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, frame = entry
+        if expires_at <= time.monotonic():
+            del self._hist_cache[key]
+            return None
+        self._hist_cache.move_to_end(key)
+        return frame
+
+    def _cache_put(self, key: Tuple[str, str, str], frame: Any) -> None:
+        # 拉取失败或空结果不缓存，下次调用重新拉取
+        if frame is None or getattr(frame, "empty", False):
+            return
+        self._hist_cache[key] = (time.monotonic() + self.history_ttl, frame)
+        self._hist_cache.move_to_end(key)
+        while len(self._hist_cache) > self.max_cached_frames:
+            self._hist_cache.popitem(last=False)
+
+    async def _history_many(self, symbols: Sequence[str], period: str = "6mo", interval: str = "1d") -> Dict[str, Any]:
+        """
+        通过 yf.download(threads=True) 并发拉取多只股票的历史数据，
+        拆分为单只股票的 DataFrame 并写入缓存。
+        """
+        symbols = [s for s in dict.fromkeys(symbols) if s]
+        if not symbols:
+            return {}
+        data = await asyncio.to_thread(
+            yf.download,
+            " ".join(symbols),
+            period=period,
+            interval=interval,
+            threads=True,
+            progress=False,
+            group_by="ticker",
+            auto_adjust=True,  # 与 Ticker.history 默认口径保持一致
+        )
+        if data is None:
+            return {}
+        multi = data.columns.nlevels > 1
+        result: Dict[str, Any] = {}
+        for symbol in symbols:
+            if multi:
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                frame = data[symbol].dropna(how="all")
+            elif len(symbols) == 1:
+                frame = data
+            else:
+                continue
+            self._cache_put((symbol, period, interval), frame)
+            result[symbol] = frame
+        return result
+
+    async def _history(self, symbol: str, period: str = "6mo", interval: str = "1d"):
+        key = (symbol, period, interval)
+        hist = self._cache_get(key)
+        if hist is not None:
+            return hist
+        if self.watchlist:
+            # 顺带批量预取自选股列表，后续查询直接命中缓存
+            await self._history_many([symbol, *self.watchlist], period=period, interval=interval)
+            hist = self._cache_get(key)
+            if hist is not None:
+                return hist
+        hist = await asyncio.to_thread(yf.Ticker(symbol).history, period=period, interval=interval)
+        self._cache_put(key, hist)
+        return hist
+
     # ===== 下面四个子功能：沿用你原有实现（略作健壮性处理） =====
     async def evaluate_strategy_momentum(self, symbol: Optional[str], period: str = "6mo", interval: str = "1d") -> dict:
         if not symbol:
             return {"error": "缺少 symbol 参数。"}
-        hist = yf.Ticker(symbol).history(period=period, interval=interval)
+        hist = await self._history(symbol, period=period, interval=interval)
         if hist.empty:
             return {"error": f"无法获取 {symbol} 的历史数据。"}
 
@@ -166,7 +261,7 @@ class QuantStrategyTool(BaseTool):
         if long_window <= 0 or short_window <= 0 or short_window >= long_window:
             return {"error": "均线窗口不合法（需 0 < short_window < long_window）。"}
 
-        hist = yf.Ticker(symbol).history(period=period, interval=interval)
+        hist = await self._history(symbol, period=period, interval=interval)
         if hist.empty or len(hist) < long_window:
             return {"error": f"{symbol} 历史数据不足以计算均线（需要至少 {long_window} 根K）。"}
 
@@ -198,7 +293,7 @@ class QuantStrategyTool(BaseTool):
     async def check_risk_exposure(self, symbol: Optional[str], period: str = "1y", max_drawdown_threshold: float = 0.2) -> dict:
         if not symbol:
             return {"error": "缺少 symbol 参数。"}
-        hist = yf.Ticker(symbol).history(period=period)
+        hist = await self._history(symbol, period=period)
         if hist.empty:
             return {"error": f"无法获取 {symbol} 的风险检查数据。"}
 
@@ -1,4 +1,5 @@
 import os
+import uuid
 import logging
 import asyncio
 
@@ -47,7 +48,12 @@ quant_agent = LlmAgent(
 root_agent = quant_agent
 
 
-# === Session + Runner 初始化 ===
+# === Session + Runner 初始化（进程内单例，避免每次请求重复构建） ===
+_runner_lock = asyncio.Lock()
+_runner: Runner | None = None
+_session_service: InMemorySessionService | None = None
+
+
 async def setup_session_and_runner():
     session_service = InMemorySessionService()
     session = await session_service.create_session(
@@ -61,28 +67,59 @@ async def setup_session_and_runner():
     return session_service, runner
 
 
+async def _get_runner():
+    """懒加载并复用同一个 Runner / SessionService。"""
+    global _runner, _session_service
+    async with _runner_lock:
+        if _runner is None:
+            _session_service, _runner = await setup_session_and_runner()
+        return _session_service, _runner
+
+
 # === 主调用逻辑 ===
-async def call_quant_agent(user_input: str):
+async def call_quant_agent(user_input: str, user_id: str = USER_ID, session_id: str | None = None):
     """
     发送用户输入（prompt）给量化 Agent。
     Agent 将自动决定调用 QuantStrategyTool 的哪些函数。
+    多个用户可通过不同的 user_id / session_id 共享同一个 Runner。
+    未传 session_id 时每次调用使用一个新的临时会话，调用结束后删除，互不共享上下文；
+    需要多轮对话时显式传入同一个 session_id。
     """
-    session_service, runner = await setup_session_and_runner()
+    session_service, runner = await _get_runner()
+
+    ephemeral = session_id is None
+    if ephemeral:
+        session_id = uuid.uuid4().hex
 
     current_session = await session_service.get_session(
-        app_name=APP_NAME, user_id=USER_ID, session_id=SESSION_ID
+        app_name=APP_NAME, user_id=user_id, session_id=session_id
     )
+    if not current_session:
+        current_session = await session_service.create_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session_id
+        )
     if not current_session:
         logger.error("Session not found!")
         return
 
+    try:
+        await _run_agent(runner, user_input, user_id, session_id)
+    finally:
+        if ephemeral:
+            # 临时会话不再复用，及时删除，避免共享的 SessionService 无限增长
+            await session_service.delete_session(
+                app_name=APP_NAME, user_id=user_id, session_id=session_id
+            )
+
+
+async def _run_agent(runner: Runner, user_input: str, user_id: str, session_id: str):
     # 用户输入包装为消息内容
     content = types.Content(role="user", parts=[types.Part(text=user_input)])
 
     # 执行 Agent
     events = runner.run_async(
-        user_id=USER_ID,
-        session_id=SESSION_ID,
+        user_id=user_id,
+        session_id=session_id,
         new_message=content,
         run_config=RunConfig(streaming_mode=StreamingMode.SSE),
     )
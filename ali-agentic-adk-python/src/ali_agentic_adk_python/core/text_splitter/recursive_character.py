@@ -21,9 +21,14 @@
 from __future__ import annotations
 
 import re
-from typing import List, Sequence
+import sys
+from typing import List, Optional, Sequence, Tuple
 
-from ali_agentic_adk_python.core.text_splitter.text_splitter import TextSplitter
+from ali_agentic_adk_python.core.text_splitter.text_splitter import (
+    TextSplitter,
+    _compile_keep_separator,
+    _compile_separator,
+)
 
 
 class RecursiveCharacterTextSplitter(TextSplitter):
@@ -37,49 +42,121 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
-        self.separators: list[str] = list(separators or ("\n\n", "\n", " ", ""))
+        self.separators: list[str] = [
+            sys.intern(separator) for separator in (separators or ("\n\n", "\n", " ", ""))
+        ]
         if not self.separators:
             raise ValueError("At least one separator must be provided.")
         self.is_separator_regex = is_separator_regex
+        # Regex separators are compiled once per instance (probe and split forms),
+        # indexed like ``self.separators``; literal separators use ``str`` methods.
+        self._search_patterns: list[Optional[re.Pattern[str]]] = []
+        self._split_patterns: list[Optional[re.Pattern[str]]] = []
+        if is_separator_regex:
+            for separator in self.separators:
+                if not separator:
+                    self._search_patterns.append(None)
+                    self._split_patterns.append(None)
+                    continue
+                self._search_patterns.append(_compile_separator(separator))
+                self._split_patterns.append(
+                    _compile_keep_separator(separator)
+                    if self.keep_separator
+                    else _compile_separator(separator)
+                )
 
     def split_text(self, text: str) -> List[str]:
         if not text:
             return []
-        return self._split_text(text, list(self.separators))
+        if self.get_length(text) < self.max_chunk_size:
+            stripped = text.strip()
+            return [stripped] if stripped else []
+        return [chunk for _, chunk in self._split_text(text)]
 
-    def _split_text(self, text: str, separators: List[str]) -> List[str]:
-        final_chunks: list[str] = []
-        separator = separators[-1]
-        remaining: List[str] = []
+    def split_text_with_offsets(self, text: str) -> List[Tuple[int, str]]:
+        if not text:
+            return []
+        if self.get_length(text) < self.max_chunk_size:
+            # the whole text is a single chunk; merging would only strip it.
+            stripped = text.strip()
+            return [(len(text) - len(text.lstrip()), stripped)] if stripped else []
+        return self._locate_chunks(text, self._split_text(text))
+
+    def _split_text(
+        self, text: str, first: int = 0, offset: Optional[int] = 0
+    ) -> List[Tuple[Optional[int], str]]:
+        """Split ``text`` trying ``self.separators[first:]`` in order."""
+        separators = self.separators
+        final_chunks: list[Tuple[Optional[int], str]] = []
+        chosen = len(separators) - 1
+        has_remaining = False
 
-        for index, candidate in enumerate(separators):
-            pattern = candidate if self.is_separator_regex else re.escape(candidate)
+        for index in range(first, len(separators)):
+            candidate = separators[index]
             if candidate == "":
-                separator = candidate
+                chosen = index
                 break
-            if re.search(pattern, text):
-                separator = candidate
-                remaining = separators[index + 1 :]
+            if self.is_separator_regex:
+                found = self._search_patterns[index].search(text) is not None
+            else:
+                found = candidate in text
+            if found:
+                chosen = index
+                has_remaining = index + 1 < len(separators)
                 break
 
-        regex_separator = separator if self.is_separator_regex else re.escape(separator)
-        splits = self.split_text_with_regex(text, regex_separator, self.keep_separator)
+        separator = separators[chosen]
+        if not separator:
+            splits = [text]
+        elif self.is_separator_regex:
+            splits = self._split_with_pattern(text, self._split_patterns[chosen], self.keep_separator)
+        else:
+            splits = self.split_text_with_literal(text, separator, self.keep_separator)
+        starts = self._split_starts(splits, separator, offset)
+        lengths = self.batch_get_length(splits)
+        max_chunk_size = self.max_chunk_size
+        merge_splits = self._merge_splits
         good_splits: list[str] = []
+        good_starts: list[Optional[int]] = []
+        good_lengths: list[int] = []
         merge_separator = "" if self.keep_separator else separator
 
-        for chunk in splits:
-            if self.get_length(chunk) < self.max_chunk_size:
+        for chunk, start, chunk_len in zip(splits, starts, lengths):
+            if chunk_len < max_chunk_size:
                 good_splits.append(chunk)
+                good_starts.append(start)
+                good_lengths.append(chunk_len)
             else:
                 if good_splits:
-                    final_chunks.extend(self.merge_splits(good_splits, merge_separator))
+                    final_chunks.extend(
+                        merge_splits(good_splits, merge_separator, good_starts, good_lengths)
+                    )
                     good_splits.clear()
-                if not remaining:
-                    final_chunks.append(chunk)
+                    good_starts.clear()
+                    good_lengths.clear()
+                if not has_remaining:
+                    final_chunks.append((start, chunk))
                 else:
-                    final_chunks.extend(self._split_text(chunk, remaining))
+                    final_chunks.extend(self._split_text(chunk, chosen + 1, start))
 
         if good_splits:
-            final_chunks.extend(self.merge_splits(good_splits, merge_separator))
+            final_chunks.extend(
+                merge_splits(good_splits, merge_separator, good_starts, good_lengths)
+            )
 
         return final_chunks
+
+    def _split_starts(
+        self, splits: List[str], separator: str, offset: Optional[int]
+    ) -> List[Optional[int]]:
+        """Offsets of each split within the original text, when they can be derived."""
+        if offset is None or (self.is_separator_regex and not self.keep_separator):
+            # Regex matches have variable width once dropped, so offsets are unknown.
+            return [None] * len(splits)
+        step = 0 if self.keep_separator else len(separator)
+        starts: list[Optional[int]] = []
+        position = offset
+        for piece in splits:
+            starts.append(position)
+            position += len(piece) + step
+        return starts
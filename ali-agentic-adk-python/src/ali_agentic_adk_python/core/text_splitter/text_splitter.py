@@ -20,9 +20,13 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import logging
-from typing import Any, Callable, Dict, Iterable, List, Optional
+import os
+import pickle
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 import re
 
 from ali_agentic_adk_python.core.indexes import Document
@@ -30,8 +34,52 @@ from ali_agentic_adk_python.core.indexes import Document
 logger = logging.getLogger(__name__)
 
 
-class TextSplitter(ABC):
-    """Abstract helper to break long documents into manageable chunks."""
+@lru_cache(maxsize=512)
+def _compile_separator(separator: str, is_separator_regex: bool = True) -> re.Pattern[str]:
+    """Compile ``separator`` once per process, escaping it when it is a literal."""
+    return re.compile(separator if is_separator_regex else re.escape(separator))
+
+
+@lru_cache(maxsize=512)
+def _compile_keep_separator(separator: str) -> re.Pattern[str]:
+    """Compile the capturing form of a regex separator used to keep delimiters."""
+    return re.compile(f"({separator})")
+
+
+# below this many documents, process start-up costs more than splitting in-process.
+_PARALLEL_MIN_DOCUMENTS = 8
+
+
+class _NonEmptyLength:
+    """Wrap a length callable so empty strings always measure 0.
+
+    A plain class rather than a closure keeps splitters picklable for the
+    process-pool path.
+    """
+
+    __slots__ = ("measure",)
+
+    def __init__(self, measure: Callable[[str], int]) -> None:
+        self.measure = measure
+
+    def __call__(self, value: str) -> int:
+        return self.measure(value) if value else 0
+
+
+_worker_splitter: Optional["TextSplitter"] = None
+
+
+def _init_split_worker(splitter: "TextSplitter") -> None:
+    global _worker_splitter
+    _worker_splitter = splitter
+
+
+def _split_in_worker(text: str) -> list:
+    return _worker_splitter._split_one(text)
+
+
+class TextSplitter:
+    """Base helper to break long documents into manageable chunks."""
 
     def __init__(
         self,
@@ -49,22 +97,88 @@ class TextSplitter(ABC):
         self.keep_separator = keep_separator
         self.length_function = length_function
         self.tokenizer = tokenizer
+        if type(self).get_length is TextSplitter.get_length:
+            # resolve the measuring callable once instead of branching on every call.
+            self.get_length = self._resolve_length_function()
+
+    def split_documents(
+        self,
+        documents: Iterable[Document],
+        *,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> list[Document]:
+        """Split documents into chunk documents.
+
+        With ``parallel=True`` texts are split in a process pool when there are enough
+        documents and the splitter can be pickled; otherwise they are split in-process.
+        """
+        documents = list(documents)
+        texts = [document.page_content or "" for document in documents]
+        results = self._split_texts_in_processes(texts, max_workers) if parallel else None
+        if results is None:
+            results = map(self._split_one, texts)
 
-    def split_documents(self, documents: Iterable[Document]) -> list[Document]:
         chunks: list[Document] = []
-        for document in documents:
+        for document, pieces in zip(documents, results):
             metadata = document.metadata or {}
-            text = document.page_content or ""
-            cursor = -1
-            for chunk in self.split_text(text):
-                new_doc = Document(page_content=chunk, metadata=dict(metadata))
-                if self.add_start_index:
-                    cursor = text.find(chunk, cursor + 1)
-                    new_doc.metadata["start_index"] = cursor
-                    new_doc.metadata["char_length"] = len(chunk)
-                chunks.append(new_doc)
+            if self.add_start_index:
+                for start, chunk in pieces:
+                    chunks.append(
+                        Document(
+                            page_content=chunk,
+                            metadata={**metadata, "start_index": start, "char_length": len(chunk)},
+                        )
+                    )
+            else:
+                # each chunk gets its own dict: callers routinely mutate chunk metadata.
+                chunks.extend(Document(page_content=chunk, metadata=dict(metadata)) for chunk in pieces)
         return chunks
 
+    def _split_one(self, text: str) -> list:
+        """Split ``text`` the way ``split_documents`` consumes it (with offsets when tracked)."""
+        if self.add_start_index:
+            return self.split_text_with_offsets(text)
+        return self.split_text(text)
+
+    def _split_texts_in_processes(
+        self, texts: List[str], max_workers: Optional[int]
+    ) -> Optional[List[list]]:
+        """Split ``texts`` in a process pool, or return ``None`` when it is not worthwhile."""
+        if len(texts) < _PARALLEL_MIN_DOCUMENTS:
+            return None
+        try:
+            pickle.dumps(self)
+        except Exception:
+            logger.debug("Splitter is not picklable; splitting documents sequentially.")
+            return None
+
+        workers = min(max_workers or os.cpu_count() or 1, len(texts))
+        if workers < 2:
+            return None
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_split_worker, initargs=(self,)
+        ) as executor:
+            return list(executor.map(_split_in_worker, texts, chunksize=chunksize))
+
+    def split_text_with_offsets(self, text: str) -> List[Tuple[int, str]]:
+        """Split text and pair each chunk with its start offset in ``text`` (``-1`` if not found)."""
+        return self._locate_chunks(text, [(None, chunk) for chunk in self.split_text(text)])
+
+    @staticmethod
+    def _locate_chunks(
+        text: str, hinted_chunks: Iterable[Tuple[Optional[int], str]]
+    ) -> List[Tuple[int, str]]:
+        """Resolve chunk offsets, searching forward from a known hint when one is available."""
+        located: list[Tuple[int, str]] = []
+        find = text.find
+        cursor = -1
+        for hint, chunk in hinted_chunks:
+            cursor = find(chunk, cursor + 1 if hint is None else hint)
+            located.append((cursor, chunk))
+        return located
+
     def create_documents(
         self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None
     ) -> list[Document]:
@@ -74,8 +188,9 @@ class TextSplitter(ABC):
         documents: list[Document] = []
         for index, text in enumerate(texts):
             metadata = metadatas[index] if metadatas else {}
-            for chunk in self.split_text(text):
-                documents.append(Document(page_content=chunk, metadata=dict(metadata)))
+            documents.extend(
+                Document(page_content=chunk, metadata=dict(metadata)) for chunk in self.split_text(text)
+            )
         return documents
 
     def create_document(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> list[Document]:
@@ -84,78 +199,146 @@ class TextSplitter(ABC):
     def get_length(self, value: str) -> int:
         if not value:
             return 0
+        return self._resolve_length_function()(value)
+
+    def batch_get_length(self, values: Sequence[str]) -> List[int]:
+        """Measure many values at once, using ``tokenizer.batch_get_token_count`` when available."""
+        if not self.length_function and self.tokenizer is not None:
+            batch_count = getattr(self.tokenizer, "batch_get_token_count", None)
+            if batch_count is not None:
+                values = list(values)
+                counts = batch_count(values)
+                return [count if value else 0 for value, count in zip(values, counts)]
+        get_length = self.get_length
+        return [get_length(value) for value in values]
+
+    def _resolve_length_function(self) -> Callable[[str], int]:
         if self.length_function:
-            return self.length_function(value)
+            return _NonEmptyLength(self.length_function)
         if self.tokenizer:
-            return self.tokenizer.get_token_count(value)
-        return len(value)
+            return _NonEmptyLength(self.tokenizer.get_token_count)
+        return len
 
     def get_keep_separator_regex(self, separator: str) -> str:
         return rf"(?={separator})"
 
     def merge_splits(self, splits: List[str], separator: str) -> List[str]:
+        return [chunk for _, chunk in self._merge_splits(splits, separator)]
+
+    def _merge_splits(
+        self,
+        splits: Sequence[str],
+        separator: str,
+        starts: Optional[Sequence[Optional[int]]] = None,
+        lengths: Optional[Sequence[int]] = None,
+    ) -> List[Tuple[Optional[int], str]]:
+        """Merge splits into chunks, tagging each with the start offset of its first split.
+
+        ``lengths`` may carry precomputed ``get_length`` values for ``splits``.
+        """
+        max_chunk_size = self.max_chunk_size
+        max_chunk_overlap = self.max_chunk_overlap
+        join_docs = self.join_docs
         separator_len = self.get_length(separator)
-        documents: list[str] = []
-        current: list[str] = []
+        if lengths is None:
+            lengths = self.batch_get_length(splits)
+        documents: list[Tuple[Optional[int], str]] = []
+        append_document = documents.append
+        current: deque[str] = deque()
+        current_lens: deque[int] = deque()
+        current_starts: deque[Optional[int]] = deque()
         total = 0
-        for piece in splits:
-            piece_len = self.get_length(piece)
+        for index, piece in enumerate(splits):
+            piece_len = lengths[index]
             projected = total + piece_len + (separator_len if separator_len and current else 0)
-            if projected > self.max_chunk_size:
-                if total > self.max_chunk_size:
+            if projected > max_chunk_size:
+                if total > max_chunk_size:
                     logger.warning(
                         "Created a chunk of size %s, exceeding configured max_chunk_size=%s",
                         total,
-                        self.max_chunk_size,
+                        max_chunk_size,
                     )
                 if current:
-                    joined = self.join_docs(current, separator)
+                    joined = join_docs(current, separator)
                     if joined is not None:
-                        documents.append(joined)
+                        append_document((current_starts[0], joined))
                     while (
-                        total > self.max_chunk_overlap
+                        total > max_chunk_overlap
                         or (
                             total + piece_len + (separator_len if separator_len and current else 0)
-                            > self.max_chunk_size
+                            > max_chunk_size
                             and total > 0
                         )
                     ):
-                        removed = current.pop(0)
-                        total -= self.get_length(removed)
+                        current.popleft()
+                        current_starts.popleft()
+                        total -= current_lens.popleft()
                         if separator_len and current:
                             total -= separator_len
             current.append(piece)
+            current_lens.append(piece_len)
+            current_starts.append(starts[index] if starts is not None else None)
             total += piece_len + (separator_len if separator_len and len(current) > 1 else 0)
 
-        joined = self.join_docs(current, separator)
+        joined = join_docs(current, separator)
         if joined is not None:
-            documents.append(joined)
+            append_document((current_starts[0], joined))
         return documents
 
-    def join_docs(self, docs: List[str], separator: str) -> Optional[str]:
+    def join_docs(self, docs: Iterable[str], separator: str) -> Optional[str]:
         text = separator.join(docs).strip()
         return text or None
 
-    @abstractmethod
     def split_text(self, text: str) -> List[str]:
         """Split text into chunks respecting ``max_chunk_size``."""
+        raise NotImplementedError
 
     def split_text_with_regex(self, text: str, separator: str, keep_separator: bool) -> List[str]:
         if not separator:
             return [text]
         if keep_separator:
-            pattern = re.compile(f"({separator})")
-            tokens = pattern.split(text)
-            combined: list[str] = []
-            buffer = ""
-            for token in tokens:
-                if not token:
-                    continue
-                buffer += token
-                if re.fullmatch(separator, token):
-                    combined.append(buffer)
+            return self._split_with_pattern(text, _compile_keep_separator(separator), True)
+        return self._split_with_pattern(text, _compile_separator(separator), False)
+
+    @staticmethod
+    def _split_with_pattern(text: str, pattern: re.Pattern[str], keep_separator: bool) -> List[str]:
+        """Split with a precompiled pattern; ``pattern`` must be the capturing form when keeping separators."""
+        if not keep_separator:
+            return pattern.split(text)
+        tokens = pattern.split(text)
+        # ``split`` alternates text spans and captured separators; any groups
+        # inside a user-supplied regex add extra captures after the outer one.
+        stride = pattern.groups + 1
+        token_count = len(tokens)
+        combined: list[str] = []
+        buffer = ""
+        for index in range(0, token_count, stride):
+            buffer += tokens[index]
+            if index + 1 < token_count:
+                delimiter = tokens[index + 1]
+                if delimiter:
+                    combined.append(buffer + delimiter)
                     buffer = ""
-            if buffer:
-                combined.append(buffer)
-            return combined
-        return re.split(separator, text)
+        if buffer:
+            combined.append(buffer)
+        return combined
+
+    def split_text_with_literal(self, text: str, separator: str, keep_separator: bool) -> List[str]:
+        """Split on a literal separator using ``str`` methods instead of regex."""
+        if not separator:
+            return [text]
+        if not keep_separator:
+            return text.split(separator)
+        combined: list[str] = []
+        separator_len = len(separator)
+        find = text.find
+        start = 0
+        hit = find(separator)
+        while hit != -1:
+            end = hit + separator_len
+            combined.append(text[start:end])
+            start = end
+            hit = find(separator, start)
+        if start < len(text):
+            combined.append(text[start:])
+        return combined
@@ -107,6 +107,11 @@ class McpConnection:
 
     @property
     def tools(self) -> Dict[str, mcp_types.Tool]:
+        """returns the currently known tools; treat the mapping as read-only."""
+        return self._tools
+
+    @property
+    def tools_copy(self) -> Dict[str, mcp_types.Tool]:
         """returns a copy of the currently known tools."""
         return dict(self._tools)
 
@@ -120,6 +125,22 @@ class McpConnection:
         if self._connected:
             return
 
+        await self.open()
+        try:
+            await self.initialize()
+        except Exception:
+            await self.close()
+            raise
+
+    async def open(self) -> None:
+        """Open the transport and MCP session without performing the handshake.
+
+        The transport clients hold anyio cancel scopes, so this must run in the
+        same task that later calls :meth:`close`.
+        """
+        if self._session is not None:
+            return
+
         try:
             if not self._stack_entered:
                 await self._stack.__aenter__()
@@ -128,19 +149,27 @@ class McpConnection:
             read_stream, write_stream = await self._open_transport()
             session = ClientSession(read_stream, write_stream)
             self._session = await self._stack.enter_async_context(session)
-            init_result = await self._session.initialize()
-            self._server_info = init_result.serverInfo
-            await self.refresh_tools()
-            self._connected = True
-            logger.debug(
-                "Connected to MCP server %s (version=%s)",
-                self.namespace or "<anonymous>",
-                self._server_info.version if self._server_info else "unknown",
-            )
         except Exception:
             await self.close()
             raise
 
+    async def initialize(self) -> None:
+        """Run the MCP handshake and load tool metadata on an opened session."""
+        if self._connected:
+            return
+        if self._session is None:
+            raise RuntimeError("MCP session must be opened before it can be initialized.")
+
+        init_result = await self._session.initialize()
+        self._server_info = init_result.serverInfo
+        await self._load_tools(self._session)
+        self._connected = True
+        logger.debug(
+            "Connected to MCP server %s (version=%s)",
+            self.namespace or "<anonymous>",
+            self._server_info.version if self._server_info else "unknown",
+        )
+
     async def close(self) -> None:
         """Tear down the connection (if active)."""
         if self._stack_entered:
@@ -177,16 +206,20 @@ class McpConnection:
     async def refresh_tools(self) -> Dict[str, mcp_types.Tool]:
         """Fetch the latest tool metadata from the server"""
         session = await self._require_session()
+        await self._load_tools(session)
+        return self.tools_copy
+
+    async def _load_tools(self, session: ClientSession) -> None:
         async with self._call_lock:
             response = await session.list_tools()
         self._tools = {tool.name: tool for tool in response.tools}
-        return self.tools
 
     async def call_tool(self, tool_name: str, args: dict[str, object]) -> mcp_types.CallToolResult:
         """Invoke a tool exposed by this server"""
         session = await self._require_session()
-        async with self._call_lock:
-            return await session.call_tool(tool_name, args)
+        # ClientSession multiplexes requests by JSON-RPC id, so calls need no lock;
+        # ``_call_lock`` only serializes tool-list reloads.
+        return await session.call_tool(tool_name, args)
 
     async def _open_transport(self):
         """Open the configured transport and return read/write streams."""
@@ -234,9 +267,16 @@ class McpSessionManager:
         self._tool_registry: Dict[str, McpToolDescriptor] = {}
         self._lock = asyncio.Lock()
         self._started = False
+        self._autoconnect_task: asyncio.Task[None] | None = None
 
         if auto_connect:
-            asyncio.get_event_loop().create_task(self.start())
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # no running loop yet; the first ensure_started() performs the start.
+                pass
+            else:
+                self._autoconnect_task = loop.create_task(self.start())
 
     async def __aenter__(self) -> 'McpSessionManager':
         await self.start()
@@ -251,8 +291,17 @@ class McpSessionManager:
                 return
 
             try:
+                # Transports are opened here (their cancel scopes are bound to this
+                # task); only the latency-bound handshakes run concurrently.
                 for connection in self._connections:
-                    await connection.connect()
+                    await connection.open()
+                results = await asyncio.gather(
+                    *[connection.initialize() for connection in self._connections],
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
                 self._rebuild_registry()
                 self._started = True
             except Exception:
@@ -349,7 +398,7 @@ class McpSessionManager:
                 raise McpConnectionNotFoundError(connection_id)
             await connection.refresh_tools()
             self._rebuild_registry()
-            return connection.tools
+            return connection.tools_copy
 
     async def wait_for_tool(
         self,
@@ -464,18 +513,20 @@ class McpSessionManager:
     def _rebuild_registry(self) -> None:
         registry: Dict[str, McpToolDescriptor] = {}
         taken_names: set[str] = set()
+        suffix_counters: Dict[str, int] = {}
 
         for connection in self._connections:
             namespace = connection.namespace
+            server_info = connection.server_info
             for original_name, tool in connection.tools.items():
                 base_name = self._compose_name(namespace, original_name)
-                unique_name = self._dedupe_name(base_name, taken_names)
+                unique_name = self._dedupe_name(base_name, taken_names, suffix_counters)
                 descriptor = McpToolDescriptor(
                     exposed_name=unique_name,
                     original_name=original_name,
                     connection=connection,
                     tool=tool,
-                    server_info=connection.server_info,
+                    server_info=server_info,
                 )
                 registry[unique_name] = descriptor
                 taken_names.add(unique_name)
@@ -487,19 +538,28 @@ class McpSessionManager:
             return f"{namespace}{self._name_separator}{tool_name}"
         return tool_name
 
-    def _dedupe_name(self, candidate: str, taken: set[str]) -> str:
+    def _dedupe_name(
+        self,
+        candidate: str,
+        taken: set[str],
+        suffix_counters: Dict[str, int] | None = None,
+    ) -> str:
         if candidate not in taken:
             return candidate
 
-        suffix = 1
+        # resume from the last suffix handed out for this name; lower ones are taken.
+        suffix = suffix_counters.get(candidate, 0) + 1 if suffix_counters is not None else 1
         while True:
             updated = f"{candidate}#{suffix}"
             if updated not in taken:
+                if suffix_counters is not None:
+                    suffix_counters[candidate] = suffix
                 return updated
             suffix += 1
 
     async def _shutdown_connections(self) -> None:
-        for connection in self._connections:
+        # close in reverse order so nested transport cancel scopes unwind LIFO.
+        for connection in reversed(self._connections):
             try:
                 await connection.close()
             except Exception:
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 import mcp.types as mcp_types
 from google.adk.tools import BaseTool, ToolContext
@@ -33,7 +33,7 @@ class McpToolDescriptor:
 
 class McpTool(BaseTool):
     """google-adk compatible wrapper around an MCP tool."""
-    def __init__(self, descriptor: McpToolDescriptor) -> None:
+    def __init__(self, descriptor: McpToolDescriptor, *, include_content: bool = True) -> None:
         description = descriptor.tool.description or (
             descriptor.tool.annotations.title if descriptor.tool.annotations else ""
         )
@@ -42,16 +42,22 @@ class McpTool(BaseTool):
             description=description or f"MCP tool {descriptor.original_name}",
         )
         self._descriptor = descriptor
+        self._include_content = include_content
+        self._declaration: genai_types.FunctionDeclaration | None = None
         self.custom_metadata = self._build_metadata()
 
     def _get_declaration(self) -> Optional[genai_types.FunctionDeclaration]:
-        tool = self._descriptor.tool
-        return genai_types.FunctionDeclaration(
-            name=self.name,
-            description=tool.description,
-            parameters_json_schema=tool.inputSchema,
-            response_json_schema=tool.outputSchema,
-        )
+        # the descriptor is immutable for the lifetime of this wrapper (a registry
+        # rebuild produces new descriptors and new wrappers), so build it once.
+        if self._declaration is None:
+            tool = self._descriptor.tool
+            self._declaration = genai_types.FunctionDeclaration(
+                name=self.name,
+                description=tool.description,
+                parameters_json_schema=tool.inputSchema,
+                response_json_schema=tool.outputSchema,
+            )
+        return self._declaration
 
     async def run_async(
         self,
@@ -69,7 +75,9 @@ class McpTool(BaseTool):
             )
             raise
 
-        return _serialize_call_tool_result(result, self._descriptor)
+        return _serialize_call_tool_result(
+            result, self._descriptor, include_content=self._include_content
+        )
 
     def _build_metadata(self) -> dict[str, Any]:
         metadata: dict[str, Any] = {
@@ -97,6 +105,8 @@ class McpTool(BaseTool):
 def _serialize_call_tool_result(
     result: mcp_types.CallToolResult,
     descriptor: McpToolDescriptor,
+    *,
+    include_content: bool = True,
 ) -> dict[str, Any]:
     payload: dict[str, Any] = {
         "is_error": result.isError,
@@ -121,21 +131,47 @@ def _serialize_call_tool_result(
         payload["structured_content"] = result.structuredContent
 
     if result.content:
-        payload["content"] = [_dump_pydantic_model(block) for block in result.content]
-        # for convenience: surface the first text entry for ease of use.
-        first_text = next(
-            (block for block in result.content if isinstance(block, mcp_types.TextContent)),
-            None,
-        )
+        # single pass: dump blocks (unless skipped) and surface the first text entry.
+        content: list[dict[str, Any]] = []
+        first_text: mcp_types.TextContent | None = None
+        for block in result.content:
+            if first_text is None and isinstance(block, mcp_types.TextContent):
+                first_text = block
+                if not include_content:
+                    break
+            if include_content:
+                content.append(_dump_pydantic_model(block))
+        if include_content:
+            payload["content"] = content
         if first_text:
             payload["text"] = first_text.text
 
     return payload
 
 
+def _dump_base_model(model: BaseModel) -> dict[str, Any]:
+    return model.model_dump(mode="json", exclude_none=True)
+
+
+def _dump_mapping(model: dict[str, Any]) -> dict[str, Any]:
+    return model
+
+
+# concrete block type -> dumper, filled in as new types are seen.
+_DUMPERS: Dict[type, Callable[[Any], dict[str, Any]]] = {}
+
+
 def _dump_pydantic_model(model: mcp_types.ContentBlock | BaseModel | dict[str, Any]) -> dict[str, Any]:
+    model_type = type(model)
+    dumper = _DUMPERS.get(model_type)
+    if dumper is not None:
+        return dumper(model)
+
     if isinstance(model, BaseModel):
-        return model.model_dump(mode="json", exclude_none=True)
-    if isinstance(model, dict):
-        return model
-    raise TypeError(f"Unexpected content block type: {type(model)!r}")
+        dumper = _dump_base_model
+    elif isinstance(model, dict):
+        dumper = _dump_mapping
+    else:
+        raise TypeError(f"Unexpected content block type: {model_type!r}")
+    _DUMPERS[model_type] = dumper
+    return dumper(model)
@@ -33,6 +33,7 @@ logger = logging.getLogger(__name__)
 class BrowserUseConfiguration:
     def __init__(self, browser_use_properties: BrowserUseProperties = None):
         self.browser_use_properties = browser_use_properties
+        self._ecd_service = None
 
     def client(self) -> ecd20200930Client | None:
         try:
@@ -82,10 +83,16 @@ class BrowserUseConfiguration:
         if not getattr(self.browser_use_properties, "enable", False):
             return None
         from src.ali_agentic_adk_python.extension.web.service.atomic_operations import AtomicOperations
-        from src.ali_agentic_adk_python.extension.web.service.ecd import EcdService
 
-        ecd_service = EcdService(self.browser_use_properties)
-        return AtomicOperations(ecd_service, self.browser_use_properties)
+        return AtomicOperations(self.ecd_service(), self.browser_use_properties)
+
+    def ecd_service(self):
+        # shared so every AtomicOperations built here reuses its connection pools and invocation cap.
+        if self._ecd_service is None:
+            from src.ali_agentic_adk_python.extension.web.service.ecd import EcdService
+
+            self._ecd_service = EcdService(self.browser_use_properties)
+        return self._ecd_service
 
     def app_builder_service(self):
         operations = self.atomic_operations()
@@ -100,7 +107,8 @@ class BrowserUseConfiguration:
         config = Config(
             access_key_id=self.browser_use_properties.ak,
             access_key_secret=self.browser_use_properties.sk,
-            endpoint=endpoint
+            endpoint=endpoint,
+            max_idle_conns=getattr(self.browser_use_properties, "max_idle_conns", None),
         )
         return ecd20200930Client(config)
 
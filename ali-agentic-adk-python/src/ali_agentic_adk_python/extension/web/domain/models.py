@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -34,6 +34,10 @@ class BrowserUseRequest(BaseModel):
     endpoint: Optional[str] = None
     computer_resource_id: Optional[str] = Field(default=None, alias="computerResourceId")
     timeout: Optional[int] = Field(default=None, alias="timeout", ge=1)
+    # 仅对幂等脚本开启：成功结果会在短时间内被缓存复用
+    idempotent: bool = False
+    # 为 True 时输出按原始字节返回，不做 UTF-8 解码（截图、压缩日志等二进制内容）
+    binary_output: bool = Field(default=False, alias="binaryOutput")
 
     model_config = {
         "populate_by_name": True,
@@ -45,7 +49,7 @@ class BrowserUseResponse(BaseModel):
 
     is_success: bool = Field(default=False, alias="isSuccess")
     message: str = ""
-    browser_use_output: Optional[str] = Field(default=None, alias="browserUseOutput")
+    browser_use_output: Optional[Union[str, bytes]] = Field(default=None, alias="browserUseOutput")
     dropped: Optional[int] = None
 
     model_config = {
@@ -53,7 +57,7 @@ class BrowserUseResponse(BaseModel):
     }
 
     @classmethod
-    def success(cls, message: str = "Success", browser_use_output: Optional[str] = None,
+    def success(cls, message: str = "Success", browser_use_output: Optional[Union[str, bytes]] = None,
                 dropped: Optional[int] = None) -> "BrowserUseResponse":
         """创建成功响应"""
         return cls(is_success=True, message=message, browser_use_output=browser_use_output, dropped=dropped)
@@ -21,7 +21,7 @@
 
 from pydantic import BaseModel
 from src.ali_agentic_adk_python.extension.web.utils.environment import properties
-from typing import List
+from typing import List, Optional
 
 class BrowserUseProperties(BaseModel):
     """ADK浏览器使用配置"""
@@ -42,5 +42,9 @@ class BrowserUseProperties(BaseModel):
     password: str = properties.get('ali.adk.browser.use.properties.password', None)
     office_site_id: str = properties.get('ali.adk.browser.use.properties.officeSiteId', None)
     instance_group_id: str = None
+    result_cache_size: int = 256
+    result_cache_ttl_seconds: float = 30.0
+    max_idle_conns: int = 50
+    max_concurrent_invocations: Optional[int] = None
 
     port: int = properties.get('ali.adk.browser.use.properties.port', 7001)
\ No newline at end of file
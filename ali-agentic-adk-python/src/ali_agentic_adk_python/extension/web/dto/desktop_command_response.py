@@ -22,10 +22,12 @@
 
 class DesktopCommandResponse:
     def __init__(self, output: str = None, computer_id: str = None, finish_time: str = None,
-                 invocation_status: str = None, dropped: int = None):
+                 invocation_status: str = None, dropped: int = None, desktop_status: str = None):
         self._serialVersionUID = -4569620632167589077
         self.output = output
         self.computer_id = computer_id
         self.finish_time = finish_time
         self.invocation_status = invocation_status
-        self.dropped = dropped
\ No newline at end of file
+        self.dropped = dropped
+        # 单个云桌面的执行状态；invocation_status 为整个调用的汇总状态
+        self.desktop_status = desktop_status
\ No newline at end of file
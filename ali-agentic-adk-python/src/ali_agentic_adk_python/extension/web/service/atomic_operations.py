@@ -21,33 +21,82 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import functools
+import hashlib
+import inspect
 import logging
+import random
+import threading
 import time
+import weakref
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Final, Optional, Sequence
+
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
 
 from alibabacloud_ecd20200930.models import DescribeInvocationsRequest, RunCommandRequest
 
 from ..domain.models import BrowserUseRequest, BrowserUseResponse
 from ..dto.desktop_command_response import DesktopCommandResponse
+from .rate_limited_log import _RateLimitedLog
 
 if TYPE_CHECKING:
     from ..dto.browser_use_properties import BrowserUseProperties
     from .ecd import EcdService
 
 logger = logging.getLogger(__name__)
+# poll failures are warned about at most once per second for each ECD service.
+_POLL_FAILURES = _RateLimitedLog(logger)
+
+
+# commands longer than this (64 KiB) are encoded without going through the cache.
+_MAX_CACHED_COMMAND_LENGTH = 64 * 1024
+
+
+def _b64encode_command(command: str) -> str:
+    # Base64 output is pure ASCII; the SDK serializes command_content as a str query field.
+    return _b64.b64encode(command.encode("utf-8")).decode("ascii")
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_b64encode_command(command: str) -> str:
+    """Base64-encode a script once; agents re-run the same wrappers many times."""
+    return _b64encode_command(command)
+
+
+# plain constants for hot comparisons; the enum below keeps the public typed API.
+SUCCESS: Final[str] = "success"
+FAILED: Final[str] = "failed"
+RUNNING: Final[str] = "running"
+PENDING: Final[str] = "pending"
 
 
 class ScriptExecuteStatus(str, Enum):
-    SUCCESS = "success"
-    FAILED = "failed"
-    RUNNING = "running"
-    PENDING = "pending"
+    SUCCESS = SUCCESS
+    FAILED = FAILED
+    RUNNING = RUNNING
+    PENDING = PENDING
+
+
+# raw ECD status spellings -> canonical lowercase value, so polling rarely allocates via lower().
+_CANONICAL_STATUSES: dict[str, str] = {
+    spelling: member.value
+    for member in ScriptExecuteStatus
+    for spelling in (member.value, member.value.capitalize(), member.value.upper())
+}
+
 
+def _normalize_status(raw_status: str) -> str:
+    return _CANONICAL_STATUSES.get(raw_status) or raw_status.lower()
 
-@dataclass
+
+@dataclass(slots=True)
 class ScriptExecutionResult:
     """Internal container for describing a command poll result."""
 
@@ -55,25 +104,281 @@ class ScriptExecutionResult:
     response: Optional[DesktopCommandResponse]
 
 
+@dataclass(slots=True)
+class _PreparedScript:
+    """A validated script request ready to be submitted with RunCommand."""
+
+    run_command_request: RunCommandRequest
+    endpoint: Optional[str]
+    region_id: Optional[str]
+    timeout: int
+    cache_key: Optional[bytes]
+    as_bytes: bool = False
+
+
+class _UnboundedSlots:
+    """Semaphore stand-in used when invocations are not capped."""
+
+    def acquire(self, blocking: bool = True) -> bool:
+        return True
+
+    async def acquire_async(self) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+    def __enter__(self) -> bool:
+        return True
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+class _InvocationSlots:
+    """Bounded semaphore shared by worker threads and event loops.
+
+    Async waiters park on a future that ``release`` resolves through the waiter's loop, so
+    they neither poll nor hold a thread; a slot handed to a cancelled waiter is released again.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._available = limit
+        self._lock = threading.Lock()
+        self._thread_waiters = threading.Condition(self._lock)
+        self._async_waiters: deque[asyncio.Future[None]] = deque()
+
+    def acquire(self, blocking: bool = True) -> bool:
+        with self._lock:
+            while not self._available:
+                if not blocking:
+                    return False
+                self._thread_waiters.wait()
+            self._available -= 1
+            return True
+
+    async def acquire_async(self) -> None:
+        with self._lock:
+            if self._available:
+                self._available -= 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._async_waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._async_waiters.remove(waiter)
+                except ValueError:
+                    pass  # already handed a slot; _grant releases it.
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._async_waiters:
+                waiter = self._async_waiters.popleft()
+                if waiter.cancelled():
+                    continue
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+                except RuntimeError:  # the waiter's loop is closed
+                    continue
+                return
+            if self._available >= self._limit:
+                raise ValueError("Semaphore released too many times")
+            self._available += 1
+            self._thread_waiters.notify()
+
+    def _grant(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done():
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+# one cap per (ECD service, limit) so instances sharing a service share its slots.
+_SHARED_SLOTS: weakref.WeakKeyDictionary[Any, dict[int, _InvocationSlots]] = weakref.WeakKeyDictionary()
+_SHARED_SLOTS_LOCK = threading.Lock()
+
+
+def _invocation_slots_for(ecd_service: Any, limit: Optional[int]) -> _InvocationSlots | _UnboundedSlots:
+    if not limit:
+        return _UnboundedSlots()
+    with _SHARED_SLOTS_LOCK:
+        per_limit = _SHARED_SLOTS.setdefault(ecd_service, {})
+        slots = per_limit.get(limit)
+        if slots is None:
+            slots = per_limit[limit] = _InvocationSlots(limit)
+        return slots
+
+
+class _ResultCache:
+    """Small LRU cache with a TTL for results of idempotent commands."""
+
+    DEFAULT_MAXSIZE: int = 256
+    DEFAULT_TTL_SECONDS: float = 30.0
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, BrowserUseResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[BrowserUseResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return response.model_copy()
+
+    def put(self, key: bytes, response: BrowserUseResponse) -> None:
+        if self._maxsize <= 0 or self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, response.model_copy())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: bytes) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+
 class AtomicOperations:
-    """Expose atomic Computer Use operations backed by Alibaba Cloud ECD."""
+    """Expose atomic Computer Use operations backed by Alibaba Cloud ECD.
+
+    The ECD SDK keeps a keep-alive connection pool per client, so share one ``EcdService``
+    across ``AtomicOperations`` instances instead of creating one per request.
+    ``properties.max_concurrent_invocations`` caps how many scripts run at once across all
+    instances sharing the same ``EcdService``.
+    """
 
     DEFAULT_TIMEOUT_SECONDS: int = 60
-    POLL_INTERVAL_SECONDS: float = 1.0
+    # polling backoff: a few quick polls for short scripts, then a jittered exponential ramp.
+    MIN_POLL_DELAY_SECONDS: float = 0.05
+    MAX_POLL_DELAY_SECONDS: float = 1.0
+    POLL_BACKOFF_RATE: float = 2.0
+    FAST_POLL_ATTEMPTS: int = 5
+
+    __slots__ = ("_ecd_service", "_properties", "_result_cache", "_invocation_slots")
 
     def __init__(self, ecd_service: EcdService, properties: BrowserUseProperties):
         self._ecd_service = ecd_service
         self._properties = properties
+        self._result_cache = _ResultCache(
+            maxsize=getattr(properties, "result_cache_size", _ResultCache.DEFAULT_MAXSIZE),
+            ttl_seconds=getattr(properties, "result_cache_ttl_seconds", _ResultCache.DEFAULT_TTL_SECONDS),
+        )
+        self._invocation_slots = _invocation_slots_for(
+            ecd_service, getattr(properties, "max_concurrent_invocations", None)
+        )
 
-    def do_script_execute(self, request: BrowserUseRequest | dict[str, Any]) -> BrowserUseResponse:
-        """Execute a PowerShell script on the configured Wuying desktop."""
+    def do_script_execute(
+        self, request: BrowserUseRequest | dict[str, Any], *, trusted: bool = False
+    ) -> BrowserUseResponse:
+        """Execute a PowerShell script on the configured Wuying desktop.
+
+        ``trusted=True`` builds dict requests without validation; use it only for internal
+        call sites whose payloads are already known to be well formed.
+        """
+
+        prepared = self._prepare_script(request, trusted=trusted)
+        if isinstance(prepared, BrowserUseResponse):
+            return prepared
+
+        with self._invocation_slots:
+            invoke_id = self._ecd_service.run_command(prepared.run_command_request, prepared.endpoint)
+            if not invoke_id:
+                logger.error("Failed to submit command to ECD, invoke id is empty.")
+                return BrowserUseResponse.error(message="Invoke failed")
+
+            describe_request = self._build_describe_request(invoke_id, prepared.region_id)
+            if getattr(self._ecd_service, "supports_long_poll", False) is True:
+                result = self._await_invocation(
+                    describe_request, prepared.endpoint, invoke_id, prepared.timeout, as_bytes=prepared.as_bytes
+                )
+            else:
+                result = self._legacy_poll_loop(
+                    describe_request, prepared.endpoint, invoke_id, prepared.timeout, as_bytes=prepared.as_bytes
+                )
+        return self._remember_result(prepared, result)
 
-        parsed_request = self._ensure_request(request)
+    async def do_script_execute_async(
+        self, request: BrowserUseRequest | dict[str, Any], *, trusted: bool = False
+    ) -> BrowserUseResponse:
+        """Async variant of :meth:`do_script_execute` that waits without holding a thread.
+
+        ECD calls use the service's ``*_async`` coroutines when present and run the sync
+        methods in a worker thread otherwise.
+        """
+
+        prepared = self._prepare_script(request, trusted=trusted)
+        if isinstance(prepared, BrowserUseResponse):
+            return prepared
+
+        await self._invocation_slots.acquire_async()
+        try:
+            return self._remember_result(prepared, await self._run_prepared_async(prepared))
+        finally:
+            self._invocation_slots.release()
+
+    async def _run_prepared_async(self, prepared: _PreparedScript) -> BrowserUseResponse:
+        invoke_id = await self._call_ecd_async("run_command", prepared.run_command_request, prepared.endpoint)
+        if not invoke_id:
+            logger.error("Failed to submit command to ECD, invoke id is empty.")
+            return BrowserUseResponse.error(message="Invoke failed")
+
+        describe_request = self._build_describe_request(invoke_id, prepared.region_id)
+        if getattr(self._ecd_service, "supports_long_poll", False) is True:
+            try:
+                response = await self._call_ecd_async(
+                    "wait_for_invocation", describe_request, prepared.endpoint, timeout=prepared.timeout
+                )
+            except TimeoutError:
+                logger.warning("Command execution timeout reached, invoke id: %s", invoke_id)
+                return BrowserUseResponse.error(message="Timeout")
+            return self._finished_response(response, as_bytes=prepared.as_bytes)
+        return await self._poll_loop_async(
+            describe_request, prepared.endpoint, invoke_id, prepared.timeout, as_bytes=prepared.as_bytes
+        )
+
+    def _prepare_script(
+        self,
+        request: BrowserUseRequest | dict[str, Any],
+        *,
+        trusted: bool = False,
+        computer_resource_ids: Optional[Sequence[str]] = None,
+    ) -> BrowserUseResponse | _PreparedScript:
+        """Validate a request and build its RunCommand call, or return the early response.
+
+        ``computer_resource_ids`` targets several desktops at once; such runs are never cached.
+        """
+
+        parsed_request = self._ensure_request(request, trusted=trusted)
         if not parsed_request.command:
             logger.error("Computer Use command is empty.")
             return BrowserUseResponse.error(message="Command is empty")
 
-        computer_resource_id = parsed_request.computer_resource_id or self._properties.computer_resource_id
+        if computer_resource_ids is not None:
+            desktop_ids = list(computer_resource_ids)
+            computer_resource_id = desktop_ids[0] if desktop_ids else None
+        else:
+            computer_resource_id = parsed_request.computer_resource_id or self._properties.computer_resource_id
+            desktop_ids = [computer_resource_id]
         if not computer_resource_id:
             logger.error("Computer resource id is not configured.")
             return BrowserUseResponse.error(message="Computer resource id missing")
@@ -87,51 +392,278 @@ class AtomicOperations:
         region_id = parsed_request.region_id or self._properties.region_id
         endpoint = parsed_request.endpoint or self._properties.endpoint
 
+        cache_key: Optional[bytes] = None
+        if parsed_request.idempotent and computer_resource_ids is None:
+            cache_key = self._result_cache_key(
+                parsed_request.command, computer_resource_id, region_id, parsed_request.binary_output
+            )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         run_command_request = self._build_run_command_request(
             command=parsed_request.command,
-            computer_resource_id=computer_resource_id,
+            computer_resource_ids=desktop_ids,
             end_user_id=end_user_id,
             region_id=region_id,
         )
+        return _PreparedScript(
+            run_command_request=run_command_request,
+            endpoint=endpoint,
+            region_id=region_id,
+            timeout=timeout,
+            cache_key=cache_key,
+            as_bytes=parsed_request.binary_output,
+        )
 
-        invoke_id = self._ecd_service.run_command(run_command_request, endpoint)
-        if not invoke_id:
-            logger.error("Failed to submit command to ECD, invoke id is empty.")
-            return BrowserUseResponse.error(message="Invoke failed")
+    def _remember_result(self, prepared: _PreparedScript, result: BrowserUseResponse) -> BrowserUseResponse:
+        if prepared.cache_key is not None and result.is_success:
+            self._result_cache.put(prepared.cache_key, result)
+        return result
 
+    @staticmethod
+    def _build_describe_request(invoke_id: str, region_id: Optional[str]) -> DescribeInvocationsRequest:
         describe_request = DescribeInvocationsRequest()
         describe_request.invoke_id = invoke_id
         if region_id:
             describe_request.region_id = region_id
+        return describe_request
 
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            poll_result = self._poll_once(describe_request, endpoint)
-            if poll_result.response is None:
-                time.sleep(self.POLL_INTERVAL_SECONDS)
-                continue
+    async def _call_ecd_async(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        native = getattr(self._ecd_service, f"{method_name}_async", None)
+        if native is not None and inspect.iscoroutinefunction(native):
+            return await native(*args, **kwargs)
+        return await asyncio.to_thread(getattr(self._ecd_service, method_name), *args, **kwargs)
 
-            status = poll_result.status
-            response = poll_result.response
-            if status == ScriptExecuteStatus.SUCCESS.value:
-                decoded = self._decode_output(response.output)
-                return BrowserUseResponse.success(
-                    message=response.invocation_status or "Success",
-                    browser_use_output=decoded,
-                    dropped=response.dropped,
-                )
+    def do_script_execute_many(
+        self,
+        request: BrowserUseRequest | dict[str, Any],
+        computer_resource_ids: Sequence[str],
+        *,
+        trusted: bool = False,
+    ) -> dict[str, BrowserUseResponse]:
+        """Run one script on several desktops with a single RunCommand and one polling loop.
+
+        Returns a response per desktop id; desktops still unfinished at the deadline get a
+        ``Timeout`` error.
+        """
+
+        desktop_ids = list(dict.fromkeys(computer_resource_ids))
+        prepared = self._prepare_script(request, trusted=trusted, computer_resource_ids=desktop_ids)
+        if isinstance(prepared, BrowserUseResponse):
+            return {desktop_id: prepared for desktop_id in desktop_ids}
 
-            if status == ScriptExecuteStatus.FAILED.value:
-                return BrowserUseResponse.error(
-                    message=response.invocation_status or "Failed",
-                    dropped=response.dropped,
+        with self._invocation_slots:
+            return self._run_many(prepared, desktop_ids)
+
+    def _run_many(self, prepared: _PreparedScript, desktop_ids: list[str]) -> dict[str, BrowserUseResponse]:
+        invoke_id = self._ecd_service.run_command(prepared.run_command_request, prepared.endpoint)
+        if not invoke_id:
+            logger.error("Failed to submit command to ECD, invoke id is empty.")
+            return {desktop_id: BrowserUseResponse.error(message="Invoke failed") for desktop_id in desktop_ids}
+
+        describe_request = self._build_describe_request(invoke_id, prepared.region_id)
+        results: dict[str, BrowserUseResponse] = {}
+        deadline_ns = time.monotonic_ns() + int(prepared.timeout * 1_000_000_000)
+        attempt = 0
+        while time.monotonic_ns() < deadline_ns:
+            finished_before = len(results)
+            try:
+                responses = self._ecd_service.get_command_result(describe_request, prepared.endpoint)
+            except Exception as exc:  # pragma: no cover - defensive logging
+                self._log_poll_failure(exc)
+                responses = []
+
+            for response in responses or ():
+                desktop_id = response.computer_id
+                if desktop_id in results or desktop_id not in desktop_ids:
+                    continue
+                raw_status = response.desktop_status or response.invocation_status
+                if not raw_status:
+                    continue
+                terminal = self._terminal_response(
+                    _normalize_status(raw_status), response, as_bytes=prepared.as_bytes
                 )
+                if terminal is not None:
+                    results[desktop_id] = terminal
+
+            if len(results) == len(desktop_ids):
+                return results
+
+            attempt = 0 if len(results) > finished_before else attempt + 1
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                break
+            time.sleep(min(self._next_poll_delay(attempt), remaining_ns / 1_000_000_000))
+
+        logger.warning("Command execution timeout reached, invoke id: %s", invoke_id)
+        return {
+            desktop_id: results.get(desktop_id) or BrowserUseResponse.error(message="Timeout")
+            for desktop_id in desktop_ids
+        }
+
+    def invalidate_cached_result(self, request: BrowserUseRequest | dict[str, Any]) -> bool:
+        """Drop the cached result of an idempotent request; returns whether one was cached."""
+        parsed_request = self._ensure_request(request)
+        computer_resource_id = parsed_request.computer_resource_id or self._properties.computer_resource_id
+        region_id = parsed_request.region_id or self._properties.region_id
+        return self._result_cache.invalidate(
+            self._result_cache_key(
+                parsed_request.command, computer_resource_id, region_id, parsed_request.binary_output
+            )
+        )
+
+    @staticmethod
+    def _result_cache_key(
+        command: str,
+        computer_resource_id: Optional[str],
+        region_id: Optional[str],
+        binary_output: bool = False,
+    ) -> bytes:
+        key = f"{command}|{computer_resource_id}|{region_id}|{int(binary_output)}"
+        return hashlib.sha256(key.encode("utf-8")).digest()
+
+    def _await_invocation(
+        self,
+        describe_request: DescribeInvocationsRequest,
+        endpoint: Optional[str],
+        invoke_id: str,
+        timeout: float,
+        *,
+        as_bytes: bool = False,
+    ) -> BrowserUseResponse:
+        """Block on the service's completion wait instead of polling."""
+        try:
+            response = self._ecd_service.wait_for_invocation(describe_request, endpoint, timeout=timeout)
+        except TimeoutError:
+            logger.warning("Command execution timeout reached, invoke id: %s", invoke_id)
+            return BrowserUseResponse.error(message="Timeout")
+
+        return self._finished_response(response, as_bytes=as_bytes)
+
+    def _finished_response(self, response: DesktopCommandResponse, *, as_bytes: bool = False) -> BrowserUseResponse:
+        """Map the response of a completed wait; anything but success counts as failure."""
+        status = _normalize_status(response.invocation_status or "")
+        terminal = self._terminal_response(status, response, as_bytes=as_bytes)
+        if terminal is None:
+            return BrowserUseResponse.error(message=response.invocation_status or "Failed", dropped=response.dropped)
+        return terminal
+
+    def _legacy_poll_loop(
+        self,
+        describe_request: DescribeInvocationsRequest,
+        endpoint: Optional[str],
+        invoke_id: str,
+        timeout: float,
+        *,
+        as_bytes: bool = False,
+    ) -> BrowserUseResponse:
+        """Poll DescribeInvocations until the command finishes or ``timeout`` elapses."""
+        # bind everything the loop touches to locals once.
+        now_ns = time.monotonic_ns
+        sleep = time.sleep
+        poll = self._poll_once
+        next_delay = self._next_poll_delay
+        terminal_response = self._terminal_response
+
+        deadline_ns = now_ns() + int(timeout * 1_000_000_000)
+        attempt = 0
+        last_status: Optional[str] = None
+        while now_ns() < deadline_ns:
+            poll_result = poll(describe_request, endpoint)
+            response = poll_result.response
+            if response is not None:
+                status = poll_result.status
+                terminal = terminal_response(status, response, as_bytes=as_bytes)
+                if terminal is not None:
+                    return terminal
+                if status != last_status:
+                    # the invocation moved on (e.g. pending -> running); restart the ramp.
+                    last_status = status
+                    attempt = 0
+                else:
+                    attempt += 1
+            else:
+                attempt += 1
+
+            remaining_ns = deadline_ns - now_ns()
+            if remaining_ns <= 0:
+                break
+            sleep(min(next_delay(attempt), remaining_ns / 1_000_000_000))
 
-            time.sleep(self.POLL_INTERVAL_SECONDS)
+        logger.warning("Command execution timeout reached, invoke id: %s", invoke_id)
+        return BrowserUseResponse.error(message="Timeout")
+
+    async def _poll_loop_async(
+        self,
+        describe_request: DescribeInvocationsRequest,
+        endpoint: Optional[str],
+        invoke_id: str,
+        timeout: float,
+        *,
+        as_bytes: bool = False,
+    ) -> BrowserUseResponse:
+        """Async counterpart of :meth:`_legacy_poll_loop` sleeping on the event loop."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        attempt = 0
+        last_status: Optional[str] = None
+        while loop.time() < deadline:
+            poll_result = await self._poll_once_async(describe_request, endpoint)
+            response = poll_result.response
+            if response is not None:
+                terminal = self._terminal_response(poll_result.status, response, as_bytes=as_bytes)
+                if terminal is not None:
+                    return terminal
+
+            if response is not None and poll_result.status != last_status:
+                last_status = poll_result.status
+                attempt = 0
+            else:
+                attempt += 1
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(self._next_poll_delay(attempt), remaining))
 
         logger.warning("Command execution timeout reached, invoke id: %s", invoke_id)
         return BrowserUseResponse.error(message="Timeout")
 
+    def _terminal_response(
+        self, status: str, response: DesktopCommandResponse, *, as_bytes: bool = False
+    ) -> Optional[BrowserUseResponse]:
+        """Map a finished invocation to a response, or ``None`` while it is still in flight."""
+        if status == SUCCESS:
+            decoded = self._decode_output(response.output, as_bytes=as_bytes)
+            return BrowserUseResponse.success(
+                message=response.invocation_status or "Success",
+                browser_use_output=decoded,
+                dropped=response.dropped,
+            )
+
+        if status == FAILED:
+            return BrowserUseResponse.error(
+                message=response.invocation_status or "Failed",
+                dropped=response.dropped,
+            )
+        return None
+
+    def _next_poll_delay(self, attempt: int) -> float:
+        """Delay before the next poll: fixed while in the fast phase, then full-jitter backoff."""
+        min_delay = self.MIN_POLL_DELAY_SECONDS
+        if attempt < self.FAST_POLL_ATTEMPTS:
+            return min_delay
+        ceiling = min(
+            self.MAX_POLL_DELAY_SECONDS,
+            min_delay * self.POLL_BACKOFF_RATE ** (attempt - self.FAST_POLL_ATTEMPTS + 1),
+        )
+        return random.uniform(min_delay, ceiling)
+
+    def _log_poll_failure(self, exc: BaseException) -> None:
+        """Log a failed status fetch without flooding logs when the backend keeps failing."""
+        _POLL_FAILURES.warning(self._ecd_service, "Failed to fetch command result: %s", exc, exc_info=exc)
+
     def _poll_once(
         self,
         describe_request: DescribeInvocationsRequest,
@@ -142,14 +674,30 @@ class AtomicOperations:
         try:
             responses = self._ecd_service.get_command_result(describe_request, endpoint)
         except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error("Failed to fetch command result: %s", exc, exc_info=exc)
-            return ScriptExecutionResult(status=ScriptExecuteStatus.FAILED.value, response=None)
+            self._log_poll_failure(exc)
+            return ScriptExecutionResult(status=FAILED, response=None)
+        return self._execution_result(responses)
+
+    async def _poll_once_async(
+        self,
+        describe_request: DescribeInvocationsRequest,
+        endpoint: Optional[str],
+    ) -> ScriptExecutionResult:
+        try:
+            responses = await self._call_ecd_async("get_command_result", describe_request, endpoint)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            self._log_poll_failure(exc)
+            return ScriptExecutionResult(status=FAILED, response=None)
+        return self._execution_result(responses)
 
+    def _execution_result(
+        self, responses: Optional[Sequence[DesktopCommandResponse]]
+    ) -> ScriptExecutionResult:
         response = self._first_or_none(responses)
         if response is None or not response.invocation_status:
-            return ScriptExecutionResult(status=ScriptExecuteStatus.PENDING.value, response=None)
+            return ScriptExecutionResult(status=PENDING, response=None)
 
-        status = response.invocation_status.lower()
+        status = _normalize_status(response.invocation_status)
         return ScriptExecutionResult(status=status, response=response)
 
     @staticmethod
@@ -159,25 +707,28 @@ class AtomicOperations:
         return responses[0]
 
     @staticmethod
-    def _decode_output(encoded_output: Optional[str]) -> str:
+    def _decode_output(encoded_output: Optional[str], *, as_bytes: bool = False) -> str | bytes:
         if not encoded_output:
-            return ""
+            return b"" if as_bytes else ""
         try:
-            return base64.b64decode(encoded_output).decode("utf-8", errors="replace")
+            decoded = _b64.b64decode(encoded_output.encode("ascii"), validate=False)
         except Exception:  # pragma: no cover - fall back to raw string
             logger.debug("Failed to decode output; returning raw payload.")
-            return encoded_output
+            return encoded_output.encode("utf-8") if as_bytes else encoded_output
+        if as_bytes:
+            return decoded
+        return decoded.decode("utf-8", errors="replace")
 
     def _build_run_command_request(
         self,
         *,
         command: str,
-        computer_resource_id: str,
+        computer_resource_ids: Sequence[str],
         end_user_id: str,
         region_id: Optional[str],
     ) -> RunCommandRequest:
         run_command_request = RunCommandRequest(
-            desktop_id=[computer_resource_id],
+            desktop_id=list(computer_resource_ids),
             content_encoding="Base64",
             type="RunPowerShellScript",
             end_user_id=end_user_id,
@@ -185,12 +736,27 @@ class AtomicOperations:
         if region_id:
             run_command_request.region_id = region_id
 
-        encoded_command = base64.b64encode(command.encode("utf-8")).decode("utf-8")
-        run_command_request.command_content = encoded_command
+        run_command_request.command_content = self._encode_command(command)
         return run_command_request
 
     @staticmethod
-    def _ensure_request(request: BrowserUseRequest | dict[str, Any]) -> BrowserUseRequest:
+    def _encode_command(command: str) -> str:
+        if len(command) > _MAX_CACHED_COMMAND_LENGTH:
+            # large one-off scripts would only pin memory in the cache.
+            return _b64encode_command(command)
+        return _cached_b64encode_command(command)
+
+    @staticmethod
+    def _ensure_request(
+        request: BrowserUseRequest | dict[str, Any], *, trusted: bool = False
+    ) -> BrowserUseRequest:
+        request_type = type(request)
+        if request_type is BrowserUseRequest:
+            return request
+        if request_type is dict:
+            if trusted:
+                return BrowserUseRequest.model_construct(**request)
+            return BrowserUseRequest.model_validate(request)
         if isinstance(request, BrowserUseRequest):
             return request
         if isinstance(request, dict):
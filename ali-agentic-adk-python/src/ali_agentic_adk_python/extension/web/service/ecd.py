@@ -35,8 +35,10 @@ from alibabacloud_appstream_center20210218.models import GetAuthCodeRequest
 from src.ali_agentic_adk_python.extension.web.configuration.browser_use_configuration import BrowserUseConfiguration
 from src.ali_agentic_adk_python.extension.web.dto.browser_use_properties import BrowserUseProperties
 from src.ali_agentic_adk_python.extension.web.dto.desktop_command_response import DesktopCommandResponse
+from src.ali_agentic_adk_python.extension.web.service.rate_limited_log import _RateLimitedLog
 
 logger = logging.getLogger(__name__)
+_POLL_FAILURES = _RateLimitedLog(logger)
 
 
 class EcdService:
@@ -45,6 +47,8 @@ class EcdService:
     app_stream_client: appStreamClient
     mobile_client: edsaic20230930Client
     client1002: ecd20201002Client
+    # DescribeInvocations has no blocking variant, so AtomicOperations polls for results.
+    supports_long_poll: bool = False
     # 访问方式请参见：https://help.aliyun.com/document_detail/378659.html
     def __init__(self, properties: BrowserUseProperties = None):
         self.properties = properties or BrowserUseProperties()
@@ -114,9 +118,41 @@ class EcdService:
             logger.info(f"AliyunEcdServiceImpl getCommandResult success, request: {json.dumps(request.__dict__)}, endpoint: {endpoint}, original response:{str(response.body)}")
             return self.convert(response.body.invocations)
         except Exception as e:
-            logger.error(f"AliyunEcdServiceImpl getCommandResult error, request: {json.dumps(request.__dict__)}", exc_info=e)
+            self._log_poll_failure("getCommandResult", request, e)
             return []
 
+    async def run_command_async(self, request: RunCommandRequest, endpoint=None):
+        try:
+            logger.warning(f"runCommand async request in, request: {json.dumps(request.__dict__)}, endpoint: {endpoint}")
+            response = await self._client_for(endpoint).run_command_async(request)
+            logger.info(f"runCommand async request in, response: {json.dumps(response.body.__dict__)}")
+            return response.body.invoke_id
+        except Exception as e:
+            logger.error(f"AliyunEcdServiceImpl runCommandAsync error, request: {json.dumps(request.__dict__)}", exc_info=e)
+            return None
+
+    async def get_command_result_async(self, request: DescribeInvocationsRequest, endpoint=None):
+        try:
+            request.include_output = True
+            request.content_encoding = "plain_text"
+            response = await self._client_for(endpoint).describe_invocations_async(request)
+            logger.info(f"AliyunEcdServiceImpl getCommandResultAsync success, request: {json.dumps(request.__dict__)}, endpoint: {endpoint}, original response:{str(response.body)}")
+            return self.convert(response.body.invocations)
+        except Exception as e:
+            self._log_poll_failure("getCommandResultAsync", request, e)
+            return []
+
+    def _log_poll_failure(self, method: str, request: DescribeInvocationsRequest, exc: BaseException) -> None:
+        # Polling callers hit get_command_result many times per second.
+        _POLL_FAILURES.warning(
+            self, "AliyunEcdServiceImpl %s error, invoke_id: %s: %s", method, getattr(request, "invoke_id", None), exc, exc_info=exc
+        )
+
+    def _client_for(self, endpoint=None) -> ecd20200930Client:
+        if endpoint == "ecd.ap-northeast-1.aliyuncs.com":
+            return self.client_jp
+        return self.client
+
     def get_auth_code(self, user_id):
         request = GetAuthCodeRequest(end_user_id=user_id)
         try:
@@ -145,6 +181,7 @@ class EcdService:
             response.finish_time = getattr(invoke_desktop, 'finish_time', None)
             response.invocation_status = getattr(invocations[0], 'invocation_status', None)
             response.dropped = getattr(invoke_desktop, 'dropped', None)
+            response.desktop_status = getattr(invoke_desktop, 'invocation_status', None)
             response_list.append(response)
         return response_list
 
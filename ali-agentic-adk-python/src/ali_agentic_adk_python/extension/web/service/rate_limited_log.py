@@ -0,0 +1,57 @@
+# Copyright (C) 2025 AIDC-AI
+# This project incorporates components from the Open Source Software below.
+# The original copyright notices and the licenses under which we received such components are set forth below for informational purposes.
+#
+# Open Source Software Licensed under the MIT License:
+# --------------------------------------------------------------------
+# 1. vscode-extension-updater-gitlab 3.0.1 https://www.npmjs.com/package/vscode-extension-updater-gitlab
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Copyright (c) 2015 David Owens II
+# Copyright (c) Microsoft Corporation.
+# Terms of the MIT:
+# --------------------------------------------------------------------
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Optional
+
+
+class _RateLimitedLog:
+    """Warn about repeated failures at most once per interval for each source.
+
+    Polling loops call into failing backends many times per second; each source (for
+    example a service instance) gets its own window so one failing backend cannot
+    silence another. With DEBUG enabled every failure is logged with its traceback.
+    """
+
+    DEFAULT_INTERVAL_NS: int = 1_000_000_000
+
+    def __init__(self, logger: logging.Logger, interval_ns: int = DEFAULT_INTERVAL_NS):
+        self._logger = logger
+        self._interval_ns = interval_ns
+        self._last_warning_ns: weakref.WeakKeyDictionary[Any, int] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def warning(self, source: Any, message: str, *args: Any, exc_info: Optional[BaseException] = None) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(message, *args, exc_info=exc_info)
+            return
+        now_ns = time.monotonic_ns()
+        with self._lock:
+            last_ns = self._last_warning_ns.get(source)
+            if last_ns is not None and now_ns - last_ns < self._interval_ns:
+                return
+            self._last_warning_ns[source] = now_ns
+        self._logger.warning(message, *args)
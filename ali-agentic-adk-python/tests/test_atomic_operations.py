@@ -21,9 +21,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import logging
+import threading
+import time
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -31,6 +35,7 @@ import ali_agentic_adk_python.extension.web.service.atomic_operations as atomic_
 from ali_agentic_adk_python.extension.web.domain.models import BrowserUseRequest
 from ali_agentic_adk_python.extension.web.dto.desktop_command_response import DesktopCommandResponse
 from ali_agentic_adk_python.extension.web.service.atomic_operations import AtomicOperations
+from ali_agentic_adk_python.extension.web.service.rate_limited_log import _RateLimitedLog
 
 
 @pytest.fixture()
@@ -58,7 +63,7 @@ def test_do_script_execute_success(monkeypatch: pytest.MonkeyPatch, properties:
     ]
 
     monkeypatch.setattr(atomic_ops_module.time, "sleep", lambda _: None)
-    monkeypatch.setattr(AtomicOperations, "POLL_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(atomic_ops_module.random, "uniform", lambda low, high: low)
 
     operations = AtomicOperations(ecd_service, properties)
     result = operations.do_script_execute(BrowserUseRequest(command="Write-Output 'hello'"))
@@ -68,6 +73,7 @@ def test_do_script_execute_success(monkeypatch: pytest.MonkeyPatch, properties:
     assert result.browser_use_output.strip() == "hello"
     ecd_service.run_command.assert_called_once()
     run_request = ecd_service.run_command.call_args.args[0]
+    assert isinstance(run_request.command_content, str)
     decoded = base64.b64decode(run_request.command_content.encode("utf-8")).decode("utf-8")
     assert decoded.startswith("Write-Output")
 
@@ -83,7 +89,7 @@ def test_do_script_execute_failure(monkeypatch: pytest.MonkeyPatch, properties:
     ecd_service.get_command_result.return_value = [failure_response]
 
     monkeypatch.setattr(atomic_ops_module.time, "sleep", lambda _: None)
-    monkeypatch.setattr(AtomicOperations, "POLL_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(atomic_ops_module.random, "uniform", lambda low, high: low)
 
     operations = AtomicOperations(ecd_service, properties)
     result = operations.do_script_execute({"command": "Write-Error 'boom'"})
@@ -107,10 +113,14 @@ def test_do_script_execute_timeout(monkeypatch: pytest.MonkeyPatch, properties:
             self.current += 0.6
             return value
 
+        def monotonic_ns(self) -> int:
+            return int(self.monotonic() * 1e9)
+
     fake_clock = FakeClock()
     monkeypatch.setattr(atomic_ops_module.time, "sleep", lambda _: None)
     monkeypatch.setattr(atomic_ops_module.time, "monotonic", fake_clock.monotonic)
-    monkeypatch.setattr(AtomicOperations, "POLL_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(atomic_ops_module.time, "monotonic_ns", fake_clock.monotonic_ns)
+    monkeypatch.setattr(atomic_ops_module.random, "uniform", lambda low, high: low)
 
     operations = AtomicOperations(ecd_service, properties)
     result = operations.do_script_execute(BrowserUseRequest(command="Write-Output 'timeout'", timeout=1))
@@ -118,3 +128,367 @@ def test_do_script_execute_timeout(monkeypatch: pytest.MonkeyPatch, properties:
     assert not result.is_success
     assert result.message == "Timeout"
     ecd_service.get_command_result.assert_called()
+
+
+def test_next_poll_delay_ramps_after_fast_phase(monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace):
+    monkeypatch.setattr(atomic_ops_module.random, "uniform", lambda low, high: high)
+    operations = AtomicOperations(MagicMock(), properties)
+
+    fast = [operations._next_poll_delay(attempt) for attempt in range(AtomicOperations.FAST_POLL_ATTEMPTS)]
+    ramp = [
+        operations._next_poll_delay(attempt)
+        for attempt in range(AtomicOperations.FAST_POLL_ATTEMPTS, AtomicOperations.FAST_POLL_ATTEMPTS + 10)
+    ]
+
+    assert fast == [AtomicOperations.MIN_POLL_DELAY_SECONDS] * AtomicOperations.FAST_POLL_ATTEMPTS
+    assert ramp == sorted(ramp)
+    assert ramp[0] > AtomicOperations.MIN_POLL_DELAY_SECONDS
+    assert ramp[-1] == AtomicOperations.MAX_POLL_DELAY_SECONDS
+
+
+def test_do_script_execute_never_sleeps_past_deadline(monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace):
+    ecd_service = MagicMock()
+    ecd_service.run_command.return_value = "invoke-1"
+    ecd_service.get_command_result.return_value = []
+
+    class FakeClock:
+        def __init__(self):
+            self.current = 0.0
+
+        def monotonic(self) -> float:
+            return self.current
+
+        def monotonic_ns(self) -> int:
+            return int(self.current * 1e9)
+
+        def sleep(self, seconds: float) -> None:
+            sleeps.append(seconds)
+            self.current += seconds
+
+    sleeps: list[float] = []
+    fake_clock = FakeClock()
+    monkeypatch.setattr(atomic_ops_module.time, "sleep", fake_clock.sleep)
+    monkeypatch.setattr(atomic_ops_module.time, "monotonic", fake_clock.monotonic)
+    monkeypatch.setattr(atomic_ops_module.time, "monotonic_ns", fake_clock.monotonic_ns)
+    monkeypatch.setattr(atomic_ops_module.random, "uniform", lambda low, high: high)
+
+    operations = AtomicOperations(ecd_service, properties)
+    result = operations.do_script_execute(BrowserUseRequest(command="Start-Sleep 10", timeout=2))
+
+    assert result.message == "Timeout"
+    assert sum(sleeps) == pytest.approx(2.0)
+    assert max(sleeps) <= AtomicOperations.MAX_POLL_DELAY_SECONDS
+
+
+def test_do_script_execute_prefers_long_poll_when_supported(properties: SimpleNamespace):
+    ecd_service = MagicMock()
+    ecd_service.supports_long_poll = True
+    ecd_service.run_command.return_value = "invoke-7"
+    ecd_service.wait_for_invocation.return_value = DesktopCommandResponse(
+        output=base64.b64encode(b"done").decode("ascii"),
+        invocation_status="Success",
+        dropped=0,
+    )
+
+    operations = AtomicOperations(ecd_service, properties)
+    result = operations.do_script_execute(BrowserUseRequest(command="Write-Output 'done'", timeout=5))
+
+    assert result.is_success
+    assert result.browser_use_output == "done"
+    ecd_service.get_command_result.assert_not_called()
+    assert ecd_service.wait_for_invocation.call_args.kwargs["timeout"] == 5
+
+
+def test_do_script_execute_caches_idempotent_results(monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace):
+    ecd_service = MagicMock()
+    ecd_service.run_command.return_value = "invoke-42"
+    ecd_service.get_command_result.return_value = [
+        DesktopCommandResponse(
+            output=base64.b64encode(b"C:\\exists").decode("ascii"),
+            invocation_status="Success",
+            dropped=0,
+        )
+    ]
+    monkeypatch.setattr(atomic_ops_module.time, "sleep", lambda _: None)
+
+    operations = AtomicOperations(ecd_service, properties)
+    request = BrowserUseRequest(command="Test-Path C:\\exists", idempotent=True)
+
+    first = operations.do_script_execute(request)
+    second = operations.do_script_execute(request)
+    operations.do_script_execute(BrowserUseRequest(command="Test-Path C:\\exists"))
+
+    assert first.browser_use_output == second.browser_use_output == "C:\\exists"
+    assert ecd_service.run_command.call_count == 2
+
+    assert operations.invalidate_cached_result(request) is True
+    operations.do_script_execute(request)
+    assert ecd_service.run_command.call_count == 3
+
+
+def test_encode_command_caches_small_scripts_only():
+    atomic_ops_module._cached_b64encode_command.cache_clear()
+    script = "Get-Process | Select-Object -First 5"
+
+    first = AtomicOperations._encode_command(script)
+    second = AtomicOperations._encode_command(script)
+    large = "x" * (atomic_ops_module._MAX_CACHED_COMMAND_LENGTH + 1)
+    encoded_large = AtomicOperations._encode_command(large)
+
+    assert base64.b64decode(first).decode("utf-8") == script
+    assert first == second
+    assert atomic_ops_module._cached_b64encode_command.cache_info().hits == 1
+    assert atomic_ops_module._cached_b64encode_command.cache_info().currsize == 1
+    assert base64.b64decode(encoded_large).decode("utf-8") == large
+
+
+def test_do_script_execute_async_uses_native_coroutines(monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace):
+    ecd_service = MagicMock()
+    ecd_service.run_command_async = AsyncMock(return_value="invoke-async")
+    ecd_service.get_command_result_async = AsyncMock(
+        side_effect=[
+            [],
+            [DesktopCommandResponse(output=None, invocation_status="Running", dropped=0)],
+            [
+                DesktopCommandResponse(
+                    output=base64.b64encode(b"async").decode("ascii"),
+                    invocation_status="Success",
+                    dropped=0,
+                )
+            ],
+        ]
+    )
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(atomic_ops_module.asyncio, "sleep", fake_sleep)
+
+    operations = AtomicOperations(ecd_service, properties)
+    result = asyncio.run(operations.do_script_execute_async({"command": "Write-Output 'async'"}))
+
+    assert result.is_success
+    assert result.browser_use_output == "async"
+    assert len(sleeps) == 2
+    ecd_service.run_command.assert_not_called()
+    ecd_service.get_command_result.assert_not_called()
+
+
+def test_do_script_execute_async_falls_back_to_sync_service(monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace):
+    ecd_service = MagicMock()
+    ecd_service.run_command.return_value = "invoke-sync"
+    ecd_service.get_command_result.return_value = [
+        DesktopCommandResponse(output=None, invocation_status="Failed", dropped=1)
+    ]
+
+    operations = AtomicOperations(ecd_service, properties)
+    result = asyncio.run(operations.do_script_execute_async(BrowserUseRequest(command="exit 1")))
+
+    assert not result.is_success
+    assert result.message == "Failed"
+    ecd_service.run_command.assert_called_once()
+
+
+def test_ensure_request_trusted_dict_skips_validation():
+    trusted = AtomicOperations._ensure_request({"command": "dir", "timeout": 0}, trusted=True)
+
+    assert trusted.command == "dir"
+    assert trusted.timeout == 0
+    with pytest.raises(ValueError):
+        AtomicOperations._ensure_request({"command": "dir", "timeout": 0})
+    with pytest.raises(TypeError):
+        AtomicOperations._ensure_request("dir")
+
+
+def test_do_script_execute_binary_output_returns_raw_bytes(monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace):
+    payload = b"\x89PNG\r\n\x1a\n\x00\xff"
+    ecd_service = MagicMock()
+    ecd_service.run_command.return_value = "invoke-bin"
+    ecd_service.get_command_result.return_value = [
+        DesktopCommandResponse(output=base64.b64encode(payload).decode("ascii"), invocation_status="Success", dropped=0)
+    ]
+    monkeypatch.setattr(atomic_ops_module.time, "sleep", lambda _: None)
+
+    operations = AtomicOperations(ecd_service, properties)
+    result = operations.do_script_execute({"command": "Get-Screenshot", "binaryOutput": True})
+
+    assert result.is_success
+    assert result.browser_use_output == payload
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("Success", "success"), ("FAILED", "failed"), ("running", "running"), ("PartialFailed", "partialfailed")],
+)
+def test_normalize_status_maps_known_spellings(raw: str, expected: str):
+    assert atomic_ops_module._normalize_status(raw) == expected
+
+
+def test_do_script_execute_many_submits_once_and_collects_per_desktop(
+    monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace
+):
+    ok_output = base64.b64encode(b"ok").decode("ascii")
+    ecd_service = MagicMock()
+    ecd_service.run_command.return_value = "invoke-many"
+    ecd_service.get_command_result.side_effect = [
+        [
+            DesktopCommandResponse(output=ok_output, computer_id="desk-a", invocation_status="Running", desktop_status="Success", dropped=0),
+            DesktopCommandResponse(output=None, computer_id="desk-b", invocation_status="Running", desktop_status="Running", dropped=0),
+        ],
+        [
+            DesktopCommandResponse(output=ok_output, computer_id="desk-a", invocation_status="PartialFailed", desktop_status="Success", dropped=0),
+            DesktopCommandResponse(output=None, computer_id="desk-b", invocation_status="PartialFailed", desktop_status="Failed", dropped=2),
+        ],
+    ]
+    monkeypatch.setattr(atomic_ops_module.time, "sleep", lambda _: None)
+
+    operations = AtomicOperations(ecd_service, properties)
+    results = operations.do_script_execute_many({"command": "hostname"}, ["desk-a", "desk-b"])
+
+    assert results["desk-a"].is_success
+    assert results["desk-a"].browser_use_output == "ok"
+    assert not results["desk-b"].is_success
+    assert results["desk-b"].dropped == 2
+    ecd_service.run_command.assert_called_once()
+    assert ecd_service.run_command.call_args.args[0].desktop_id == ["desk-a", "desk-b"]
+    assert ecd_service.get_command_result.call_count == 2
+
+
+def test_do_script_execute_caps_concurrent_invocations(monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace):
+    properties.max_concurrent_invocations = 1
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def run_command(request, endpoint):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(0.05)
+        with lock:
+            active -= 1
+        return "invoke-cap"
+
+    ecd_service = MagicMock()
+    ecd_service.run_command.side_effect = run_command
+    ecd_service.get_command_result.return_value = [
+        DesktopCommandResponse(output=None, invocation_status="Success", dropped=0)
+    ]
+    operations = AtomicOperations(ecd_service, properties)
+
+    workers = [
+        threading.Thread(target=operations.do_script_execute, args=({"command": f"echo {index}"},))
+        for index in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert ecd_service.run_command.call_count == 3
+    assert peak == 1
+
+
+def test_poll_failures_are_rate_limited(
+    monkeypatch: pytest.MonkeyPatch, properties: SimpleNamespace, caplog: pytest.LogCaptureFixture
+):
+    ecd_service = MagicMock()
+    ecd_service.run_command.return_value = "invoke-down"
+    ecd_service.get_command_result.side_effect = ConnectionError("network down")
+
+    class FakeClock:
+        def __init__(self):
+            self.current = 0.0
+
+        def monotonic_ns(self) -> int:
+            return int(self.current * 1e9)
+
+        def sleep(self, seconds: float) -> None:
+            self.current += seconds
+
+    fake_clock = FakeClock()
+    monkeypatch.setattr(atomic_ops_module.time, "sleep", fake_clock.sleep)
+    monkeypatch.setattr(atomic_ops_module.time, "monotonic_ns", fake_clock.monotonic_ns)
+    monkeypatch.setattr(atomic_ops_module.random, "uniform", lambda low, high: low)
+    caplog.set_level("WARNING", logger=atomic_ops_module.__name__)
+
+    operations = AtomicOperations(ecd_service, properties)
+    result = operations.do_script_execute(BrowserUseRequest(command="dir", timeout=2))
+
+    failures = [record for record in caplog.records if "Failed to fetch command result" in record.getMessage()]
+    assert result.message == "Timeout"
+    assert ecd_service.get_command_result.call_count > 10
+    assert 1 <= len(failures) <= 3
+    assert all(record.exc_info is None for record in failures)
+
+
+def test_rate_limited_log_keeps_a_window_per_source(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture):
+    monkeypatch.setattr(time, "monotonic_ns", lambda: 0)
+    caplog.set_level("WARNING", logger="rate-limited-test")
+    log = _RateLimitedLog(logging.getLogger("rate-limited-test"))
+    first, second = MagicMock(), MagicMock()
+
+    for _ in range(3):
+        log.warning(first, "first down")
+        log.warning(second, "second down")
+
+    assert [record.getMessage() for record in caplog.records] == ["first down", "second down"]
+
+def test_ecd_service_poll_failures_are_rate_limited(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    ecd_module = pytest.importorskip("src.ali_agentic_adk_python.extension.web.service.ecd")
+
+    service = object.__new__(ecd_module.EcdService)
+    service.client = MagicMock()
+    service.client.describe_invocations.side_effect = ConnectionError("network down")
+    service.client.describe_invocations_async = AsyncMock(side_effect=ConnectionError("network down"))
+    monkeypatch.setattr(time, "monotonic_ns", lambda: 0)
+    caplog.set_level("WARNING", logger=ecd_module.__name__)
+
+    request = atomic_ops_module.DescribeInvocationsRequest(invoke_id="invoke-down")
+    for _ in range(5):
+        assert service.get_command_result(request) == []
+        assert asyncio.run(service.get_command_result_async(request)) == []
+
+    failures = [record for record in caplog.records if "network down" in record.getMessage()]
+    assert len(failures) == 1
+    assert failures[0].levelname == "WARNING"
+    assert failures[0].exc_info is None
+
+
+def test_invocation_cap_is_shared_per_ecd_service(properties: SimpleNamespace):
+    properties.max_concurrent_invocations = 1
+    ecd_service = MagicMock()
+
+    first = AtomicOperations(ecd_service, properties)
+    second = AtomicOperations(ecd_service, properties)
+    other = AtomicOperations(MagicMock(), properties)
+
+    assert first._invocation_slots is second._invocation_slots
+    assert other._invocation_slots is not first._invocation_slots
+
+
+def test_async_slot_waiters_wake_on_release_and_survive_cancellation():
+    slots = atomic_ops_module._InvocationSlots(1)
+
+    async def scenario():
+        slots.acquire()
+        cancelled = asyncio.create_task(slots.acquire_async())
+        waiting = asyncio.create_task(slots.acquire_async())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        threading.Thread(target=slots.release).start()
+        await asyncio.wait_for(waiting, timeout=1)
+        assert cancelled.cancelled()
+        assert not slots.acquire(blocking=False)
+        slots.release()
+
+    asyncio.run(scenario())
+    assert slots.acquire(blocking=False)
+    slots.release()
+    with pytest.raises(ValueError):
+        slots.release()
@@ -1,20 +1,54 @@
+import asyncio
+import json
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
 import unittest
+from array import array
+from contextlib import closing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from types import SimpleNamespace
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
 
 from ali_agentic_adk_python.core.common.exceptions import EmbeddingProviderError
+from ali_agentic_adk_python.core.embedding import cloudflare_embedding as cloudflare_module
 from ali_agentic_adk_python.core.embedding.cloudflare_embedding import CloudflareEmbedding
 
+REQUESTS_TARGET = "ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests"
+
+
+def _requests_mock():
+    requests_mock = MagicMock()
+    # The provider posts through a pooled session; route it back to the module mock.
+    requests_mock.Session.return_value = requests_mock
+    return requests_mock
+
+
+def _sent_payload(call_kwargs):
+    if "json" in call_kwargs:
+        return call_kwargs["json"]
+    return json.loads(call_kwargs["data"])
+
 
 class CloudflareEmbeddingTestCase(unittest.TestCase):
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_embed_documents_returns_vectors(self, requests_mock):
+    def setUp(self):
+        # Tests that need real HTTP live in CloudflareEmbeddingHttpTestCase.
+        patcher = patch(REQUESTS_TARGET, new_callable=_requests_mock)
+        self.requests_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_embed_documents_returns_vectors(self):
         response_mock = Mock()
         response_mock.json.side_effect = [
-            {"result": {"data": [0.1, 0.2, 0.3]}},
-            {"result": {"data": [0.4, 0.5, 0.6]}},
+            {"result": {"data": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]}},
         ]
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -25,23 +59,167 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         vectors = embedding.embed_documents(["hello", "world"])
 
         self.assertEqual(vectors, [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
-        self.assertEqual(requests_mock.post.call_count, 2)
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+        payload = _sent_payload(self.requests_mock.post.call_args[1])
+        self.assertEqual(payload["text"], ["hello", "world"])
+
+    def test_batch_rejected_falls_back_to_per_item(self):
+        vectors_by_text = {
+            "a": [0.1, 0.2],
+            "b": [0.3, 0.4],
+            "c": [0.5, 0.6],
+            "d": [0.7, 0.8],
+        }
+
+        def fake_post(*args, **kwargs):
+            text = _sent_payload(kwargs)["text"]
+            if isinstance(text, list):
+                return Mock(status_code=400)
+            response = Mock(status_code=200)
+            response.json.return_value = {"result": {"data": vectors_by_text[text]}}
+            return response
+
+        self.requests_mock.post.side_effect = fake_post
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+        )
+
+        first = embedding.embed_documents(["a", "b"])
+        second = embedding.embed_documents(["c", "d"])
+
+        self.assertEqual(first, [[0.1, 0.2], [0.3, 0.4]])
+        self.assertEqual(second, [[0.5, 0.6], [0.7, 0.8]])
+        # The rejected batch is remembered, so the second call goes straight to per-item.
+        self.assertEqual(self.requests_mock.post.call_count, 5)
+        self.assertFalse(embedding._supports_batch)
+
+    def test_per_item_fallback_preserves_order_under_concurrency(self):
+        texts = [f"text-{index}" for index in range(20)]
+        release = threading.Event()
+        arrivals = []
+
+        def fake_post(*args, **kwargs):
+            text = _sent_payload(kwargs)["text"]
+            arrivals.append(text)
+            if text == texts[0]:
+                # Hold the first request until every other one has completed.
+                release.wait(timeout=5)
+            elif len(arrivals) == len(texts):
+                release.set()
+            response = Mock(status_code=200)
+            response.json.return_value = {"result": {"data": [float(texts.index(text))]}}
+            return response
+
+        self.requests_mock.post.side_effect = fake_post
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_missing_api_token_raises(self, requests_mock):
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            max_concurrency=len(texts),
+        )
+        embedding._supports_batch = False
+
+        vectors = embedding.embed_documents(texts)
+
+        self.assertEqual(vectors, [[float(index)] for index in range(len(texts))])
+        self.assertEqual(self.requests_mock.post.call_count, len(texts))
+
+    def test_batches_split_at_max_batch_size(self):
+        def fake_post(*args, **kwargs):
+            texts = _sent_payload(kwargs)["text"]
+            response = Mock()
+            response.json.return_value = {"result": {"data": [[float(text)] for text in texts]}}
+            return response
+
+        self.requests_mock.post.side_effect = fake_post
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            max_batch_size=2,
+        )
+
+        vectors = embedding.embed_documents(["1", "2", "3", "4", "5"])
+
+        self.assertEqual(vectors, [[1.0], [2.0], [3.0], [4.0], [5.0]])
+        sent = [_sent_payload(call.kwargs)["text"] for call in self.requests_mock.post.call_args_list]
+        self.assertEqual(sent, [["1", "2"], ["3", "4"], ["5"]])
+
+    def test_concurrent_batches_preserve_order(self):
+        def fake_post(*args, **kwargs):
+            texts = _sent_payload(kwargs)["text"]
+            # Later batches answer first.
+            time.sleep(0.02 / int(texts[0]))
+            response = Mock()
+            response.json.return_value = {"result": {"data": [[float(text)] for text in texts]}}
+            return response
+
+        self.requests_mock.post.side_effect = fake_post
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            max_batch_size=2,
+            cache_size=0,
+        )
+        texts = [str(index) for index in range(1, 8)]
+
+        first = embedding.embed_documents(texts)
+        second = embedding.embed_documents(texts)
+
+        expected = [[float(text)] for text in texts]
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        self.assertEqual(self.requests_mock.post.call_count, 8)
+
+    def test_concurrent_batch_failure_propagates(self):
+        def fake_post(*args, **kwargs):
+            texts = _sent_payload(kwargs)["text"]
+            response = Mock()
+            if "3" in texts:
+                response.json.return_value = {"error": "failed"}
+            else:
+                response.json.return_value = {"result": {"data": [[0.0] for _ in texts]}}
+            return response
+
+        self.requests_mock.post.side_effect = fake_post
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            max_batch_size=2,
+        )
+
+        with self.assertRaises(EmbeddingProviderError):
+            embedding.embed_documents(["1", "2", "3", "4", "5", "6"])
+
+    def test_batch_response_count_mismatch_raises(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [[0.1, 0.2]]}}
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+        )
+
+        with self.assertRaises(EmbeddingProviderError):
+            embedding.embed_documents(["first", "second"])
+
+    def test_missing_api_token_raises(self):
         with self.assertRaises(ValueError):
             CloudflareEmbedding(api_token=None, account_id="test-account")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_missing_account_id_raises(self, requests_mock):
+    def test_missing_account_id_raises(self):
         with self.assertRaises(ValueError):
             CloudflareEmbedding(api_token="test-token", account_id=None)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_endpoint_no_credentials_required(self, requests_mock):
+    def test_custom_endpoint_no_credentials_required(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             endpoint="https://custom.endpoint.com/embeddings"
@@ -50,11 +228,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         vectors = embedding.embed_documents(["test"])
 
         self.assertEqual(vectors, [[0.1, 0.2]])
-        requests_mock.post.assert_called_once()
+        self.requests_mock.post.assert_called_once()
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_request_exception_wrapped(self, requests_mock):
-        requests_mock.post.side_effect = requests_mock.exceptions.RequestException("Network error")
+    def test_request_exception_wrapped(self):
+        self.requests_mock.post.side_effect = self.requests_mock.exceptions.RequestException("Network error")
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -64,11 +241,38 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_json_decode_error_wrapped(self, requests_mock):
+    def test_json_decode_error_wrapped(self):
         response_mock = Mock()
         response_mock.json.side_effect = ValueError("Invalid JSON")
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+        )
+
+        with self.assertRaises(EmbeddingProviderError):
+            embedding.embed_documents(["test"])
+
+    def test_raw_bytes_response_parsed(self):
+        response_mock = Mock()
+        response_mock.content = b'{"result": {"data": [0.1, 0.2]}}'
+        response_mock.json.side_effect = AssertionError("json() should not be used for raw bytes")
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+        )
+
+        vectors = embedding.embed_documents(["test"])
+
+        self.assertEqual(vectors, [[0.1, 0.2]])
+
+    def test_invalid_raw_bytes_response_wrapped(self):
+        response_mock = Mock()
+        response_mock.content = b"not json"
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -78,11 +282,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_missing_embedding_in_response_raises(self, requests_mock):
+    def test_missing_embedding_in_response_raises(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -92,8 +295,7 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_embed_documents_with_empty_input(self, requests_mock):
+    def test_embed_documents_with_empty_input(self):
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
@@ -102,13 +304,12 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         vectors = embedding.embed_documents([])
 
         self.assertEqual(vectors, [])
-        requests_mock.post.assert_not_called()
+        self.requests_mock.post.assert_not_called()
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_embed_query(self, requests_mock):
+    def test_embed_query(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.7, 0.8, 0.9]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -118,13 +319,375 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         vector = embedding.embed_query("test query")
 
         self.assertEqual(vector, [0.7, 0.8, 0.9])
-        requests_mock.post.assert_called_once()
+        self.requests_mock.post.assert_called_once()
+
+    def test_repeated_query_served_from_cache(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.7, 0.8]}}
+        self.requests_mock.post.return_value = response_mock
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_timeout_parameter(self, requests_mock):
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+
+        first = embedding.embed_query("same")
+        first.append(99.0)
+        second = embedding.embed_query("same")
+
+        self.assertEqual(second, [0.7, 0.8])
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+        info = embedding.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        embedding.cache_clear()
+        embedding.embed_query("same")
+        self.assertEqual(self.requests_mock.post.call_count, 2)
+
+    def test_cache_entries_expire_after_ttl(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.7]}}
+        self.requests_mock.post.return_value = response_mock
+        now = [1000.0]
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            cache_ttl=60,
+        )
+
+        with patch.object(cloudflare_module.time, "monotonic", lambda: now[0]):
+            embedding.embed_query("same")
+            now[0] += 59
+            embedding.embed_query("same")
+            self.assertEqual(self.requests_mock.post.call_count, 1)
+
+            now[0] += 2
+            embedding.embed_query("same")
+
+        self.assertEqual(self.requests_mock.post.call_count, 2)
+        self.assertEqual(embedding.cache_info().misses, 2)
+
+    def test_cache_ttl_applies_to_persistent_cache(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.7]}}
+        self.requests_mock.post.return_value = response_mock
+        now = [1000.0]
+
+        with tempfile.TemporaryDirectory() as cache_dir, patch.object(
+            cloudflare_module.time, "monotonic", lambda: now[0]
+        ), patch.object(cloudflare_module.time, "time", lambda: now[0]):
+            cache_path = os.path.join(cache_dir, "embeddings.sqlite")
+            options = dict(
+                api_token="test-token",
+                account_id="test-account",
+                persistent_cache_path=cache_path,
+                cache_ttl=60,
+            )
+            with CloudflareEmbedding(**options) as first:
+                first.embed_query("same")
+
+            now[0] += 30
+            with CloudflareEmbedding(**options) as second:
+                self.assertEqual(second.embed_query("same"), [0.7])
+                self.assertEqual(self.requests_mock.post.call_count, 1)
+
+                # The row promoted from disk keeps its age, so both tiers expire
+                # 60s after the original write.
+                now[0] += 31
+                second.embed_query("same")
+
+        self.assertEqual(self.requests_mock.post.call_count, 2)
+
+    def test_persistent_rows_without_timestamp_expire_under_ttl(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "embeddings.sqlite")
+            with closing(sqlite3.connect(cache_path)) as connection, connection:
+                connection.execute(
+                    "CREATE TABLE embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+                )
+                connection.execute(
+                    "INSERT INTO embeddings VALUES (?, ?)", ("k", array("d", [1.0]).tobytes())
+                )
+
+            for ttl, expected in ((None, {"k": ([1.0], None)}), (60, {})):
+                cache = cloudflare_module._PersistentEmbeddingCache(cache_path, ttl=ttl)
+                try:
+                    self.assertEqual(cache.get_many(["k"]), expected)
+                finally:
+                    cache.close()
+
+    def test_persistent_cache_trim_counts_rows_not_rowids(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = cloudflare_module._PersistentEmbeddingCache(
+                os.path.join(cache_dir, "embeddings.sqlite"), max_entries=3
+            )
+            try:
+                for key in ("a", "b", "c", "a", "a", "a"):
+                    cache.put_many({key: [1.0]})
+                self.assertEqual(sorted(cache.get_many(["a", "b", "c"])), ["a", "b", "c"])
+
+                cache.put_many({"d": [1.0]})
+                self.assertEqual(sorted(cache.get_many(["a", "b", "c", "d"])), ["a", "c", "d"])
+            finally:
+                cache.close()
+
+    def test_cache_only_fetches_missing_documents(self):
+        first_response = Mock()
+        first_response.json.return_value = {"result": {"data": [0.1, 0.2]}}
+        batch_response = Mock()
+        batch_response.json.return_value = {"result": {"data": [[0.3], [0.4]]}}
+        self.requests_mock.post.side_effect = [first_response, batch_response]
+
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        embedding.embed_documents(["a"])
+        vectors = embedding.embed_documents(["b", "a", "c"])
+
+        self.assertEqual(vectors, [[0.3], [0.1, 0.2], [0.4]])
+        self.assertEqual(_sent_payload(self.requests_mock.post.call_args[1])["text"], ["b", "c"])
+
+    def test_cache_disabled_with_zero_size(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.7]}}
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token", account_id="test-account", cache_size=0
+        )
+        embedding.embed_query("same")
+        embedding.embed_query("same")
+
+        self.assertEqual(self.requests_mock.post.call_count, 2)
+        self.assertEqual(embedding.cache_info().currsize, 0)
+
+    def test_concurrent_queries_coalesced_into_one_request(self):
+        def fake_post(*args, **kwargs):
+            texts = _sent_payload(kwargs)["text"]
+            response = Mock()
+            response.json.return_value = {
+                "result": {"data": [[float(text[-1])] for text in texts]}
+            }
+            return response
+
+        self.requests_mock.post.side_effect = fake_post
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            coalesce_queries=True,
+            max_batch_size=4,
+            max_batch_wait_ms=5000,
+        )
+        results = {}
+
+        def query(index):
+            results[index] = embedding.embed_query(f"query-{index}")
+
+        threads = [threading.Thread(target=query, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        embedding.close()
+
+        self.assertEqual(results, {index: [float(index)] for index in range(4)})
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+        self.assertEqual(sorted(_sent_payload(self.requests_mock.post.call_args[1])["text"]),
+                         [f"query-{index}" for index in range(4)])
+
+    def test_coalesced_query_propagates_errors(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"error": "failed"}
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            coalesce_queries=True,
+            max_batch_wait_ms=1,
+        )
+        try:
+            with self.assertRaises(EmbeddingProviderError):
+                embedding.embed_query("test")
+        finally:
+            embedding.close()
+
+        # After close, queries go straight to the provider again.
+        response_mock.json.return_value = {"result": {"data": [0.5]}}
+        self.assertEqual(embedding.embed_query("test"), [0.5])
+
+    def test_request_body_serialized_with_orjson_when_available(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.1]}}
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        embedding.embed_documents(["你好"])
+
+        call_kwargs = self.requests_mock.post.call_args[1]
+        self.assertNotIn("json", call_kwargs)
+        self.assertIsInstance(call_kwargs["data"], bytes)
+        self.assertEqual(json.loads(call_kwargs["data"]), {"text": "你好"})
+
+        with patch.object(cloudflare_module, "orjson", None):
+            embedding.embed_documents(["fallback"])
+
+        self.assertEqual(self.requests_mock.post.call_args[1]["json"], {"text": "fallback"})
+
+    def test_matching_extractor_reused_for_later_responses(self):
+        response_mock = Mock()
+        response_mock.json.side_effect = [
+            {"data": [{"embedding": [0.1]}]},
+            {"data": [{"embedding": [0.2]}]},
+            {"vector": [0.3]},
+        ]
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        self.assertEqual(embedding.embed_query("first"), [0.1])
+        self.assertIs(embedding._cached_extractor, cloudflare_module._from_data)
+
+        with patch.object(cloudflare_module, "_SINGLE_VECTOR_EXTRACTORS", ()):
+            self.assertEqual(embedding.embed_query("second"), [0.2])
+
+        # A different shape falls back to the full chain and re-caches.
+        self.assertEqual(embedding.embed_query("third"), [0.3])
+        self.assertIs(embedding._cached_extractor, cloudflare_module._from_embedding_key)
+
+    def test_duplicate_inputs_embedded_once(self):
+        def fake_post(*args, **kwargs):
+            text = _sent_payload(kwargs)["text"]
+            response = Mock()
+            response.json.return_value = {"result": {"data": [float(ord(text))]}}
+            return response
+
+        self.requests_mock.post.side_effect = fake_post
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            cache_size=0,
+        )
+        embedding._supports_batch = False
+
+        vectors = embedding.embed_documents(["a", "b", "a"])
+
+        self.assertEqual(vectors, [[97.0], [98.0], [97.0]])
+        self.assertIsNot(vectors[0], vectors[2])
+        self.assertEqual(self.requests_mock.post.call_count, 2)
+
+    def test_duplicate_inputs_removed_from_batch(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [[0.1], [0.2]]}}
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+
+        vectors = embedding.embed_documents(["x", "y", "x", "y"])
+
+        self.assertEqual(vectors, [[0.1], [0.2], [0.1], [0.2]])
+        self.assertEqual(_sent_payload(self.requests_mock.post.call_args[1])["text"], ["x", "y"])
+
+    def test_persistent_cache_survives_new_instance(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [[0.1, -0.2], [1e-7, 3.5]]}}
+        self.requests_mock.post.return_value = response_mock
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "embeddings.sqlite")
+            with CloudflareEmbedding(
+                api_token="test-token",
+                account_id="test-account",
+                persistent_cache_path=cache_path,
+            ) as first:
+                expected = first.embed_documents(["alpha", "beta"])
+
+            with CloudflareEmbedding(
+                api_token="test-token",
+                account_id="test-account",
+                persistent_cache_path=cache_path,
+            ) as second:
+                reloaded = second.embed_documents(["beta", "alpha"])
+
+        self.assertEqual(reloaded, [expected[1], expected[0]])
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+
+    def test_int8_quantization_round_trip_error_is_small(self):
+        rng = random.Random(7)
+        raw = [rng.gauss(0.0, 1.0) for _ in range(1536)]
+        norm = math.sqrt(sum(component * component for component in raw))
+        vector = [component / norm for component in raw]
+
+        restored = cloudflare_module._dequantize_int8(*cloudflare_module._quantize_int8(vector))
+
+        self.assertEqual(len(restored), len(vector))
+        self.assertLess(max(abs(a - b) for a, b in zip(vector, restored)), 1e-2)
+        self.assertEqual(
+            cloudflare_module._dequantize_int8(*cloudflare_module._quantize_int8([0.0, 0.0])),
+            [0.0, 0.0],
+        )
+
+    def test_quantized_caches_return_approximate_vectors(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.5, -0.25, 0.125]}}
+        self.requests_mock.post.return_value = response_mock
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "embeddings.sqlite")
+            with CloudflareEmbedding(
+                api_token="test-token",
+                account_id="test-account",
+                persistent_cache_path=cache_path,
+                quantize_cache=True,
+            ) as first:
+                exact = first.embed_query("text")
+                from_memory = first.embed_query("text")
+
+            with CloudflareEmbedding(
+                api_token="test-token",
+                account_id="test-account",
+                persistent_cache_path=cache_path,
+                quantize_cache=True,
+            ) as second:
+                from_disk = second.embed_query("text")
+
+        self.assertEqual(exact, [0.5, -0.25, 0.125])
+        for cached in (from_memory, from_disk):
+            for expected, actual in zip(exact, cached):
+                self.assertAlmostEqual(expected, actual, delta=0.5 / 127)
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+
+    def test_array_return_type_yields_float32_buffers(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [[0.5, 0.25], [1.0, -2.0]]}}
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            return_type="array",
+        )
+
+        vectors = embedding.embed_documents(["a", "b"])
+        cached = embedding.embed_query("a")
+
+        for vector in (*vectors, cached):
+            self.assertEqual(vector.typecode, "f")
+        self.assertEqual([list(vector) for vector in vectors], [[0.5, 0.25], [1.0, -2.0]])
+        self.assertEqual(list(cached), [0.5, 0.25])
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+
+    def test_invalid_return_type_rejected(self):
+        with self.assertRaises(ValueError):
+            CloudflareEmbedding(api_token="test-token", account_id="test-account", return_type="tuple")
+
+        with patch.object(cloudflare_module, "numpy", None):
+            with self.assertRaises(ImportError):
+                CloudflareEmbedding(
+                    api_token="test-token", account_id="test-account", return_type="numpy"
+                )
+
+    def test_custom_timeout_parameter(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -134,14 +697,13 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         self.assertEqual(call_kwargs["timeout"], 30.0)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_timeout_tuple_parameter(self, requests_mock):
+    def test_custom_timeout_tuple_parameter(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -151,14 +713,13 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         self.assertEqual(call_kwargs["timeout"], (10.0, 30.0))
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_headers_parameter(self, requests_mock):
+    def test_custom_headers_parameter(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         custom_headers = {"X-Custom-Header": "custom-value"}
         embedding = CloudflareEmbedding(
@@ -169,15 +730,14 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         headers = call_kwargs["headers"]
         self.assertEqual(headers["X-Custom-Header"], "custom-value")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_request_options_parameter(self, requests_mock):
+    def test_custom_request_options_parameter(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         request_options = {"extra_param": "extra_value"}
         embedding = CloudflareEmbedding(
@@ -188,15 +748,14 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
-        payload = call_kwargs["json"]
+        call_kwargs = self.requests_mock.post.call_args[1]
+        payload = _sent_payload(call_kwargs)
         self.assertEqual(payload["extra_param"], "extra_value")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_embedding_key(self, requests_mock):
+    def test_response_with_embedding_key(self):
         response_mock = Mock()
         response_mock.json.return_value = {"embedding": [1.0, 2.0, 3.0]}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -207,11 +766,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[1.0, 2.0, 3.0]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_vector_key(self, requests_mock):
+    def test_response_with_vector_key(self):
         response_mock = Mock()
         response_mock.json.return_value = {"vector": [4.0, 5.0]}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -222,11 +780,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[4.0, 5.0]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_result_list_format(self, requests_mock):
+    def test_response_with_result_list_format(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": [1.1, 2.2, 3.3]}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -237,11 +794,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[1.1, 2.2, 3.3]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_data_list_format(self, requests_mock):
+    def test_response_with_data_list_format(self):
         response_mock = Mock()
         response_mock.json.return_value = {"data": [0.5, 0.6, 0.7]}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -252,11 +808,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[0.5, 0.6, 0.7]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_data_dict_array_format(self, requests_mock):
+    def test_response_with_data_dict_array_format(self):
         response_mock = Mock()
         response_mock.json.return_value = {"data": [{"embedding": [0.1, 0.2]}]}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -267,11 +822,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[0.1, 0.2]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_data_dict_vector_key_format(self, requests_mock):
+    def test_response_with_data_dict_vector_key_format(self):
         response_mock = Mock()
         response_mock.json.return_value = {"data": [{"vector": [0.3, 0.4]}]}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -282,11 +836,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[0.3, 0.4]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_as_list_format(self, requests_mock):
+    def test_response_as_list_format(self):
         response_mock = Mock()
         response_mock.json.return_value = [0.8, 0.9, 1.0]
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -297,11 +850,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[0.8, 0.9, 1.0]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_nested_data_array(self, requests_mock):
+    def test_response_with_nested_data_array(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [[0.1, 0.2, 0.3]]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -312,11 +864,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[0.1, 0.2, 0.3]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_result_embedding_key(self, requests_mock):
+    def test_response_with_result_embedding_key(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"embedding": [0.5, 0.6]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -327,11 +878,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[0.5, 0.6]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_non_numeric_vector_raises(self, requests_mock):
+    def test_non_numeric_vector_raises(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": ["invalid", "data"]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -341,11 +891,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_vector_type_coercion(self, requests_mock):
+    def test_vector_type_coercion(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [1, 2, 3]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -359,15 +908,12 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         self.assertIsInstance(vectors[0][1], float)
         self.assertIsInstance(vectors[0][2], float)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_multiple_documents_with_different_lengths(self, requests_mock):
+    def test_multiple_documents_with_different_lengths(self):
         response_mock = Mock()
         response_mock.json.side_effect = [
-            {"result": {"data": [0.1, 0.2]}},
-            {"result": {"data": [0.3, 0.4, 0.5]}},
-            {"result": {"data": [0.6]}},
+            {"result": {"data": [[0.1, 0.2], [0.3, 0.4, 0.5], [0.6]]}},
         ]
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -381,11 +927,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         self.assertEqual(vectors[1], [0.3, 0.4, 0.5])
         self.assertEqual(vectors[2], [0.6])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_single_document_embedding(self, requests_mock):
+    def test_single_document_embedding(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -395,13 +940,12 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         vectors = embedding.embed_documents(["single document"])
 
         self.assertEqual(vectors, [[0.1, 0.2]])
-        requests_mock.post.assert_called_once()
+        self.requests_mock.post.assert_called_once()
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_model_parameter(self, requests_mock):
+    def test_custom_model_parameter(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -412,11 +956,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         self.assertEqual(embedding._model, "baai/bge-large-en-v1.5")
         self.assertIn("bge-large", embedding._endpoint)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_http_status_error_wrapped(self, requests_mock):
+    def test_http_status_error_wrapped(self):
         response_mock = Mock()
-        response_mock.raise_for_status.side_effect = requests_mock.exceptions.HTTPError("400 Bad Request")
-        requests_mock.post.return_value = response_mock
+        response_mock.raise_for_status.side_effect = self.requests_mock.exceptions.HTTPError("400 Bad Request")
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -426,9 +969,8 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_connection_error_wrapped(self, requests_mock):
-        requests_mock.post.side_effect = requests_mock.exceptions.ConnectionError("Connection failed")
+    def test_connection_error_wrapped(self):
+        self.requests_mock.post.side_effect = self.requests_mock.exceptions.ConnectionError("Connection failed")
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -438,9 +980,8 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_timeout_error_wrapped(self, requests_mock):
-        requests_mock.post.side_effect = requests_mock.exceptions.Timeout("Request timed out")
+    def test_timeout_error_wrapped(self):
+        self.requests_mock.post.side_effect = self.requests_mock.exceptions.Timeout("Request timed out")
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -450,11 +991,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_none_payload(self, requests_mock):
+    def test_response_with_none_payload(self):
         response_mock = Mock()
         response_mock.json.return_value = None
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -464,11 +1004,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_empty_result_dict(self, requests_mock):
+    def test_empty_result_dict(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -478,11 +1017,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_empty_data_list(self, requests_mock):
+    def test_empty_data_list(self):
         response_mock = Mock()
         response_mock.json.return_value = {"data": []}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -492,11 +1030,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_normalize_inputs_filters_none(self, requests_mock):
+    def test_normalize_inputs_filters_none(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -506,13 +1043,12 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         vectors = embedding.embed_documents([None, "test", None])
 
         self.assertEqual(len(vectors), 1)
-        requests_mock.post.assert_called_once()
+        self.requests_mock.post.assert_called_once()
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_endpoint_construction_with_account_and_model(self, requests_mock):
+    def test_endpoint_construction_with_account_and_model(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -523,14 +1059,13 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         embedding.embed_documents(["test"])
 
         expected_endpoint = "https://api.cloudflare.com/client/v4/accounts/account123/ai/run/@cf/baai/bge-small-en-v1.5"
-        call_args = requests_mock.post.call_args[0]
+        call_args = self.requests_mock.post.call_args[0]
         self.assertEqual(call_args[0], expected_endpoint)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_authorization_header_construction(self, requests_mock):
+    def test_authorization_header_construction(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="my-secret-token",
@@ -539,15 +1074,14 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         headers = call_kwargs["headers"]
         self.assertEqual(headers["Authorization"], "Bearer my-secret-token")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_content_type_header(self, requests_mock):
+    def test_content_type_header(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -556,15 +1090,14 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         headers = call_kwargs["headers"]
         self.assertEqual(headers["Content-Type"], "application/json")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_payload_structure(self, requests_mock):
+    def test_payload_structure(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -573,12 +1106,11 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["hello world"])
 
-        call_kwargs = requests_mock.post.call_args[1]
-        payload = call_kwargs["json"]
+        call_kwargs = self.requests_mock.post.call_args[1]
+        payload = _sent_payload(call_kwargs)
         self.assertEqual(payload["text"], "hello world")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_model_property(self, requests_mock):
+    def test_model_property(self):
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
@@ -587,11 +1119,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(embedding.model, "custom-model")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_multiple_headers_merged(self, requests_mock):
+    def test_multiple_headers_merged(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         custom_headers = {
             "X-Custom-1": "value1",
@@ -605,17 +1136,16 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         headers = call_kwargs["headers"]
         self.assertEqual(headers["X-Custom-1"], "value1")
         self.assertEqual(headers["X-Custom-2"], "value2")
         self.assertIn("Authorization", headers)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_request_options_merged_with_payload(self, requests_mock):
+    def test_request_options_merged_with_payload(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         request_options = {
             "option1": "value1",
@@ -629,17 +1159,16 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
-        payload = call_kwargs["json"]
+        call_kwargs = self.requests_mock.post.call_args[1]
+        payload = _sent_payload(call_kwargs)
         self.assertEqual(payload["option1"], "value1")
         self.assertEqual(payload["option2"], 123)
         self.assertEqual(payload["text"], "test")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_request_options_do_not_mutate_original(self, requests_mock):
+    def test_request_options_do_not_mutate_original(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         original_options = {"option1": "value1"}
         embedding = CloudflareEmbedding(
@@ -653,12 +1182,11 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         self.assertEqual(original_options, {"option1": "value1"})
         self.assertNotIn("text", original_options)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_large_vector_dimensions(self, requests_mock):
+    def test_large_vector_dimensions(self):
         response_mock = Mock()
         large_vector = [0.1] * 1536
         response_mock.json.return_value = {"result": {"data": large_vector}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -670,11 +1198,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         self.assertEqual(len(vectors[0]), 1536)
         self.assertEqual(vectors[0], [0.1] * 1536)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_unicode_text_handling(self, requests_mock):
+    def test_unicode_text_handling(self):
         response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        response_mock.json.return_value = {"result": {"data": [[0.1, 0.2], [0.1, 0.2]]}}
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -684,13 +1211,12 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         vectors = embedding.embed_documents(["你好世界", "🚀🌟"])
 
         self.assertEqual(len(vectors), 2)
-        self.assertEqual(requests_mock.post.call_count, 2)
+        self.assertEqual(self.requests_mock.post.call_count, 1)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_empty_string_handling(self, requests_mock):
+    def test_empty_string_handling(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -699,160 +1225,116 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         vectors = embedding.embed_documents(["", "test"])
 
-        self.assertEqual(len(vectors), 2)
-        self.assertEqual(requests_mock.post.call_count, 2)
-
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_whitespace_only_text(self, requests_mock):
-        response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.assertEqual(vectors[-1], [0.1, 0.2])
+        self.assertEqual(vectors[:-1], [[0.0, 0.0]] * 1)
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+        self.assertEqual(_sent_payload(self.requests_mock.post.call_args[1])["text"], "test")
 
+    def test_blank_only_input_uses_configured_dimension(self):
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
+            embedding_dim=3,
         )
 
-        vectors = embedding.embed_documents(["   ", "\n\t", "test"])
+        self.assertEqual(embedding.embed_documents(["", " "]), [[0.0] * 3, [0.0] * 3])
+        self.requests_mock.post.assert_not_called()
 
-        self.assertEqual(len(vectors), 3)
-        self.assertEqual(requests_mock.post.call_count, 3)
-
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_very_long_text(self, requests_mock):
+    def test_blank_input_sent_when_skipping_disabled(self):
         response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        response_mock.json.return_value = {"result": {"data": [[0.3], [0.4]]}}
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
+            skip_blank=False,
         )
 
-        long_text = "word " * 10000
-        vectors = embedding.embed_documents([long_text])
-
-        self.assertEqual(len(vectors), 1)
-        call_kwargs = requests_mock.post.call_args[1]
-        payload = call_kwargs["json"]
-        self.assertEqual(payload["text"], long_text)
+        self.assertEqual(embedding.embed_documents(["", "test"]), [[0.3], [0.4]])
+        self.assertEqual(_sent_payload(self.requests_mock.post.call_args[1])["text"], ["", "test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_special_characters_in_text(self, requests_mock):
+    def test_whitespace_only_text(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
         )
 
-        special_text = "test@#$%^&*()[]{}|\\<>?/~`"
-        vectors = embedding.embed_documents([special_text])
-
-        self.assertEqual(len(vectors), 1)
-
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_float_strings(self, requests_mock):
-        response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": ["0.1", "0.2", "0.3"]}}
-        requests_mock.post.return_value = response_mock
-
-        embedding = CloudflareEmbedding(
-            api_token="test-token",
-            account_id="test-account",
-        )
-
-        vectors = embedding.embed_documents(["test"])
-
-        self.assertEqual(vectors, [[0.1, 0.2, 0.3]])
-
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_mixed_numeric_types(self, requests_mock):
-        response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [1, 2.5, "3.7"]}}
-        requests_mock.post.return_value = response_mock
-
-        embedding = CloudflareEmbedding(
-            api_token="test-token",
-            account_id="test-account",
-        )
-
-        vectors = embedding.embed_documents(["test"])
+        vectors = embedding.embed_documents(["   ", "\n\t", "test"])
 
-        self.assertEqual(vectors, [[1.0, 2.5, 3.7]])
+        self.assertEqual(vectors[-1], [0.1, 0.2])
+        self.assertEqual(vectors[:-1], [[0.0, 0.0]] * 2)
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+        self.assertEqual(_sent_payload(self.requests_mock.post.call_args[1])["text"], "test")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_negative_values(self, requests_mock):
+    def test_very_long_text(self):
         response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [-0.5, -1.2, 0.3]}}
-        requests_mock.post.return_value = response_mock
+        response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
         )
 
-        vectors = embedding.embed_documents(["test"])
+        long_text = "word " * 10000
+        vectors = embedding.embed_documents([long_text])
 
-        self.assertEqual(vectors, [[-0.5, -1.2, 0.3]])
+        self.assertEqual(len(vectors), 1)
+        call_kwargs = self.requests_mock.post.call_args[1]
+        payload = _sent_payload(call_kwargs)
+        self.assertEqual(payload["text"], long_text)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_zero_values(self, requests_mock):
+    def test_special_characters_in_text(self):
         response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [0, 0.0, 0]}}
-        requests_mock.post.return_value = response_mock
+        response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
         )
 
-        vectors = embedding.embed_documents(["test"])
+        special_text = "test@#$%^&*()[]{}|\\<>?/~`"
+        vectors = embedding.embed_documents([special_text])
 
-        self.assertEqual(vectors, [[0.0, 0.0, 0.0]])
+        self.assertEqual(len(vectors), 1)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_very_small_values(self, requests_mock):
+    def test_response_values_coerced_to_floats(self):
+        cases = {
+            "float_strings": (["0.1", "0.2", "0.3"], [0.1, 0.2, 0.3]),
+            "mixed_numeric_types": ([1, 2.5, "3.7"], [1.0, 2.5, 3.7]),
+            "negative_values": ([-0.5, -1.2, 0.3], [-0.5, -1.2, 0.3]),
+            "zero_values": ([0, 0.0, 0], [0.0, 0.0, 0.0]),
+            "very_small_values": ([1e-10, 1e-15, 1e-20], [1e-10, 1e-15, 1e-20]),
+            "very_large_values": ([1e10, 1e15, 1e20], [1e10, 1e15, 1e20]),
+        }
         response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [1e-10, 1e-15, 1e-20]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
-        embedding = CloudflareEmbedding(
-            api_token="test-token",
-            account_id="test-account",
-        )
+        for name, (data, expected) in cases.items():
+            with self.subTest(name):
+                response_mock.json.return_value = {"result": {"data": data}}
+                embedding = CloudflareEmbedding(
+                    api_token="test-token",
+                    account_id="test-account",
+                )
 
-        vectors = embedding.embed_documents(["test"])
+                vectors = embedding.embed_documents(["test"])
 
-        self.assertEqual(len(vectors[0]), 3)
-        self.assertAlmostEqual(vectors[0][0], 1e-10)
+                self.assertEqual(vectors, [expected])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_very_large_values(self, requests_mock):
-        response_mock = Mock()
-        response_mock.json.return_value = {"result": {"data": [1e10, 1e15, 1e20]}}
-        requests_mock.post.return_value = response_mock
-
-        embedding = CloudflareEmbedding(
-            api_token="test-token",
-            account_id="test-account",
-        )
-
-        vectors = embedding.embed_documents(["test"])
-
-        self.assertEqual(len(vectors[0]), 3)
-        self.assertAlmostEqual(vectors[0][0], 1e10)
-
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_sequential_calls_maintain_state(self, requests_mock):
+    def test_sequential_calls_maintain_state(self):
         response_mock = Mock()
         response_mock.json.side_effect = [
             {"result": {"data": [0.1, 0.2]}},
             {"result": {"data": [0.3, 0.4]}},
         ]
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -864,13 +1346,12 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors1, [[0.1, 0.2]])
         self.assertEqual(vectors2, [[0.3, 0.4]])
-        self.assertEqual(requests_mock.post.call_count, 2)
+        self.assertEqual(self.requests_mock.post.call_count, 2)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_embed_query_with_none_result(self, requests_mock):
+    def test_embed_query_with_none_result(self):
         response_mock = Mock()
         response_mock.json.return_value = {}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -880,8 +1361,7 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_query("test")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_default_model(self, requests_mock):
+    def test_default_model(self):
         embedding = CloudflareEmbedding(
             api_token="test-token",
             account_id="test-account",
@@ -889,11 +1369,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(embedding.model, "baai/bge-base-en-v1.5")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_endpoint_overrides_default_construction(self, requests_mock):
+    def test_custom_endpoint_overrides_default_construction(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         custom_endpoint = "https://my-custom-endpoint.com/embed"
         embedding = CloudflareEmbedding(
@@ -904,14 +1383,13 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_args = requests_mock.post.call_args[0]
+        call_args = self.requests_mock.post.call_args[0]
         self.assertEqual(call_args[0], custom_endpoint)
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_none_timeout_parameter(self, requests_mock):
+    def test_none_timeout_parameter(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -921,14 +1399,13 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         self.assertIsNone(call_kwargs["timeout"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_headers_not_mutated_by_custom_headers(self, requests_mock):
+    def test_headers_not_mutated_by_custom_headers(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         custom_headers = {"X-Custom": "value"}
         embedding = CloudflareEmbedding(
@@ -940,19 +1417,18 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         embedding.embed_documents(["test"])
 
         self.assertEqual(custom_headers, {"X-Custom": "value"})
+        with self.assertRaises(TypeError):
+            embedding._headers["X-Custom"] = "changed"
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_empty_account_id_raises(self, requests_mock):
+    def test_empty_account_id_raises(self):
         with self.assertRaises(ValueError):
             CloudflareEmbedding(api_token="test-token", account_id="")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_empty_api_token_raises(self, requests_mock):
+    def test_empty_api_token_raises(self):
         with self.assertRaises(ValueError):
             CloudflareEmbedding(api_token="", account_id="test-account")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_extract_embedding_with_complex_nesting(self, requests_mock):
+    def test_extract_embedding_with_complex_nesting(self):
         response_mock = Mock()
         response_mock.json.return_value = {
             "result": {
@@ -961,7 +1437,7 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
                 ]
             }
         }
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -972,11 +1448,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         self.assertEqual(vectors, [[0.1, 0.2, 0.3]])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_response_with_success_false(self, requests_mock):
+    def test_response_with_success_false(self):
         response_mock = Mock()
         response_mock.json.return_value = {"success": False, "error": "Something went wrong"}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -986,14 +1461,12 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         with self.assertRaises(EmbeddingProviderError):
             embedding.embed_documents(["test"])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_batch_processing_with_mixed_results(self, requests_mock):
+    def test_batch_processing_with_mixed_results(self):
         response_mock = Mock()
         response_mock.json.side_effect = [
-            {"result": {"data": [0.1, 0.2]}},
-            {"error": "failed"},
+            {"result": {"data": [[0.1, 0.2], {"error": "failed"}]}},
         ]
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -1006,11 +1479,10 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
         except EmbeddingProviderError:
             pass
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_custom_endpoint_with_trailing_slash(self, requests_mock):
+    def test_custom_endpoint_with_trailing_slash(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             endpoint="https://custom.endpoint.com/embed/"
@@ -1018,14 +1490,13 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_args = requests_mock.post.call_args[0]
+        call_args = self.requests_mock.post.call_args[0]
         self.assertEqual(call_args[0], "https://custom.endpoint.com/embed/")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_model_in_endpoint_construction(self, requests_mock):
+    def test_model_in_endpoint_construction(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -1035,14 +1506,13 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_args = requests_mock.post.call_args[0]
+        call_args = self.requests_mock.post.call_args[0]
         self.assertIn("custom/model-v2", call_args[0])
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_header_override_authorization(self, requests_mock):
+    def test_header_override_authorization(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="original-token",
@@ -1052,15 +1522,14 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         headers = call_kwargs["headers"]
         self.assertEqual(headers["Authorization"], "Bearer override-token")
 
-    @patch("ali_agentic_adk_python.core.embedding.cloudflare_embedding.requests")
-    def test_header_override_content_type(self, requests_mock):
+    def test_header_override_content_type(self):
         response_mock = Mock()
         response_mock.json.return_value = {"result": {"data": [0.1, 0.2]}}
-        requests_mock.post.return_value = response_mock
+        self.requests_mock.post.return_value = response_mock
 
         embedding = CloudflareEmbedding(
             api_token="test-token",
@@ -1070,11 +1539,271 @@ class CloudflareEmbeddingTestCase(unittest.TestCase):
 
         embedding.embed_documents(["test"])
 
-        call_kwargs = requests_mock.post.call_args[1]
+        call_kwargs = self.requests_mock.post.call_args[1]
         headers = call_kwargs["headers"]
         self.assertEqual(headers["Content-Type"], "text/plain")
 
 
+    def test_session_reused_with_pooled_retrying_adapter(self):
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.1]}}
+        self.requests_mock.post.return_value = response_mock
+
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        embedding.embed_documents(["first"])
+        embedding.embed_documents(["second"])
+
+        self.requests_mock.Session.assert_called_once_with()
+        mounted = {call.args[0]: call.args[1] for call in self.requests_mock.mount.call_args_list}
+        self.assertEqual(set(mounted), {"http://", "https://"})
+        adapter = mounted["https://"]
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter.max_retries.backoff_factor, 0.25)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertEqual(self.requests_mock.post.call_count, 2)
+
+    def test_injected_session_is_used_and_left_open(self):
+        session = MagicMock()
+        response_mock = Mock()
+        response_mock.json.return_value = {"result": {"data": [0.1]}}
+        session.post.return_value = response_mock
+
+        with CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            session=session,
+        ) as embedding:
+            self.assertEqual(embedding.embed_query("test"), [0.1])
+
+        session.post.assert_called_once()
+        session.close.assert_not_called()
+        self.requests_mock.Session.assert_not_called()
+
+    def test_context_manager_closes_session(self):
+        with CloudflareEmbedding(api_token="test-token", account_id="test-account") as embedding:
+            self.assertIsInstance(embedding, CloudflareEmbedding)
+
+        self.requests_mock.close.assert_called_once_with()
+
+    def _mock_async_client(self, embedding, handler):
+        requests_seen = []
+
+        def recording_handler(request):
+            requests_seen.append(json.loads(request.content))
+            return handler(request)
+
+        transport = httpx.MockTransport(recording_handler)
+        embedding._create_async_client = lambda: httpx.AsyncClient(transport=transport)
+        return requests_seen
+
+    def test_embed_documents_async_batches_with_httpx(self):
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        requests_seen = self._mock_async_client(
+            embedding,
+            lambda request: httpx.Response(
+                200, json={"result": {"data": [[0.1, 0.2], [0.3, 0.4]]}}
+            ),
+        )
+
+        async def run_test():
+            try:
+                return await embedding.embed_documents_async(["hello", "world"])
+            finally:
+                await embedding.aclose()
+
+        vectors = asyncio.run(run_test())
+
+        self.assertEqual(vectors, [[0.1, 0.2], [0.3, 0.4]])
+        self.assertEqual(requests_seen, [{"text": ["hello", "world"]}])
+
+    def test_embed_query_async_uses_httpx_client(self):
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        requests_seen = self._mock_async_client(
+            embedding,
+            lambda request: httpx.Response(200, json={"result": {"data": [0.5, 0.6]}}),
+        )
+
+        vector = asyncio.run(embedding.embed_query_async("hello"))
+
+        self.assertEqual(vector, [0.5, 0.6])
+        self.assertEqual(requests_seen, [{"text": "hello"}])
+
+    def test_close_releases_async_client_of_each_loop(self):
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        self._mock_async_client(
+            embedding,
+            lambda request: httpx.Response(200, json={"result": {"data": [0.5, 0.6]}}),
+        )
+        loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+        try:
+            clients = []
+            for loop in loops:
+                loop.run_until_complete(embedding.embed_query_async(f"hello {len(clients)}"))
+                clients.append(embedding._async_clients[loop])
+
+            embedding.close()
+
+            self.assertIsNot(clients[0], clients[1])
+            self.assertTrue(all(client.is_closed for client in clients))
+            self.assertEqual(len(embedding._async_clients), 0)
+        finally:
+            for loop in loops:
+                loop.close()
+
+    def test_async_client_enables_http2_when_available(self):
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+
+        with patch.object(cloudflare_module, "_HTTP2_AVAILABLE", True), patch.object(
+            cloudflare_module.httpx, "AsyncClient"
+        ) as client_cls:
+            embedding._create_async_client()
+        self.assertTrue(client_cls.call_args.kwargs["http2"])
+
+        with patch.object(cloudflare_module, "_HTTP2_AVAILABLE", False), patch.object(
+            cloudflare_module.httpx, "AsyncClient"
+        ) as client_cls:
+            embedding._create_async_client()
+        self.assertFalse(client_cls.call_args.kwargs["http2"])
+
+    def test_async_client_pool_is_sized_from_max_concurrency(self):
+        embedding = CloudflareEmbedding(
+            api_token="test-token", account_id="test-account", max_concurrency=4
+        )
+
+        with patch.object(cloudflare_module.httpx, "AsyncClient") as client_cls:
+            embedding._create_async_client()
+
+        limits = client_cls.call_args.kwargs["limits"]
+        self.assertEqual(limits.max_connections, 4)
+        self.assertEqual(limits.max_keepalive_connections, 4)
+
+    def test_embed_documents_async_falls_back_to_gathered_requests(self):
+        vectors_by_text = {"a": [1.0], "b": [2.0], "c": [3.0]}
+
+        def handler(request):
+            text = json.loads(request.content)["text"]
+            if isinstance(text, list):
+                return httpx.Response(400, json={"errors": ["batch unsupported"]})
+            return httpx.Response(200, json={"result": {"data": vectors_by_text[text]}})
+
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        requests_seen = self._mock_async_client(embedding, handler)
+
+        vectors = asyncio.run(embedding.embed_documents_async(["a", "b", "c"]))
+
+        self.assertEqual(vectors, [[1.0], [2.0], [3.0]])
+        self.assertEqual(len(requests_seen), 4)
+        self.assertFalse(embedding._supports_batch)
+
+    def test_embed_documents_async_hedges_stalled_request(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+                return httpx.Response(200, json={"result": {"data": [9.0]}})
+            return httpx.Response(200, json={"result": {"data": [1.0]}})
+
+        embedding = CloudflareEmbedding(
+            api_token="test-token",
+            account_id="test-account",
+            hedge_delay=0.01,
+        )
+        transport = httpx.MockTransport(handler)
+        embedding._create_async_client = lambda: httpx.AsyncClient(transport=transport)
+
+        vectors = asyncio.run(asyncio.wait_for(embedding.embed_documents_async(["slow"]), 2))
+
+        self.assertEqual(vectors, [[1.0]])
+        self.assertEqual(len(calls), 2)
+
+    def test_hedge_budget_limits_duplicate_requests(self):
+        budget = cloudflare_module._HedgeBudget(0.05)
+
+        self.assertTrue(budget.try_spend())
+        self.assertFalse(budget.try_spend())
+        for _ in range(25):
+            budget.record_request()
+        self.assertTrue(budget.try_spend())
+        self.assertFalse(budget.try_spend())
+
+    def test_embed_documents_async_wraps_http_errors(self):
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        self._mock_async_client(embedding, lambda request: httpx.Response(400))
+
+        with self.assertRaises(EmbeddingProviderError):
+            asyncio.run(embedding.embed_documents_async(["test"]))
+
+    def test_embed_documents_async_retries_transient_errors(self):
+        embedding = CloudflareEmbedding(api_token="test-token", account_id="test-account")
+        responses = [
+            httpx.Response(503),
+            httpx.Response(503, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"result": {"data": [[0.1, 0.2]]}}),
+        ]
+        requests_seen = self._mock_async_client(embedding, lambda request: responses.pop(0))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            vectors = asyncio.run(embedding.embed_documents_async(["hello"]))
+
+        self.assertEqual(vectors, [[0.1, 0.2]])
+        self.assertEqual(len(requests_seen), 3)
+        self.assertEqual([call.args[0] for call in sleep.await_args_list], [0, 2.0])
+
+    def test_embed_documents_async_gives_up_after_max_retries(self):
+        embedding = CloudflareEmbedding(
+            api_token="test-token", account_id="test-account", max_retries=2
+        )
+        requests_seen = self._mock_async_client(embedding, lambda request: httpx.Response(503))
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            with self.assertRaises(EmbeddingProviderError):
+                asyncio.run(embedding.embed_documents_async(["hello"]))
+
+        self.assertEqual(len(requests_seen), 3)
+
+
+class CloudflareEmbeddingHttpTestCase(unittest.TestCase):
+    def test_transient_server_errors_are_retried(self):
+        statuses = [503, 503, 200]
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                received.append(self.rfile.read(int(self.headers["Content-Length"])))
+                status = statuses[len(received) - 1]
+                body = json.dumps({"result": {"data": [0.5, 0.25]}}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        # A short poll interval keeps shutdown() from stalling the test for 0.5s.
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        try:
+            with CloudflareEmbedding(
+                endpoint=f"http://127.0.0.1:{server.server_port}/embed",
+                timeout=5,
+                backoff_factor=0.01,
+            ) as embedding:
+                vectors = embedding.embed_documents(["retry me"])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(vectors, [[0.5, 0.25]])
+        self.assertEqual(len(received), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import io
 import os
 import json
@@ -7,7 +8,6 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, Tuple
 
 import pytest
-from PyPDF2 import PdfWriter
 from docx import Document as WordDocument
 
 from ali_agentic_adk_python.core import (
@@ -83,6 +83,20 @@ def test_text_doc_loader_reads_file(tmp_path):
     assert doc.metadata["source"] == str(path)
 
 
+def test_text_doc_loader_accepts_path_objects(tmp_path):
+    path = tmp_path / "pathlike.txt"
+    path.write_text("path object", encoding="utf-8")
+
+    loader = TextDocLoader(file_path=path)
+    documents = loader.load()
+    meta_documents = TextDocLoader().load_with_meta({"file_path": path})
+
+    assert loader.file_path == str(path)
+    assert documents[0].page_content == "path object"
+    assert documents[0].metadata["source"] == str(path)
+    assert meta_documents[0].metadata["source"] == str(path)
+
+
 def test_text_doc_loader_raises_when_path_missing():
     loader = TextDocLoader()
     with pytest.raises(ValueError):
@@ -127,6 +141,31 @@ def test_text_doc_loader_load_and_split_preserves_metadata(tmp_path):
     assert combined == content.replace(" ", "")
 
 
+# 只读测试共用的文本文件，整个测试会话只写一次
+_TEXT_FILE_CONTENTS = {
+    "chinese": "这是一个中文测试文件，包含中文字符。",
+    "emoji": "Hello 👋 World 🌍 ADK 🚀",
+    "mixed": "English 英文 日本語 한국어 Español Français",
+    "empty": "",
+    "whitespace": "   \n\n   \t\t   \n",
+    "single_line": "Single line without newline",
+    "multiline": "Line 1\nLine 2\nLine 3\nLine 4\nLine 5",
+    "long_line": "x" * 10000,
+    "special": "Special chars: !@#$%^&*()_+-=[]{}|;:',.<>?/~`",
+}
+
+
+@pytest.fixture(scope="session")
+def text_files(tmp_path_factory) -> Dict[str, Path]:
+    directory = tmp_path_factory.mktemp("text_docs")
+    paths: Dict[str, Path] = {}
+    for name, content in _TEXT_FILE_CONTENTS.items():
+        path = directory / f"{name}.txt"
+        path.write_text(content, encoding="utf-8")
+        paths[name] = path
+    return paths
+
+
 # ============================================================================
 # TextDocLoader 编码测试
 # ============================================================================
@@ -141,120 +180,87 @@ def test_text_doc_loader_reads_utf8_with_bom(tmp_path):
     documents = loader.load()
     
     assert len(documents) == 1
-    assert "你好世界" in documents[0].page_content
+    assert documents[0].page_content == content
 
 
-def test_text_doc_loader_reads_chinese_characters(tmp_path):
+def test_text_doc_loader_reads_chinese_characters(text_files):
     """测试读取中文字符"""
-    path = tmp_path / "chinese.txt"
-    content = "这是一个中文测试文件，包含中文字符。"
-    path.write_text(content, encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["chinese"]))
     documents = loader.load()
     
-    assert documents[0].page_content == content
+    assert documents[0].page_content == _TEXT_FILE_CONTENTS["chinese"]
     assert "中文" in documents[0].page_content
 
 
-def test_text_doc_loader_reads_emoji(tmp_path):
+def test_text_doc_loader_reads_emoji(text_files):
     """测试读取emoji表情"""
-    path = tmp_path / "emoji.txt"
-    content = "Hello 👋 World 🌍 ADK 🚀"
-    path.write_text(content, encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["emoji"]))
     documents = loader.load()
     
-    assert documents[0].page_content == content
+    assert documents[0].page_content == _TEXT_FILE_CONTENTS["emoji"]
 
 
-def test_text_doc_loader_reads_mixed_languages(tmp_path):
+def test_text_doc_loader_reads_mixed_languages(text_files):
     """测试读取混合语言文本"""
-    path = tmp_path / "mixed.txt"
-    content = "English 英文 日本語 한국어 Español Français"
-    path.write_text(content, encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["mixed"]))
     documents = loader.load()
     
-    assert documents[0].page_content == content
+    assert documents[0].page_content == _TEXT_FILE_CONTENTS["mixed"]
 
 
 # ============================================================================
 # TextDocLoader 空内容和特殊内容测试
 # ============================================================================
 
-def test_text_doc_loader_reads_empty_file(tmp_path):
+def test_text_doc_loader_reads_empty_file(text_files):
     """测试读取空文件"""
-    path = tmp_path / "empty.txt"
-    path.write_text("", encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["empty"]))
     documents = loader.load()
     
     assert len(documents) == 1
     assert documents[0].page_content == ""
 
 
-def test_text_doc_loader_reads_whitespace_only(tmp_path):
+def test_text_doc_loader_reads_whitespace_only(text_files):
     """测试只包含空白字符的文件"""
-    path = tmp_path / "whitespace.txt"
-    path.write_text("   \n\n   \t\t   \n", encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["whitespace"]))
     documents = loader.load()
     
     assert len(documents) == 1
     assert documents[0].page_content.strip() == ""
 
 
-def test_text_doc_loader_reads_single_line(tmp_path):
+def test_text_doc_loader_reads_single_line(text_files):
     """测试单行文本"""
-    path = tmp_path / "single_line.txt"
-    path.write_text("Single line without newline", encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["single_line"]))
     documents = loader.load()
     
     assert documents[0].page_content == "Single line without newline"
 
 
-def test_text_doc_loader_reads_multiline(tmp_path):
+def test_text_doc_loader_reads_multiline(text_files):
     """测试多行文本"""
-    path = tmp_path / "multiline.txt"
-    content = "Line 1\nLine 2\nLine 3\nLine 4\nLine 5"
-    path.write_text(content, encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["multiline"]))
     documents = loader.load()
     
-    assert documents[0].page_content == content
+    assert documents[0].page_content == _TEXT_FILE_CONTENTS["multiline"]
     assert documents[0].page_content.count("\n") == 4
 
 
-def test_text_doc_loader_reads_long_lines(tmp_path):
+def test_text_doc_loader_reads_long_lines(text_files):
     """测试超长行"""
-    path = tmp_path / "long_line.txt"
-    content = "x" * 10000
-    path.write_text(content, encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["long_line"]))
     documents = loader.load()
     
     assert len(documents[0].page_content) == 10000
 
 
-def test_text_doc_loader_reads_special_characters(tmp_path):
+def test_text_doc_loader_reads_special_characters(text_files):
     """测试特殊字符"""
-    path = tmp_path / "special.txt"
-    content = "Special chars: !@#$%^&*()_+-=[]{}|;:',.<>?/~`"
-    path.write_text(content, encoding="utf-8")
-    
-    loader = TextDocLoader(file_path=str(path))
+    loader = TextDocLoader(file_path=str(text_files["special"]))
     documents = loader.load()
     
-    assert documents[0].page_content == content
+    assert documents[0].page_content == _TEXT_FILE_CONTENTS["special"]
 
 
 def test_text_doc_loader_reads_json_content(tmp_path):
@@ -425,6 +431,14 @@ def test_document_copy_independence():
     assert original.page_content == "original"
 
 
+def test_document_repr_is_compact():
+    """测试文档repr不输出完整内容"""
+    doc = Document(page_content="x" * 10000, metadata={"source": "big.txt"})
+    assert repr(doc) == "Document(len=10000, source='big.txt')"
+    assert repr(Document()) == "Document(len=0, source=None)"
+    assert doc == Document(page_content="x" * 10000, metadata={"source": "big.txt"})
+
+
 def test_document_has_metadata_false():
     """测试没有元数据的情况"""
     doc = Document(page_content="content")
@@ -468,9 +482,25 @@ def test_document_with_complex_metadata():
 # RecursiveCharacterTextSplitter 测试
 # ============================================================================
 
-def test_splitter_basic_split():
+# 分割器在构造后不再变化，常用配置按模块共享
+@pytest.fixture(scope="module")
+def splitter_10_2() -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(max_chunk_size=10, max_chunk_overlap=2)
+
+
+@pytest.fixture(scope="module")
+def splitter_20_3() -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(max_chunk_size=20, max_chunk_overlap=3)
+
+
+@pytest.fixture(scope="module")
+def splitter_30_5() -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(max_chunk_size=30, max_chunk_overlap=5)
+
+
+def test_splitter_basic_split(splitter_10_2):
     """测试基本分割功能"""
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=10, max_chunk_overlap=2)
+    splitter = splitter_10_2
     text = "This is a test text for splitting"
     chunks = splitter.split_text(text)
     
@@ -498,9 +528,9 @@ def test_splitter_with_overlap():
     assert len(chunks) >= 2
 
 
-def test_splitter_preserves_words():
+def test_splitter_preserves_words(splitter_20_3):
     """测试分割保持单词完整性"""
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=20, max_chunk_overlap=3)
+    splitter = splitter_20_3
     text = "word1 word2 word3 word4"
     chunks = splitter.split_text(text)
     
@@ -509,18 +539,18 @@ def test_splitter_preserves_words():
         assert all(word in text.split() for word in words)
 
 
-def test_splitter_single_long_word():
+def test_splitter_single_long_word(splitter_10_2):
     """测试单个超长单词"""
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=10, max_chunk_overlap=2)
+    splitter = splitter_10_2
     text = "verylongwordthatexceedschunksize"
     chunks = splitter.split_text(text)
     
     assert len(chunks) >= 1
 
 
-def test_splitter_empty_text():
+def test_splitter_empty_text(splitter_10_2):
     """测试空文本分割"""
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=10, max_chunk_overlap=2)
+    splitter = splitter_10_2
     chunks = splitter.split_text("")
     
     assert len(chunks) <= 1
@@ -536,15 +566,35 @@ def test_splitter_short_text():
     assert chunks[0] == text
 
 
-def test_splitter_multiline_text():
+def test_splitter_multiline_text(splitter_30_5):
     """测试多行文本分割"""
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=30, max_chunk_overlap=5)
+    splitter = splitter_30_5
     text = "Line 1 content here\nLine 2 content here\nLine 3 content here"
     chunks = splitter.split_text(text)
     
     assert len(chunks) >= 1
 
 
+def test_splitter_split_text_with_regex_keeps_separators():
+    """测试保留分隔符的正则切分（含分组正则）"""
+    splitter = RecursiveCharacterTextSplitter(max_chunk_size=10, max_chunk_overlap=0)
+
+    assert splitter.split_text_with_regex("a\nb\n\nc", r"\n", True) == ["a\n", "b\n", "\n", "c"]
+    assert splitter.split_text_with_regex("a1b22c", r"(\d)+", True) == ["a1", "b22", "c"]
+    assert splitter.split_text_with_regex("a\nb", r"\n", False) == ["a", "b"]
+
+
+def test_splitter_split_text_with_literal_matches_regex():
+    """测试字面量分隔符快速路径与正则切分结果一致"""
+    splitter = RecursiveCharacterTextSplitter(max_chunk_size=10, max_chunk_overlap=0)
+    text = "a.b..c."
+
+    for keep in (True, False):
+        assert splitter.split_text_with_literal(text, ".", keep) == splitter.split_text_with_regex(
+            text, r"\.", keep
+        )
+
+
 def test_splitter_with_documents(tmp_path):
     """测试对文档列表进行分割"""
     path = tmp_path / "doc.txt"
@@ -561,14 +611,14 @@ def test_splitter_with_documents(tmp_path):
         assert chunk.metadata["source"] == str(path)
 
 
-def test_splitter_preserves_metadata_across_chunks(tmp_path):
+def test_splitter_preserves_metadata_across_chunks(tmp_path, splitter_30_5):
     """测试分割后元数据保持一致"""
     path = tmp_path / "meta_test.txt"
     content = "alpha " * 50
     path.write_text(content, encoding="utf-8")
 
     loader = TextDocLoader(str(path))
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=30, max_chunk_overlap=5)
+    splitter = splitter_30_5
 
     chunks = loader.load_and_split(splitter)
 
@@ -577,6 +627,115 @@ def test_splitter_preserves_metadata_across_chunks(tmp_path):
     assert str(path) in sources
 
 
+class _WordTokenizer:
+    def __init__(self):
+        self.single_calls = 0
+
+    def get_token_count(self, value: str) -> int:
+        self.single_calls += 1
+        return len(value.split())
+
+
+class _BatchWordTokenizer(_WordTokenizer):
+    def __init__(self):
+        super().__init__()
+        self.batch_calls = 0
+
+    def batch_get_token_count(self, values):
+        self.batch_calls += 1
+        return [len(value.split()) for value in values]
+
+
+def test_splitter_uses_batch_token_count_when_available():
+    """测试 tokenizer 提供批量接口时按批计算长度"""
+    text = " ".join(f"word{index}" for index in range(40))
+    single = _WordTokenizer()
+    batch = _BatchWordTokenizer()
+
+    expected = RecursiveCharacterTextSplitter(
+        max_chunk_size=5, max_chunk_overlap=1, tokenizer=single
+    ).split_text(text)
+    chunks = RecursiveCharacterTextSplitter(
+        max_chunk_size=5, max_chunk_overlap=1, tokenizer=batch
+    ).split_text(text)
+
+    assert chunks == expected
+    assert batch.batch_calls >= 1
+    assert batch.single_calls < single.single_calls
+
+
+def test_splitter_empty_string_measures_zero():
+    """测试空字符串长度始终为0，与自定义长度函数或分词器无关"""
+
+    class _PaddedTokenizer:
+        def get_token_count(self, value):
+            return len(value.split()) + 1
+
+        def batch_get_token_count(self, values):
+            return [len(value.split()) + 1 for value in values]
+
+    padded = RecursiveCharacterTextSplitter(
+        max_chunk_size=10, max_chunk_overlap=2, length_function=lambda value: len(value) + 1
+    )
+    assert padded.get_length("") == 0
+    assert padded.get_length("abc") == 4
+    assert padded.batch_get_length(["", "abc"]) == [0, 4]
+
+    tokenized = RecursiveCharacterTextSplitter(
+        max_chunk_size=10, max_chunk_overlap=2, tokenizer=_PaddedTokenizer()
+    )
+    assert tokenized.get_length("") == 0
+    assert tokenized.batch_get_length(["", "a b"]) == [0, 3]
+
+
+def test_splitter_start_index_matches_chunk_position():
+    """测试 add_start_index 返回的偏移与原文一致"""
+    splitter = RecursiveCharacterTextSplitter(
+        max_chunk_size=12, max_chunk_overlap=4, add_start_index=True
+    )
+    text = "alpha beta\n\nalpha beta gamma\nalpha " * 20
+
+    chunks = splitter.split_documents([Document(page_content=text)])
+
+    assert len(chunks) > 1
+    previous = -1
+    for chunk in chunks:
+        start = chunk.metadata["start_index"]
+        assert start >= previous
+        assert text[start : start + chunk.metadata["char_length"]] == chunk.page_content
+        previous = start
+
+
+def test_splitter_parallel_split_documents_matches_sequential():
+    """测试并行切分与顺序切分结果一致"""
+    splitter = RecursiveCharacterTextSplitter(
+        max_chunk_size=20, max_chunk_overlap=5, add_start_index=True
+    )
+    documents = [
+        Document(page_content=f"doc {index} " + "lorem ipsum dolor sit amet " * 10, metadata={"id": index})
+        for index in range(12)
+    ]
+
+    sequential = splitter.split_documents(documents)
+    parallel = splitter.split_documents(documents, parallel=True, max_workers=2)
+
+    assert [(doc.page_content, doc.metadata) for doc in parallel] == [
+        (doc.page_content, doc.metadata) for doc in sequential
+    ]
+
+
+def test_splitter_parallel_falls_back_for_unpicklable_length_function():
+    """测试长度函数无法序列化时回退为顺序切分"""
+    splitter = RecursiveCharacterTextSplitter(
+        max_chunk_size=20, max_chunk_overlap=5, length_function=lambda value: len(value)
+    )
+    documents = [Document(page_content="lorem ipsum dolor sit amet " * 5) for _ in range(10)]
+
+    assert splitter._split_texts_in_processes([doc.page_content for doc in documents], 2) is None
+    chunks = splitter.split_documents(documents, parallel=True)
+    assert len(chunks) == len(splitter.split_documents(documents))
+
+
 # ============================================================================
 # MarkdownDocLoader 基础测试
 # ============================================================================
@@ -795,16 +954,37 @@ def test_feishu_doc_loader_requires_target():
 # PDFDocLoader 基础测试
 # ============================================================================
 
-def _create_pdf(tmp_path, name: str, pages: int = 2) -> str:
-    pdf_path = tmp_path / name
+@functools.lru_cache(maxsize=None)
+def _pdf_bytes(pages: int) -> bytes:
+    """按页数缓存序列化后的空白PDF，文件名只影响写入路径"""
+    from PyPDF2 import PdfWriter
+
     writer = PdfWriter()
-    for _ in range(pages):
+    if pages:
         writer.add_blank_page(width=200, height=200)
-    with pdf_path.open("wb") as fh:
-        writer.write(fh)
+        # 其余页面复用同一个空白页对象，避免每页重新构建页面字典
+        template = writer.pages[0]
+        for _ in range(pages - 1):
+            writer.add_page(template)
+    # 先序列化到内存再一次性写盘，避免大量小块写入
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _create_pdf(tmp_path, name: str, pages: int = 2) -> str:
+    pdf_path = tmp_path / name
+    pdf_path.write_bytes(_pdf_bytes(pages))
     return str(pdf_path)
 
 
+@pytest.fixture(scope="session")
+def pdf_files(tmp_path_factory) -> Dict[int, str]:
+    """只读测试共用的PDF文件，按页数索引，整个测试会话只写一次"""
+    directory = tmp_path_factory.mktemp("pdf_docs")
+    return {pages: _create_pdf(directory, f"{pages}_pages.pdf", pages=pages) for pages in (1, 5, 10)}
+
+
 def test_pdf_doc_loader_reads_pages(tmp_path):
     pdf_path = _create_pdf(tmp_path, "sample.pdf", pages=3)
 
@@ -818,13 +998,13 @@ def test_pdf_doc_loader_reads_pages(tmp_path):
 
 def test_pdf_doc_loader_fetches_from_stream(tmp_path):
     pdf_path = _create_pdf(tmp_path, "stream.pdf")
-    with open(pdf_path, "rb") as fh:
-        payload = fh.read()
 
     loader = PDFDocLoader()
-    documents = loader.fetch_content({"bytes": payload, "metadata": {"category": "pdf"}})
+    with open(pdf_path, "rb") as fh:
+        documents = loader.fetch_content({"stream": fh, "metadata": {"category": "pdf"}})
+    documents += loader.fetch_content({"bytes": _pdf_bytes(2), "metadata": {"category": "pdf"}})
 
-    assert len(documents) == 2
+    assert len(documents) == 4
     for doc in documents:
         assert doc.metadata["source"] == "stream"
         assert doc.metadata["category"] == "pdf"
@@ -836,9 +1016,9 @@ def test_pdf_doc_loader_requires_source():
         loader.load()
 
 
-def test_pdf_doc_loader_single_page(tmp_path):
+def test_pdf_doc_loader_single_page(pdf_files):
     """测试单页PDF"""
-    pdf_path = _create_pdf(tmp_path, "single.pdf", pages=1)
+    pdf_path = pdf_files[1]
     
     loader = PDFDocLoader(pdf_path)
     documents = loader.load()
@@ -847,9 +1027,9 @@ def test_pdf_doc_loader_single_page(tmp_path):
     assert documents[0].metadata["page_number"] == 1
 
 
-def test_pdf_doc_loader_many_pages(tmp_path):
+def test_pdf_doc_loader_many_pages(pdf_files):
     """测试多页PDF"""
-    pdf_path = _create_pdf(tmp_path, "many.pdf", pages=10)
+    pdf_path = pdf_files[10]
     
     loader = PDFDocLoader(pdf_path)
     documents = loader.load()
@@ -859,9 +1039,9 @@ def test_pdf_doc_loader_many_pages(tmp_path):
     assert page_numbers == list(range(1, 11))
 
 
-def test_pdf_doc_loader_metadata_consistency(tmp_path):
+def test_pdf_doc_loader_metadata_consistency(pdf_files):
     """测试PDF元数据一致性"""
-    pdf_path = _create_pdf(tmp_path, "meta.pdf", pages=5)
+    pdf_path = pdf_files[5]
     
     loader = PDFDocLoader(pdf_path)
     documents = loader.load()
@@ -882,8 +1062,6 @@ def test_pdf_doc_loader_nonexistent_file():
 def test_pdf_doc_loader_with_custom_metadata(tmp_path):
     """测试PDF自定义元数据"""
     pdf_path = _create_pdf(tmp_path, "custom.pdf", pages=2)
-    with open(pdf_path, "rb") as fh:
-        payload = fh.read()
     
     loader = PDFDocLoader()
     custom_meta = {
@@ -891,10 +1069,11 @@ def test_pdf_doc_loader_with_custom_metadata(tmp_path):
         "title": "Test Document",
         "category": "technical"
     }
-    documents = loader.fetch_content({"bytes": payload, "metadata": custom_meta})
+    documents = loader.fetch_content({"file_path": pdf_path, "metadata": custom_meta})
     
     assert len(documents) == 2
     for doc in documents:
+        assert doc.metadata["source"] == pdf_path
         assert doc.metadata["author"] == "Test Author"
         assert doc.metadata["title"] == "Test Document"
         assert doc.metadata["category"] == "technical"
@@ -956,14 +1135,14 @@ def test_integration_mixed_content_types(tmp_path):
     assert all(doc.metadata["source"] == str(pdf_path) for doc in pdf_docs)
 
 
-def test_integration_pipeline_with_filtering(tmp_path):
+def test_integration_pipeline_with_filtering(tmp_path, splitter_20_3):
     """测试带过滤的处理管道"""
     path = tmp_path / "pipeline.txt"
     content = "alpha\nbeta\ngamma\ndelta\nepsilon\nzeta\neta\ntheta"
     path.write_text(content, encoding="utf-8")
     
     loader = TextDocLoader(str(path))
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=20, max_chunk_overlap=3)
+    splitter = splitter_20_3
     chunks = loader.load_and_split(splitter)
     
     # 过滤包含特定内容的块
@@ -974,14 +1153,14 @@ def test_integration_pipeline_with_filtering(tmp_path):
         assert "alpha" in chunk.page_content or "beta" in chunk.page_content
 
 
-def test_integration_document_reconstruction(tmp_path):
+def test_integration_document_reconstruction(tmp_path, splitter_30_5):
     """测试文档重建"""
     path = tmp_path / "reconstruct.txt"
     original_content = "word " * 50
     path.write_text(original_content, encoding="utf-8")
     
     loader = TextDocLoader(str(path))
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=30, max_chunk_overlap=5)
+    splitter = splitter_30_5
     chunks = loader.load_and_split(splitter)
     
     # 验证所有块都来自同一个源
@@ -1062,14 +1241,14 @@ def test_performance_large_text_file(tmp_path):
     assert len(documents[0].page_content) == 500000
 
 
-def test_performance_many_small_chunks(tmp_path):
+def test_performance_many_small_chunks(tmp_path, splitter_10_2):
     """测试大量小块分割"""
     path = tmp_path / "many_chunks.txt"
     content = "w " * 10000
     path.write_text(content, encoding="utf-8")
     
     loader = TextDocLoader(str(path))
-    splitter = RecursiveCharacterTextSplitter(max_chunk_size=10, max_chunk_overlap=2)
+    splitter = splitter_10_2
     chunks = loader.load_and_split(splitter)
     
     assert len(chunks) > 100
@@ -1136,6 +1315,7 @@ def test_special_mixed_line_endings(tmp_path):
     documents = loader.load()
     
     assert len(documents) == 1
+    assert documents[0].page_content == path.read_text(encoding="utf-8")
 
 
 def test_special_tabs_and_spaces(tmp_path):
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from unittest.mock import MagicMock
 
@@ -8,9 +9,16 @@ from ali_agentic_adk_python.extension.mcp import (
     McpConnectionNotFoundError,
     McpRefreshError,
     McpSessionManager,
+    McpStdioServerConfig,
     McpToolNotFoundError,
 )
-from ali_agentic_adk_python.extension.mcp.tool import McpTool, McpToolDescriptor
+from ali_agentic_adk_python.extension.mcp.connection import McpConnection
+from ali_agentic_adk_python.extension.mcp.tool import (
+    McpTool,
+    McpToolDescriptor,
+    _dump_pydantic_model,
+    _serialize_call_tool_result,
+)
 
 
 @pytest.fixture
@@ -60,6 +68,7 @@ class _AsyncStubConnection:
         call_result: mcp_types.CallToolResult | None = None,
         refresh_side_effect: Exception | None = None,
         refresh_plan: list[dict[str, mcp_types.Tool]] | None = None,
+        connect_side_effect: Exception | None = None,
     ) -> None:
         self._namespace = namespace
         self._tools = dict(tools)
@@ -72,6 +81,7 @@ class _AsyncStubConnection:
             isError=False,
         )
         self._refresh_side_effect = refresh_side_effect
+        self._connect_side_effect = connect_side_effect
         self._refresh_plan = [dict(plan) for plan in refresh_plan] if refresh_plan else []
         self.connect_calls = 0
         self.close_calls = 0
@@ -85,6 +95,10 @@ class _AsyncStubConnection:
 
     @property
     def tools(self) -> dict[str, mcp_types.Tool]:
+        return self._tools
+
+    @property
+    def tools_copy(self) -> dict[str, mcp_types.Tool]:
         return dict(self._tools)
 
     @property
@@ -92,9 +106,18 @@ class _AsyncStubConnection:
         return self._transport
 
     async def connect(self) -> None:
-        self.connect_calls += 1
+        await self.open()
+        await self.initialize()
+
+    async def open(self) -> None:
+        if not self._connected:
+            self.connect_calls += 1
         self._connected = True
 
+    async def initialize(self) -> None:
+        if self._connect_side_effect is not None:
+            raise self._connect_side_effect
+
     async def close(self) -> None:
         self.close_calls += 1
         self._connected = False
@@ -105,7 +128,7 @@ class _AsyncStubConnection:
             raise self._refresh_side_effect
         if self._refresh_plan:
             self._tools = dict(self._refresh_plan.pop(0))
-        return self.tools
+        return self.tools_copy
 
     async def call_tool(self, tool_name: str, args: dict[str, object]) -> mcp_types.CallToolResult:
         self.called_with = (tool_name, args)
@@ -147,6 +170,73 @@ async def test_mcp_tool_run_async_returns_serialized_payload():
     assert connection.called_with == ("ping", {"echo": True})
 
 
+def test_mcp_tool_declaration_is_built_once():
+    descriptor = McpToolDescriptor(
+        exposed_name="demo.ping",
+        original_name="ping",
+        connection=_StubConnection(namespace="demo"),
+        tool=mcp_types.Tool(
+            name="ping",
+            description="Ping the server",
+            inputSchema={"type": "object", "properties": {}},
+        ),
+    )
+
+    tool = McpTool(descriptor)
+    declaration = tool._get_declaration()
+
+    assert declaration.name == "demo.ping"
+    assert declaration.description == "Ping the server"
+    assert tool._get_declaration() is declaration
+
+
+def test_serialize_call_tool_result_can_skip_content():
+    call_result = mcp_types.CallToolResult(
+        content=[
+            mcp_types.ImageContent(type="image", data="aGk=", mimeType="image/png"),
+            mcp_types.TextContent(type="text", text="first"),
+            mcp_types.TextContent(type="text", text="second"),
+        ],
+        structuredContent=None,
+        isError=False,
+    )
+    descriptor = McpToolDescriptor(
+        exposed_name="demo.ping",
+        original_name="ping",
+        connection=_StubConnection(namespace="demo"),
+        tool=mcp_types.Tool(name="ping", inputSchema={"type": "object", "properties": {}}),
+    )
+
+    full = _serialize_call_tool_result(call_result, descriptor)
+    compact = _serialize_call_tool_result(call_result, descriptor, include_content=False)
+
+    assert [block["type"] for block in full["content"]] == ["image", "text", "text"]
+    assert full["text"] == "first"
+    assert "content" not in compact
+    assert compact["text"] == "first"
+
+
+def test_mcp_connection_tools_is_shared_and_tools_copy_is_isolated():
+    connection = McpConnection(McpStdioServerConfig(command="python"))
+    tool = mcp_types.Tool(name="ping", inputSchema={"type": "object", "properties": {}})
+    connection._tools = {"ping": tool}
+
+    assert connection.tools is connection._tools
+    copied = connection.tools_copy
+    copied.pop("ping")
+    assert connection.tools == {"ping": tool}
+
+
+def test_dump_pydantic_model_dispatches_by_block_type():
+    block = mcp_types.TextContent(type="text", text="hi")
+
+    assert _dump_pydantic_model(block) == {"type": "text", "text": "hi"}
+    assert _dump_pydantic_model(mcp_types.TextContent(type="text", text="again"))["text"] == "again"
+    assert _dump_pydantic_model({"type": "raw"}) == {"type": "raw"}
+    with pytest.raises(TypeError):
+        _dump_pydantic_model("not a block")
+
+
 def test_mcp_session_manager_deduplicates_tool_names():
     manager = McpSessionManager([])
     tool = mcp_types.Tool(name="echo", inputSchema={"type": "object", "properties": {}})
@@ -163,6 +253,19 @@ def test_mcp_session_manager_deduplicates_tool_names():
     assert "echo#1" in registry
 
 
+def test_mcp_session_manager_deduplicates_many_colliding_names():
+    manager = McpSessionManager([])
+    tool = mcp_types.Tool(name="echo", inputSchema={"type": "object", "properties": {}})
+
+    manager._connections = [
+        _FakeConnection(None, {"echo": tool}, f"server-{index}") for index in range(4)
+    ]
+
+    manager._rebuild_registry()
+
+    assert manager.tool_names == ["echo", "echo#1", "echo#2", "echo#3"]
+
+
 def test_mcp_session_manager_applies_namespace_prefix():
     manager = McpSessionManager([])
     tool = mcp_types.Tool(name="search", inputSchema={"type": "object", "properties": {}})
@@ -192,6 +295,47 @@ async def test_mcp_session_manager_async_context_lifecycle():
     assert manager.tool_names == []
 
 
+def test_mcp_session_manager_auto_connect_defers_without_running_loop(recwarn):
+    manager = McpSessionManager([], auto_connect=True)
+
+    assert manager._autoconnect_task is None
+    assert not [w for w in recwarn if issubclass(w.category, DeprecationWarning)]
+
+
+def test_mcp_session_manager_ensure_started_runs_pending_auto_connect():
+    tool = mcp_types.Tool(name="ping", inputSchema={"type": "object", "properties": {}})
+    connection = _AsyncStubConnection(namespace=None, tools={"ping": tool})
+    manager = McpSessionManager([], auto_connect=True)
+    manager._connections = [connection]
+
+    asyncio.run(manager.ensure_started())
+
+    assert connection.connect_calls == 1
+    assert manager.tool_names == ["ping"]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_mcp_session_manager_start_closes_all_connections_on_failure():
+    tool = mcp_types.Tool(name="ping", inputSchema={"type": "object", "properties": {}})
+    healthy = _AsyncStubConnection(namespace="alpha", tools={"ping": tool})
+    failing = _AsyncStubConnection(
+        namespace="beta",
+        tools={"ping": tool},
+        connect_side_effect=RuntimeError("handshake failed"),
+    )
+    manager = McpSessionManager([])
+    manager._connections = [healthy, failing]
+
+    with pytest.raises(RuntimeError):
+        await manager.start()
+
+    assert healthy.connect_calls == 1
+    assert failing.connect_calls == 1
+    assert healthy.close_calls == 1
+    assert failing.close_calls == 1
+    assert manager.tool_names == []
+
+
 @pytest.mark.anyio("asyncio")
 async def test_mcp_session_manager_invoke_tool_runs_remote_tool():
     tool = mcp_types.Tool(name="ping", inputSchema={"type": "object", "properties": {}})
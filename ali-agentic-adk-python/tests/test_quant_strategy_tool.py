@@ -0,0 +1,70 @@
+import asyncio
+import importlib
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("yfinance")
+pytest.importorskip("google.adk")
+
+# 模块导入时会写入代理环境变量，这里导入完成后恢复，避免影响其他测试
+with patch.dict(os.environ):
+    quant_module = importlib.import_module(
+        "ali_agentic_adk_python.core.quant_agent.QuantStrategyTool"
+    )
+
+
+def _frame(close):
+    return pd.DataFrame({"Close": close})
+
+
+def _install_fake_ticker(monkeypatch, frames):
+    calls = []
+
+    def fake_ticker(symbol):
+        def history(period, interval):
+            calls.append((symbol, period, interval))
+            return frames.pop(0)
+
+        return SimpleNamespace(history=history)
+
+    monkeypatch.setattr(quant_module.yf, "Ticker", fake_ticker)
+    return calls
+
+
+def test_expired_history_is_fetched_again(monkeypatch):
+    calls = _install_fake_ticker(monkeypatch, [_frame([1.0, 2.0]), _frame([3.0, 4.0])])
+    now = [1000.0]
+    monkeypatch.setattr(quant_module.time, "monotonic", lambda: now[0])
+    tool = quant_module.QuantStrategyTool(history_ttl=60.0)
+
+    first = asyncio.run(tool._history("BABA"))
+    cached = asyncio.run(tool._history("BABA"))
+    now[0] += 61.0
+    refreshed = asyncio.run(tool._history("BABA"))
+
+    assert cached is first
+    assert list(refreshed["Close"]) == [3.0, 4.0]
+    assert len(calls) == 2
+
+
+def test_empty_history_is_not_cached(monkeypatch):
+    calls = _install_fake_ticker(monkeypatch, [_frame([]), _frame([5.0])])
+    tool = quant_module.QuantStrategyTool()
+
+    assert asyncio.run(tool._history("BABA")).empty
+    assert list(asyncio.run(tool._history("BABA"))["Close"]) == [5.0]
+    assert len(calls) == 2
+
+
+def test_history_cache_is_bounded(monkeypatch):
+    _install_fake_ticker(monkeypatch, [_frame([float(i)]) for i in range(3)])
+    tool = quant_module.QuantStrategyTool(max_cached_frames=2)
+
+    for symbol in ("A", "B", "C"):
+        asyncio.run(tool._history(symbol))
+
+    assert [key[0] for key in tool._hist_cache] == ["B", "C"]